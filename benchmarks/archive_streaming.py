@@ -0,0 +1,106 @@
+"""Peak memory of building a submission archive and a check that the streamed archive is valid.
+
+Builds the archive of uploaded files the old way, in a BytesIO, and with ZipArchiveStream read in
+MINIO_PART_SIZE pieces like a multipart upload does. Uploaded files are spooled to disk as they
+are by Starlette, so only memory used by archiving is measured.
+
+    python -m benchmarks.archive_streaming --size 30
+"""
+
+import argparse
+import asyncio
+import hashlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from collections.abc import Awaitable, Callable
+
+from fastapi import UploadFile
+
+from src.infrastructure.minio.streaming import ZipArchiveStream
+from src.settings import app_settings
+
+FILENAMES = ("autotests.log", "linters.log", "code.txt")
+MIB = 1024 * 1024
+
+
+def make_upload_files(size: int) -> list[UploadFile]:
+    files = []
+    for filename in FILENAMES:
+        file = tempfile.SpooledTemporaryFile(max_size=MIB)  # noqa: SIM115
+        for _ in range(size // MIB):
+            file.write(os.urandom(MIB))
+        file.write(os.urandom(size % MIB))
+        file.seek(0)
+        files.append(UploadFile(file, filename=filename))
+    return files
+
+
+async def build_in_memory(files: list[UploadFile]) -> str:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        for file in files:
+            zip_file.writestr(file.filename, await file.read())
+    return hashlib.sha256(buffer.getvalue()).hexdigest()
+
+
+async def build_streamed(files: list[UploadFile]) -> str:
+    stream = ZipArchiveStream(files, app_settings.UPLOAD_CHUNK_SIZE)
+    digest = hashlib.sha256()
+    while part := await stream.read(app_settings.MINIO_PART_SIZE):
+        digest.update(part)
+    return digest.hexdigest()
+
+
+async def measure(build: Callable[[list[UploadFile]], Awaitable[str]], size: int) -> tuple[str, float, int]:
+    files = make_upload_files(size)
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    archive_hash = await build(files)
+    elapsed = time.perf_counter() - started_at
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return archive_hash, elapsed, peak
+
+
+async def verify_streamed_archive(size: int) -> None:
+    files = make_upload_files(size)
+    file_hashes = {}
+    for file in files:
+        file_hashes[file.filename] = hashlib.sha256(await file.read()).hexdigest()
+        await file.seek(0)
+    with tempfile.TemporaryFile() as archive:
+        stream = ZipArchiveStream(files, app_settings.UPLOAD_CHUNK_SIZE)
+        while part := await stream.read(app_settings.MINIO_PART_SIZE):
+            archive.write(part)
+        if stream.size != archive.tell():
+            raise RuntimeError("Stream size does not match archive size")
+        with zipfile.ZipFile(archive) as zip_file:
+            if (bad_member := zip_file.testzip()) is not None:
+                error_message = f"Member {bad_member} is corrupted"
+                raise RuntimeError(error_message)
+            for filename, file_hash in file_hashes.items():
+                if hashlib.sha256(zip_file.read(filename)).hexdigest() != file_hash:
+                    error_message = f"Member {filename} does not match the uploaded file"
+                    raise RuntimeError(error_message)
+
+
+async def main(size_mib: int) -> None:
+    size = size_mib * MIB
+    print(f"3 files of {size_mib} MiB, part size {app_settings.MINIO_PART_SIZE // MIB} MiB")
+    print(f"{'mode':<10} {'peak memory, MiB':>17} {'time, s':>9}")
+    for name, build in (("in-memory", build_in_memory), ("streamed", build_streamed)):
+        _, elapsed, peak = await measure(build, size)
+        print(f"{name:<10} {peak / MIB:>17.1f} {elapsed:>9.2f}")
+    await verify_streamed_archive(size)
+    print("streamed archive passed the integrity check, members match uploaded files")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=30, help="size of each uploaded file, MiB")
+    args = parser.parse_args()
+    asyncio.run(main(args.size))
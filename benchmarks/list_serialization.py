@@ -0,0 +1,92 @@
+"""Time of rendering a students page by each way list endpoints have had, and a check that the bodies match.
+
+Compares pydantic response models built from DTOs, as before DTOSerializer, DTOSerializer over DTOs,
+as list endpoints do now, and DTOSerializer right over Core rows, without the DTO step. Rows are
+emulated by named tuples, so only the work after the query is measured.
+
+    python -m benchmarks.list_serialization --rows 500
+"""
+
+import argparse
+import time
+from collections import namedtuple
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import TypeVar
+from uuid import uuid4
+
+from src.api.serialization import DTOSerializer, to_timestamp
+from src.api.students.schemas import StudentResponse, student_serializer
+from src.api.utils import jsonify, jsonify_dumped
+from src.infrastructure.sqlalchemy.models import Student
+from src.infrastructure.sqlalchemy.services import SqlAlchemyStudentService
+
+T = TypeVar("T")
+
+StudentRow = namedtuple("StudentRow", [column.name for column in Student.__table__.columns])  # noqa: PYI024
+
+# Rows labelled like DTO attributes, as a query without the DTO step would select them
+LabelledStudentRow = namedtuple(  # noqa: PYI024
+    "LabelledStudentRow", ["student_id", "telegram_user_id", "telegram_username", "github_username", "registered_at"]
+)
+row_serializer = DTOSerializer(StudentResponse, {"student_id": str, "registered_at": to_timestamp})
+
+
+def make_rows(count: int) -> list[StudentRow]:
+    registered_at = datetime.now()
+    return [
+        StudentRow(
+            student_id=uuid4(),
+            tg_user_id=100_000 + number,
+            tg_username=f"student_{number}",
+            gh_username=f"student-{number}" if number % 3 else None,
+            registered_at=registered_at - timedelta(minutes=number),
+        )
+        for number in range(count)
+    ]
+
+
+def render_models(rows: list[StudentRow]) -> bytes:
+    students = [SqlAlchemyStudentService.from_model_to_dto(row) for row in rows]
+    return jsonify([StudentResponse.from_dto(student) for student in students]).body
+
+
+def render_dtos(rows: list[StudentRow]) -> bytes:
+    students = [SqlAlchemyStudentService.from_model_to_dto(row) for row in rows]
+    return jsonify_dumped(student_serializer.dump_many(students)).body
+
+
+def render_rows(rows: list[LabelledStudentRow]) -> bytes:
+    return jsonify_dumped(row_serializer.dump_many(rows)).body
+
+
+def measure(render: Callable[[list[T]], bytes], rows: list[T], repeat: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        render(rows)
+    return (time.perf_counter() - started_at) / repeat
+
+
+def main(rows_count: int, repeat: int) -> None:
+    rows = make_rows(rows_count)
+    labelled_rows = [LabelledStudentRow(*row) for row in rows]
+    if len({render_models(rows), render_dtos(rows), render_rows(labelled_rows)}) != 1:
+        raise RuntimeError("Rendered pages differ")
+
+    print(f"page of {rows_count} students, {repeat} renders")
+    print(f"{'mode':<12} {'ms/page':>9} {'us/row':>8}")
+    for name, elapsed in (
+        ("models", measure(render_models, rows, repeat)),
+        ("dtos", measure(render_dtos, rows, repeat)),
+        ("rows", measure(render_rows, labelled_rows, repeat)),
+    ):
+        print(f"{name:<12} {elapsed * 1000:>9.2f} {elapsed / rows_count * 1_000_000:>8.2f}")
+    print("all modes render the same body")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
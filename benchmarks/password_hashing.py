@@ -0,0 +1,83 @@
+"""Event loop responsiveness while logins verify passwords.
+
+Runs the same burst of concurrent PBKDF2 verifications inline on the event loop, as before
+HashingExecutor, and through the executor with threads and processes. A ticker task measures how
+late the event loop wakes it up, which is the delay every other request sees during the burst.
+
+    python -m benchmarks.password_hashing --logins 32
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from src.services.password import HashingExecutor, PasswordService
+
+TICK_INTERVAL = 0.005  # seconds
+
+
+async def measure_loop_delays(stop: asyncio.Event) -> list[float]:
+    delays = []
+    while not stop.is_set():
+        started_at = time.perf_counter()
+        await asyncio.sleep(TICK_INTERVAL)
+        delays.append(time.perf_counter() - started_at - TICK_INTERVAL)
+    return delays
+
+
+async def run_burst(verify: Callable[[], Awaitable[bool]], logins: int) -> tuple[float, list[float]]:
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(measure_loop_delays(stop))
+    await asyncio.sleep(TICK_INTERVAL)
+    started_at = time.perf_counter()
+    results = await asyncio.gather(*(verify() for _ in range(logins)))
+    elapsed = time.perf_counter() - started_at
+    stop.set()
+    delays = await ticker
+    if not all(results):
+        raise RuntimeError("Password was not verified")
+    return elapsed, delays
+
+
+def report(name: str, logins: int, elapsed: float, delays: list[float]) -> None:
+    delays_ms = sorted(delay * 1000 for delay in delays) or [0.0]
+    p99 = delays_ms[min(len(delays_ms) - 1, int(len(delays_ms) * 0.99))]
+    print(
+        f"{name:<10} {logins / elapsed:>10.1f} {statistics.median(delays_ms):>14.1f} {p99:>11.1f} "
+        f"{delays_ms[-1]:>11.1f}"
+    )
+
+
+async def main(logins: int, workers: int, concurrency: int) -> None:
+    hashed_password, salt = PasswordService.create_hashed_password_and_salt("password")
+
+    async def verify_inline() -> bool:
+        return PasswordService.verify_password("password", hashed_password, salt)
+
+    print(f"{logins} concurrent logins, {workers} workers, concurrency {concurrency}")
+    print(f"{'mode':<10} {'logins/s':>10} {'loop p50, ms':>14} {'p99, ms':>11} {'max, ms':>11}")
+    report("inline", logins, *await run_burst(verify_inline, logins))
+
+    for name, use_processes in (("threads", False), ("processes", True)):
+        executor = HashingExecutor(workers, concurrency, use_processes=use_processes)
+        executor.start()
+        PasswordService.configure(executor)
+        # Warm up workers, process pool starts them lazily
+        await PasswordService.async_verify_password("password", hashed_password, salt)
+        report(
+            name,
+            logins,
+            *await run_burst(lambda: PasswordService.async_verify_password("password", hashed_password, salt), logins),
+        )
+        executor.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.workers, args.concurrency))
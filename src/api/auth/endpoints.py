@@ -3,7 +3,7 @@ from typing import Annotated
 from fastapi import APIRouter, Body, Depends, status
 from starlette.responses import JSONResponse
 
-from src.api.auth.dependencies import get_auth_service, get_user
+from src.api.auth.dependencies import get_auth_service, get_auth_token, get_user
 from src.api.auth.schemas import LoginRequest, RegisterRequest, TokenResponse, UserResponse
 from src.api.general_schemas import SuccessResponse
 from src.api.utils import jsonify
@@ -56,3 +56,18 @@ async def register(
         login=register_request.login, password=register_request.password, role=register_request.role
     )
     return jsonify(SuccessResponse(message="Аккаунт успешно создан"), status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/logout",
+    response_model=SuccessResponse,
+    status_code=status.HTTP_200_OK,
+    description="User logout",
+    summary="User Logout",
+)
+async def logout(
+    auth_token: Annotated[str, Depends(get_auth_token)],
+    auth_service: Annotated[AuthService, Depends(get_auth_service)],
+) -> JSONResponse:
+    await auth_service.logout(auth_token)
+    return jsonify(SuccessResponse(message="Сессия завершена"))
@@ -2,19 +2,24 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, status, Body, Path, Request
 from starlette.responses import JSONResponse
-from faststream.kafka import KafkaBroker
 
 from src.api.complaints.events import COMPLAINT_ANSWER_TOPIC, ComplaintAnswerEventSchema
 from src.services.auth import UserDTO
 from src.services.complaints import ComplaintService
+from src.services.outbox import OutboxService
 from src.services.stundents import StudentService
 from src.api.auth.dependencies import get_user
-from src.api.complaints.dependencies import get_complaint_service
+from src.api.complaints.dependencies import get_complaint_service, get_read_complaint_service
+from src.api.outbox.dependencies import get_outbox_service
 from src.api.students.dependencies import get_student_service
-from src.api.complaints.schemas import ComplaintResponse, CreateComplaintRequest, CreateAnswerRequest
-from src.api.utils import jsonify
+from src.api.complaints.schemas import (
+    ComplaintResponse,
+    CreateComplaintRequest,
+    CreateAnswerRequest,
+    complaint_serializer,
+)
+from src.api.utils import jsonify, jsonify_dumped
 from src.api.general_schemas import SuccessResponse
-from src.infrastructure.faststream.dependencies import get_broker
 
 
 router = APIRouter(prefix="/complaints", tags=["complaints"])
@@ -29,10 +34,10 @@ router = APIRouter(prefix="/complaints", tags=["complaints"])
 )
 async def get_complaints(
     _: Annotated[UserDTO, Depends(get_user)],
-    complaint_service: Annotated[ComplaintService, Depends(get_complaint_service)],
+    complaint_service: Annotated[ComplaintService, Depends(get_read_complaint_service)],
 ) -> JSONResponse:
     complaints = await complaint_service.get_complaints()
-    return jsonify([ComplaintResponse.from_dto(complaint) for complaint in complaints])
+    return jsonify_dumped(complaint_serializer.dump_many(complaints))
 
 
 @router.post(
@@ -61,21 +66,20 @@ async def create_student_complaint(
 )
 async def answer_complaint(
     _: Annotated[UserDTO, Depends(get_user)],
-    broker: Annotated[KafkaBroker, Depends(get_broker)],
+    outbox_service: Annotated[OutboxService, Depends(get_outbox_service)],
     complaint_service: Annotated[ComplaintService, Depends(get_complaint_service)],
-    student_service: Annotated[StudentService, Depends(get_student_service)],
     complaint_id: str = Path(),
     data: CreateAnswerRequest = Body(),
 ) -> JSONResponse:
-    await complaint_service.answer_complaint(complaint_id, data.teacher_response)
-    complaint_dto = await complaint_service.get_complaint_by_id(complaint_id)
-    student_dto = await student_service.get_by_id(complaint_dto.student_id)
-    await broker.publish(
+    answer = await complaint_service.answer_complaint(complaint_id, data.teacher_response, commit=False)
+    await outbox_service.add_event(
+        COMPLAINT_ANSWER_TOPIC,
         ComplaintAnswerEventSchema(
-            student_telegram_user_id=student_dto.telegram_user_id,
+            student_telegram_user_id=answer.student_telegram_user_id,
             answer=data.teacher_response,
-        ), topic=COMPLAINT_ANSWER_TOPIC
+        ).model_dump(mode="json"),
     )
+    await outbox_service.commit()
     return jsonify(SuccessResponse(message="Ответ на жалобу успешно зарегистрирован и отправлен"))
 
 
@@ -3,6 +3,7 @@ import uuid
 from pydantic import Field
 
 from src.api.base_schema import BaseSchema
+from src.api.serialization import DTOSerializer, to_timestamp
 from src.services.complaints import ComplaintDTO
 
 
@@ -34,3 +35,6 @@ class ComplaintResponse(BaseSchema):
             teacher_response=complaint.teacher_response,
             created_at=int(complaint.created_at.timestamp()),
         )
+
+
+complaint_serializer = DTOSerializer(ComplaintResponse, {"created_at": to_timestamp})
@@ -0,0 +1,37 @@
+import hashlib
+from dataclasses import dataclass
+
+from fastapi import Request, status
+from starlette.responses import Response
+
+from src.api.base_schema import BaseSchema
+from src.api.utils import jsonify
+
+
+@dataclass
+class RenderedResponse:
+    body: bytes
+    etag: str
+
+
+def render_response(response: BaseSchema | list[BaseSchema]) -> RenderedResponse:
+    """Render JSON body once, so that it can be cached together with its strong ETag."""
+    body = jsonify(response).body
+    return RenderedResponse(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+    # If-None-Match uses weak comparison, so W/ prefixes added by proxies are ignored
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def etag_response(request: Request, rendered: RenderedResponse) -> Response:
+    # no-cache lets clients keep the body, but makes them revalidate it with If-None-Match on every request
+    headers = {"ETag": rendered.etag, "Cache-Control": "no-cache"}
+    if is_not_modified(request, rendered.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=rendered.body, media_type="application/json", headers=headers)
@@ -5,3 +5,4 @@ from dataclasses import dataclass
 class APIError(Exception):
     message: str
     status: int
+    headers: dict[str, str] | None = None
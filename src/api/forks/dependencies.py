@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.sqlalchemy.engine import get_async_session
+from src.infrastructure.sqlalchemy.services import SqlAlchemyForkService
+from src.services.forks import ForkService
+
+
+def get_fork_service(
+    db_session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> ForkService:
+    return SqlAlchemyForkService(db_session)
@@ -0,0 +1,46 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Path, status
+from starlette.responses import JSONResponse
+
+from src.api.auth.dependencies import get_user
+from src.api.forks.dependencies import get_fork_service
+from src.api.forks.schemas import ForkResponse
+from src.api.general_schemas import SuccessResponse
+from src.api.utils import jsonify
+from src.services.auth import UserDTO
+from src.services.forks import ForkService
+
+router = APIRouter(prefix="/forks", tags=["forks"])
+
+
+@router.get(
+    "",
+    response_model=list[ForkResponse],
+    status_code=status.HTTP_200_OK,
+    description="Get registered student forks",
+    summary="Get forks",
+)
+async def get_forks(
+    _: Annotated[UserDTO, Depends(get_user)],
+    fork_service: Annotated[ForkService, Depends(get_fork_service)],
+) -> JSONResponse:
+    forks = await fork_service.get_forks()
+    return jsonify([ForkResponse.from_dto(fork) for fork in forks])
+
+
+@router.delete(
+    "/{github_owner}/{github_repository}",
+    response_model=SuccessResponse,
+    status_code=status.HTTP_200_OK,
+    description="Invalidate registered fork, next submission resolves it through GitHub again",
+    summary="Invalidate fork",
+)
+async def remove_fork(
+    _: Annotated[UserDTO, Depends(get_user)],
+    fork_service: Annotated[ForkService, Depends(get_fork_service)],
+    github_owner: str = Path(),
+    github_repository: str = Path(),
+) -> JSONResponse:
+    await fork_service.remove_fork(f"{github_owner}/{github_repository}")
+    return jsonify(SuccessResponse(message="Форк удален из реестра"))
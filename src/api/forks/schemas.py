@@ -0,0 +1,26 @@
+from uuid import uuid4
+
+from pydantic import Field
+
+from src.api.base_schema import BaseSchema
+from src.services.forks import ForkDTO
+
+
+class ForkResponse(BaseSchema):
+    github_full_name: str = Field(examples=["octocat/task-1"])
+    github_repo_url: str = Field(examples=["https://github.com/octocat/task-1"])
+    task_id: str = Field(examples=[str(uuid4())])
+    student_id: str = Field(examples=[str(uuid4())])
+    created_at: int = Field(examples=[1742159850])
+    validated_at: int = Field(examples=[1742159850])
+
+    @staticmethod
+    def from_dto(fork: ForkDTO) -> "ForkResponse":
+        return ForkResponse(
+            github_full_name=fork.github_full_name,
+            github_repo_url=fork.github_repo_url,
+            task_id=fork.task_id,
+            student_id=fork.student_id,
+            created_at=int(fork.created_at.timestamp()),
+            validated_at=int(fork.validated_at.timestamp()),
+        )
@@ -1,8 +1,26 @@
 from fastapi import APIRouter, status
 from starlette.responses import JSONResponse
 
-from src.api.health.schemas import HealthResponse
+from src.api.health.schemas import (
+    AdmissionStatsResponse,
+    CacheStatsResponse,
+    DatabasePoolStatsResponse,
+    EventHubStatsResponse,
+    HashingStatsResponse,
+    HealthResponse,
+    OutboxStatsResponse,
+    ReplicaStatsResponse,
+)
 from src.api.utils import jsonify
+from src.infrastructure.cache.instances import pending_submissions_cache, session_cache, task_cache
+from src.infrastructure.events.instances import submission_status_hub
+from src.infrastructure.github import github_client
+from src.infrastructure.jobs import outbox_relay_stats
+from src.infrastructure.rate_limit.instances import submission_backpressure_stats, submission_rate_limiter
+from src.infrastructure.sqlalchemy.engine import async_engine, get_pool_stats, replica_engine
+from src.infrastructure.sqlalchemy.replica import replica_status
+from src.services.password import PasswordService
+from src.settings import app_settings
 
 router = APIRouter(tags=["monitoring"])
 
@@ -15,3 +33,92 @@ router = APIRouter(tags=["monitoring"])
 )
 def health_check() -> JSONResponse:
     return jsonify(HealthResponse(message="The service is alive"))
+
+
+@router.get(
+    "/health/cache",
+    response_model=list[CacheStatsResponse],
+    status_code=status.HTTP_200_OK,
+    description="Get hit/miss counters of in-process caches",
+    summary="Cache stats",
+)
+def cache_stats() -> JSONResponse:
+    return jsonify(
+        [
+            CacheStatsResponse.from_stats("sessions", session_cache.stats()),
+            CacheStatsResponse.from_stats("tasks", task_cache.stats()),
+            CacheStatsResponse.from_stats("github", github_client.cache.stats()),
+            CacheStatsResponse.from_stats("pending_submissions", pending_submissions_cache.stats()),
+        ]
+    )
+
+
+@router.get(
+    "/health/hashing",
+    response_model=HashingStatsResponse,
+    status_code=status.HTTP_200_OK,
+    description="Get queue depth of the password hashing pool",
+    summary="Hashing pool stats",
+)
+def hashing_stats() -> JSONResponse:
+    return jsonify(HashingStatsResponse.from_stats(PasswordService.executor.stats()))
+
+
+@router.get(
+    "/health/outbox",
+    response_model=OutboxStatsResponse,
+    status_code=status.HTTP_200_OK,
+    description="Get lag and batch sizes of the outbox relay of this worker",
+    summary="Outbox relay stats",
+)
+def outbox_stats() -> JSONResponse:
+    return jsonify(OutboxStatsResponse.from_stats(outbox_relay_stats))
+
+
+@router.get(
+    "/health/events",
+    response_model=EventHubStatsResponse,
+    status_code=status.HTTP_200_OK,
+    description="Get subscribers and delivery counters of submission status streams of this worker",
+    summary="Event streams stats",
+)
+def events_stats() -> JSONResponse:
+    return jsonify(EventHubStatsResponse.from_stats(submission_status_hub.stats()))
+
+
+@router.get(
+    "/health/admission",
+    response_model=AdmissionStatsResponse,
+    status_code=status.HTTP_200_OK,
+    description="Get rate limiting and backpressure counters of submission creation on this worker",
+    summary="Admission stats",
+)
+def admission_stats() -> JSONResponse:
+    return jsonify(AdmissionStatsResponse.from_stats(submission_rate_limiter.stats(), submission_backpressure_stats))
+
+
+@router.get(
+    "/health/db",
+    response_model=DatabasePoolStatsResponse,
+    status_code=status.HTTP_200_OK,
+    description="Get connection pool usage and wait time of this worker",
+    summary="Database pool stats",
+)
+def database_stats() -> JSONResponse:
+    return jsonify(DatabasePoolStatsResponse.from_stats(get_pool_stats(async_engine)))
+
+
+@router.get(
+    "/health/db/replica",
+    response_model=ReplicaStatsResponse,
+    status_code=status.HTTP_200_OK,
+    description="Get replication lag and connection pool usage of the read replica on this worker",
+    summary="Read replica stats",
+)
+def replica_stats() -> JSONResponse:
+    pool = get_pool_stats(replica_engine) if replica_engine is not None else None
+    return jsonify(
+        ReplicaStatsResponse.from_stats(
+            replica_status, app_settings.DB_REPLICA_MAX_LAG, app_settings.replica_status_max_age, pool
+        )
+    )
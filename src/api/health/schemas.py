@@ -1,7 +1,163 @@
 from pydantic import Field
 
 from src.api.base_schema import BaseSchema
+from src.infrastructure.cache import CacheStats
+from src.infrastructure.events import EventHubStats
+from src.infrastructure.jobs.outbox import OutboxRelayStats
+from src.infrastructure.rate_limit.instances import BackpressureStats
+from src.infrastructure.sqlalchemy.pool import PoolStats
+from src.infrastructure.sqlalchemy.replica import ReplicaStatus
+from src.services.password import HashingExecutorStats
+from src.services.rate_limit import RateLimitStatsDTO
 
 
 class HealthResponse(BaseSchema):
     message: str = Field(examples=["The service is alive"])
+
+
+class CacheStatsResponse(BaseSchema):
+    name: str = Field(examples=["sessions"])
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @staticmethod
+    def from_stats(name: str, stats: CacheStats) -> "CacheStatsResponse":
+        return CacheStatsResponse(
+            name=name,
+            size=stats.size,
+            maxsize=stats.maxsize,
+            hits=stats.hits,
+            misses=stats.misses,
+            evictions=stats.evictions,
+        )
+
+
+class HashingStatsResponse(BaseSchema):
+    max_workers: int
+    max_concurrency: int
+    in_flight: int
+    queued: int
+    completed: int
+
+    @staticmethod
+    def from_stats(stats: HashingExecutorStats) -> "HashingStatsResponse":
+        return HashingStatsResponse(
+            max_workers=stats.max_workers,
+            max_concurrency=stats.max_concurrency,
+            in_flight=stats.in_flight,
+            queued=stats.queued,
+            completed=stats.completed,
+        )
+
+
+class OutboxStatsResponse(BaseSchema):
+    batches: int
+    published: int
+    failures: int
+    last_batch_size: int
+    max_batch_size: int
+    last_lag: float = Field(description="Seconds between staging and publication of the oldest event of the last batch")
+    max_lag: float
+    last_run_at: int | None
+
+    @staticmethod
+    def from_stats(stats: OutboxRelayStats) -> "OutboxStatsResponse":
+        return OutboxStatsResponse(
+            batches=stats.batches,
+            published=stats.published,
+            failures=stats.failures,
+            last_batch_size=stats.last_batch_size,
+            max_batch_size=stats.max_batch_size,
+            last_lag=stats.last_lag,
+            max_lag=stats.max_lag,
+            last_run_at=int(stats.last_run_at.timestamp()) if stats.last_run_at else None,
+        )
+
+
+class EventHubStatsResponse(BaseSchema):
+    channels: int
+    subscribers: int
+    published: int
+    delivered: int
+    dropped_subscribers: int = Field(description="Clients disconnected because their queue was full")
+
+    @staticmethod
+    def from_stats(stats: EventHubStats) -> "EventHubStatsResponse":
+        return EventHubStatsResponse(
+            channels=stats.channels,
+            subscribers=stats.subscribers,
+            published=stats.published,
+            delivered=stats.delivered,
+            dropped_subscribers=stats.dropped_subscribers,
+        )
+
+
+class AdmissionStatsResponse(BaseSchema):
+    rate_limited_keys: int
+    allowed: int
+    rate_limited: int
+    pending: int = Field(description="Last known number of unevaluated submissions")
+    overloaded: int = Field(description="Submissions rejected because of the pending threshold")
+
+    @staticmethod
+    def from_stats(rate_limit: RateLimitStatsDTO, backpressure: BackpressureStats) -> "AdmissionStatsResponse":
+        return AdmissionStatsResponse(
+            rate_limited_keys=rate_limit.keys,
+            allowed=rate_limit.allowed,
+            rate_limited=rate_limit.rejected,
+            pending=backpressure.pending,
+            overloaded=backpressure.rejected,
+        )
+
+
+class DatabasePoolStatsResponse(BaseSchema):
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int = Field(description="Connections currently open above the pool size")
+    checkouts: int
+    overflow_connections: int = Field(description="Connections opened above the pool size since start")
+    timeouts: int = Field(description="Requests which did not get a connection within DB_POOL_TIMEOUT")
+    average_wait: float = Field(description="Seconds spent waiting for a connection per checkout")
+    max_wait: float
+
+    @staticmethod
+    def from_stats(stats: PoolStats) -> "DatabasePoolStatsResponse":
+        return DatabasePoolStatsResponse(
+            size=stats.size,
+            checked_out=stats.checked_out,
+            idle=stats.idle,
+            overflow=stats.overflow,
+            checkouts=stats.checkouts,
+            overflow_connections=stats.overflow_connections,
+            timeouts=stats.timeouts,
+            average_wait=stats.total_wait / stats.checkouts if stats.checkouts else 0.0,
+            max_wait=stats.max_wait,
+        )
+
+
+class ReplicaStatsResponse(BaseSchema):
+    configured: bool
+    serves_reads: bool = Field(
+        description="False while lag is unknown, not checked recently or above DB_REPLICA_MAX_LAG"
+    )
+    lag: float | None = Field(description="Seconds of replication lag at the last check")
+    checked_at: int | None
+    failures: int
+    pool: DatabasePoolStatsResponse | None
+
+    @staticmethod
+    def from_stats(
+        status: ReplicaStatus, max_lag: float, max_age: float, pool: PoolStats | None
+    ) -> "ReplicaStatsResponse":
+        return ReplicaStatsResponse(
+            configured=pool is not None,
+            serves_reads=pool is not None and status.is_fresh(max_lag, max_age),
+            lag=status.lag,
+            checked_at=int(status.checked_at.timestamp()) if status.checked_at else None,
+            failures=status.failures,
+            pool=DatabasePoolStatsResponse.from_stats(pool) if pool else None,
+        )
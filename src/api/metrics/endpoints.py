@@ -0,0 +1,19 @@
+from fastapi import APIRouter, status
+from starlette.responses import Response
+
+from src.infrastructure.metrics import render_metrics
+
+router = APIRouter(tags=["monitoring"])
+
+
+@router.get(
+    "/metrics",
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    description="Get metrics of all workers in Prometheus text format",
+    summary="Prometheus metrics",
+    responses={status.HTTP_200_OK: {"content": {"text/plain": {}}}},
+)
+def metrics() -> Response:
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.sqlalchemy.engine import get_async_session
+from src.infrastructure.sqlalchemy.services import SqlAlchemyOutboxService
+from src.services.outbox import OutboxService
+
+
+def get_outbox_service(
+    db_session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> OutboxService:
+    return SqlAlchemyOutboxService(db_session)
@@ -0,0 +1,24 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from fastapi import status
+
+from src.api.exceptions import APIError
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode("UTF-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError) as ex:
+        raise APIError(message="Некорректный курсор пагинации", status=status.HTTP_400_BAD_REQUEST) from ex
+    if not isinstance(values, dict):
+        raise APIError(message="Некорректный курсор пагинации", status=status.HTTP_400_BAD_REQUEST)
+    return values
@@ -0,0 +1,42 @@
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+from src.api.base_schema import BaseSchema
+
+
+def to_timestamp(value: datetime | None) -> int | None:
+    return int(value.timestamp()) if value else None
+
+
+def from_timestamp(value: int | None) -> datetime | None:
+    """Naive local datetime, as datetimes are stored in the database."""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, tz=UTC).astimezone().replace(tzinfo=None)
+
+
+class DTOSerializer:
+    """Dumps DTOs to dicts shaped like a response schema without building its instances.
+
+    Used by list endpoints, where validation of every item by pydantic costs more than the query.
+    Keys are taken from aliases of the schema, so the output stays in sync with the documented model.
+    DTO attributes must be named as schema fields, converters are applied to fields which differ in type.
+    """
+
+    def __init__(self, schema: type[BaseSchema], converters: dict[str, Callable[[Any], Any]] | None = None) -> None:
+        converters = converters or {}
+        unknown = set(converters) - set(schema.model_fields)
+        if unknown:
+            error_message = f"Поля {sorted(unknown)} отсутствуют в схеме {schema.__name__}"
+            raise ValueError(error_message)
+        self.fields = [(name, field.alias or name, converters.get(name)) for name, field in schema.model_fields.items()]
+
+    def dump(self, dto: object) -> dict[str, Any]:
+        return {
+            alias: convert(getattr(dto, name)) if convert else getattr(dto, name)
+            for name, alias, convert in self.fields
+        }
+
+    def dump_many(self, dtos: Iterable[object]) -> list[dict[str, Any]]:
+        return [self.dump(dto) for dto in dtos]
@@ -1,16 +1,53 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import Depends
+from fastapi import Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.sqlalchemy.engine import get_async_session
+from src.api.exceptions import APIError
+from src.api.pagination import decode_cursor, encode_cursor
+from src.infrastructure.sqlalchemy.engine import get_async_session, get_read_async_session
 from src.infrastructure.sqlalchemy.services import SqlAlchemyStudentService
-from src.services.stundents import StudentService
+from src.services.stundents import StudentCursorDTO, StudentService
 
 
 def get_student_service(
     db_session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> StudentService:
     return SqlAlchemyStudentService(db_session)
+
+
+def get_read_student_service(
+    db_session: Annotated[AsyncSession, Depends(get_read_async_session)],
+) -> StudentService:
+    return SqlAlchemyStudentService(db_session)
+
+
+def get_student_cursor(cursor: str | None = Query(default=None)) -> StudentCursorDTO | None:
+    if not cursor:
+        return None
+    values = decode_cursor(cursor)
+    try:
+        registered_at = values.get("registeredAt")
+        score = values.get("score")
+        return StudentCursorDTO(
+            student_id=str(UUID(values["studentId"])),
+            registered_at=datetime.fromisoformat(registered_at) if registered_at is not None else None,
+            score=float(score) if score is not None else None,
+        )
+    except (KeyError, TypeError, ValueError) as ex:
+        raise APIError(message="Некорректный курсор пагинации", status=status.HTTP_400_BAD_REQUEST) from ex
+
+
+def encode_student_cursor(cursor: StudentCursorDTO | None) -> str | None:
+    if cursor is None:
+        return None
+    values = {"studentId": cursor.student_id}
+    if cursor.registered_at is not None:
+        values["registeredAt"] = cursor.registered_at.isoformat()
+    if cursor.score is not None:
+        values["score"] = cursor.score
+    return encode_cursor(values)
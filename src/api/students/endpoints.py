@@ -1,16 +1,34 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status, Body, Path
+from fastapi import APIRouter, Depends, Request, status, Body, Path
 from fastapi.params import Query
+from pydantic import ValidationError
 from starlette.responses import JSONResponse
 
 from src.api.auth.dependencies import get_user
-from src.api.students.dependencies import get_student_service
-from src.api.students.schemas import StudentResponse, CreateStudentRequest, SetGithubRequest
-from src.api.utils import jsonify
+from src.api.students.dependencies import (
+    encode_student_cursor,
+    get_read_student_service,
+    get_student_cursor,
+    get_student_service,
+)
+from src.api.students.importing import iter_import_rows
+from src.api.students.schemas import (
+    CreateStudentRequest,
+    ImportStudentRequest,
+    ImportStudentRowResponse,
+    ImportStudentsResponse,
+    LookupStudentsRequest,
+    SetGithubRequest,
+    StudentPageResponse,
+    StudentResponse,
+    student_serializer,
+)
+from src.api.utils import jsonify, jsonify_dumped
 from src.api.general_schemas import SuccessResponse
 from src.services.auth import UserDTO
-from src.services.stundents import StudentService
+from src.services.stundents import NewStudentDTO, StudentCursorDTO, StudentService
+from src.settings import app_settings
 
 
 router = APIRouter(prefix="/students", tags=["students"])
@@ -18,18 +36,27 @@ router = APIRouter(prefix="/students", tags=["students"])
 
 @router.get(
     "",
-    response_model=SuccessResponse,
+    response_model=StudentPageResponse,
     status_code=status.HTTP_200_OK,
-    description="Get all students",
+    description="Get students page, newest first or ranked by similarity of usernames to the query. "
+    "Pass nextCursor of the previous page to get the next one",
     summary="Get students",
 )
 async def get_students(
     _: Annotated[UserDTO, Depends(get_user)],
-    student_service: Annotated[StudentService, Depends(get_student_service)],
-    query: str = Query(default="")
+    student_service: Annotated[StudentService, Depends(get_read_student_service)],
+    cursor: Annotated[StudentCursorDTO | None, Depends(get_student_cursor)],
+    query: str = Query(default=""),
+    prefix: bool = Query(default=False, description="Match only usernames starting with the query, for autocomplete"),
+    limit: int = Query(default=50, ge=1, le=200),
 ) -> JSONResponse:
-    students = await student_service.get_all(query)
-    return jsonify([StudentResponse.from_dto(student) for student in students])
+    page = await student_service.get_all(query, limit, cursor, prefix=prefix)
+    return jsonify_dumped(
+        {
+            "items": student_serializer.dump_many(page.items),
+            "nextCursor": encode_student_cursor(page.next_cursor),
+        }
+    )
 
 
 @router.post(
@@ -47,6 +74,89 @@ async def create_student(
     return jsonify(SuccessResponse(message="Студент успешно зарегистрирован"), status_code=status.HTTP_201_CREATED)
 
 
+@router.post(
+    "/import",
+    response_model=ImportStudentsResponse,
+    status_code=status.HTTP_200_OK,
+    description="Register many students from a CSV with header (telegram_user_id,telegram_username,github_username) "
+    "or a JSON array, existing students are skipped and the result is reported per row",
+    summary="Import students",
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "text/csv": {"schema": {"type": "string"}},
+                "application/json": {"schema": {"type": "array", "items": ImportStudentRequest.model_json_schema()}},
+            },
+            "required": True,
+        }
+    },
+)
+async def import_students(
+    request: Request,
+    _: Annotated[UserDTO, Depends(get_user)],
+    student_service: Annotated[StudentService, Depends(get_student_service)],
+) -> JSONResponse:
+    rows: list[ImportStudentRowResponse] = []
+    chunk: list[tuple[int, NewStudentDTO]] = []
+    imported_telegram_user_ids: set[int] = set()
+
+    async def import_chunk() -> None:
+        created = await student_service.create_many([student for _, student in chunk])
+        for number, student in chunk:
+            # The same student repeated in the data is created only once
+            is_created = (
+                student.telegram_user_id in created and student.telegram_user_id not in imported_telegram_user_ids
+            )
+            imported_telegram_user_ids.add(student.telegram_user_id)
+            rows.append(
+                ImportStudentRowResponse(
+                    row=number,
+                    telegram_user_id=student.telegram_user_id,
+                    status="created" if is_created else "already_exists",
+                )
+            )
+        chunk.clear()
+
+    number = 0
+    async for values in iter_import_rows(request):
+        number += 1
+        try:
+            student = ImportStudentRequest.model_validate(values)
+        except ValidationError:
+            rows.append(ImportStudentRowResponse(row=number, telegram_user_id=None, status="invalid"))
+            continue
+        chunk.append((number, student.to_dto()))
+        if len(chunk) >= app_settings.STUDENT_IMPORT_CHUNK_SIZE:
+            await import_chunk()
+    if chunk:
+        await import_chunk()
+
+    rows.sort(key=lambda row: row.row)
+    return jsonify(
+        ImportStudentsResponse(
+            created=sum(row.status == "created" for row in rows),
+            already_exists=sum(row.status == "already_exists" for row in rows),
+            invalid=sum(row.status == "invalid" for row in rows),
+            rows=rows,
+        )
+    )
+
+
+@router.post(
+    "/lookup",
+    response_model=list[StudentResponse],
+    status_code=status.HTTP_200_OK,
+    description="Get students by many Telegram user IDs or GitHub usernames at once, unknown ones are skipped",
+    summary="Lookup students",
+)
+async def lookup_students(
+    student_service: Annotated[StudentService, Depends(get_read_student_service)],
+    data: Annotated[LookupStudentsRequest, Body()],
+) -> JSONResponse:
+    students = await student_service.get_many(data.telegram_user_ids, data.github_usernames)
+    return jsonify_dumped(student_serializer.dump_many(students))
+
+
 @router.put(
     "/telegram/{student_telegram_user_id}",
     response_model=SuccessResponse,
@@ -0,0 +1,54 @@
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import Request, status
+
+from src.api.exceptions import APIError
+
+
+async def iter_csv_rows(request: Request) -> AsyncIterator[dict[str, str]]:
+    """Parse CSV body with a header line while it is received, quoted line breaks are not supported."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    header: list[str] | None = None
+    tail = ""
+    async for chunk in request.stream():
+        lines = (tail + decoder.decode(chunk)).split("\n")
+        tail = lines.pop()
+        for values in csv.reader(lines):
+            if not values:
+                continue
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            # Rows with missing or extra values are reported by validation of the row, not here
+            yield dict(zip(header, values, strict=False))
+    tail += decoder.decode(b"", final=True)
+    for values in csv.reader([tail]):
+        if values and header is not None:
+            yield dict(zip(header, values, strict=False))
+
+
+async def iter_json_rows(request: Request) -> AsyncIterator[Any]:
+    try:
+        rows = json.loads(await request.body())
+    except ValueError as ex:
+        raise APIError(message="Некорректный JSON", status=status.HTTP_400_BAD_REQUEST) from ex
+    if not isinstance(rows, list):
+        raise APIError(message="Ожидается JSON массив студентов", status=status.HTTP_400_BAD_REQUEST)
+    for row in rows:
+        yield row
+
+
+def iter_import_rows(request: Request) -> AsyncIterator[Any]:
+    content_type = request.headers.get("Content-Type", "").split(";")[0].strip().lower()
+    if content_type == "text/csv":
+        return iter_csv_rows(request)
+    if content_type == "application/json":
+        return iter_json_rows(request)
+    raise APIError(
+        message="Поддерживаются только text/csv и application/json",
+        status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+    )
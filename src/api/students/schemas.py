@@ -1,15 +1,28 @@
 import uuid
+from typing import Literal
 
 from pydantic import Field
 
 from src.api.base_schema import BaseSchema
-from src.services.stundents import StudentDTO
+from src.api.serialization import DTOSerializer, to_timestamp
+from src.services.stundents import NewStudentDTO, StudentDTO
 
 
 class CreateStudentRequest(BaseSchema):
     telegram_user_id: int = Field(examples=[42353453])
     telegram_username: str = Field(examples=["nikita"])
 
+class ImportStudentRequest(CreateStudentRequest):
+    github_username: str | None = Field(default=None, examples=["Nicki"])
+
+    def to_dto(self) -> NewStudentDTO:
+        return NewStudentDTO(
+            telegram_user_id=self.telegram_user_id,
+            telegram_username=self.telegram_username,
+            github_username=self.github_username or None,
+        )
+
+
 class SetGithubRequest(BaseSchema):
     github_username: str = Field(examples=["Nicki"])
 
@@ -29,4 +42,30 @@ class StudentResponse(BaseSchema):
             telegram_username=student.telegram_username,
             github_username=student.github_username,
             registered_at=int(student.registered_at.timestamp()),
-        )
\ No newline at end of file
+        )
+
+
+student_serializer = DTOSerializer(StudentResponse, {"registered_at": to_timestamp})
+
+
+class StudentPageResponse(BaseSchema):
+    items: list[StudentResponse]
+    next_cursor: str | None = Field(examples=[None])
+
+
+class ImportStudentRowResponse(BaseSchema):
+    row: int = Field(description="Number of the row in the imported data from 1, the CSV header is not counted")
+    telegram_user_id: int | None = Field(examples=[42353453])
+    status: Literal["created", "already_exists", "invalid"]
+
+
+class ImportStudentsResponse(BaseSchema):
+    created: int
+    already_exists: int
+    invalid: int
+    rows: list[ImportStudentRowResponse]
+
+
+class LookupStudentsRequest(BaseSchema):
+    telegram_user_ids: list[int] = Field(default=[], max_length=1000, examples=[[42353453]])
+    github_usernames: list[str] = Field(default=[], max_length=1000, examples=[["Nicki"]])
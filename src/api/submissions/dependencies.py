@@ -1,14 +1,158 @@
-from typing import Annotated
+import math
+from datetime import datetime, timedelta
+from typing import Annotated, Literal
+from uuid import UUID
 
-from fastapi import Depends
+from fastapi import Depends, Header, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.sqlalchemy.engine import get_async_session
+from src.api.exceptions import APIError
+from src.api.forks.dependencies import get_fork_service
+from src.api.pagination import decode_cursor, encode_cursor
+from src.api.serialization import from_timestamp
+from src.api.students.dependencies import get_student_service
+from src.api.tasks.dependencies import get_task_service
+from src.infrastructure.cache.instances import pending_submissions_cache
+from src.infrastructure.github import GitHubClient, GitHubError, get_github_client
+from src.infrastructure.rate_limit.instances import get_submission_rate_limiter, submission_backpressure_stats
+from src.infrastructure.sqlalchemy.engine import get_async_session, get_read_async_session
 from src.infrastructure.sqlalchemy.services import SqlAlchemySubmissionService
-from src.services.submissions import SubmissionService
+from src.services.exceptions import NotFoundError
+from src.services.forks import ForkDTO, ForkService
+from src.services.rate_limit import RateLimitService
+from src.services.stundents import StudentService
+from src.services.submissions import SubmissionCursorDTO, SubmissionFiltersDTO, SubmissionService
+from src.services.tasks import TaskService
+from src.settings import app_settings
 
 
 def get_submission_service(
     db_session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> SubmissionService:
     return SqlAlchemySubmissionService(db_session)
+
+
+def get_read_submission_service(
+    db_session: Annotated[AsyncSession, Depends(get_read_async_session)],
+) -> SubmissionService:
+    return SqlAlchemySubmissionService(db_session)
+
+
+async def check_submission_backpressure(
+    submission_service: Annotated[SubmissionService, Depends(get_submission_service)],
+) -> None:
+    """Reject the submission if the graders are overloaded."""
+    if not app_settings.SUBMISSION_BACKPRESSURE_THRESHOLD:
+        return
+    pending = pending_submissions_cache.get("pending")
+    if pending is None:
+        pending = await submission_service.count_pending_submissions(
+            datetime.now() - timedelta(seconds=app_settings.SUBMISSION_BACKPRESSURE_WINDOW)
+        )
+        pending_submissions_cache.set("pending", pending)
+        submission_backpressure_stats.pending = pending
+    if pending >= app_settings.SUBMISSION_BACKPRESSURE_THRESHOLD:
+        submission_backpressure_stats.rejected += 1
+        raise APIError(
+            message="Очередь проверки переполнена, попробуйте позже",
+            status=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": str(app_settings.SUBMISSION_BACKPRESSURE_RETRY_AFTER)},
+        )
+
+
+async def check_submission_admission(
+    rate_limiter: Annotated[RateLimitService, Depends(get_submission_rate_limiter)],
+    _: Annotated[None, Depends(check_submission_backpressure)],
+    github_owner: str = Header(default="", alias="X-GitHub-Owner"),
+    github_repository: str = Header(default="", alias="X-GitHub-Repository"),
+) -> None:
+    """Reject the submission before GitHub, MinIO or Kafka work if its repository or the graders are overloaded.
+
+    Backpressure is checked first, so that a rejected submission does not spend a rate limit token.
+    """
+    rate_limit = await rate_limiter.acquire(f"{github_owner}/{github_repository}".lower())
+    if not rate_limit.allowed:
+        raise APIError(
+            message="Слишком много сабмитов из этого репозитория, попробуйте позже",
+            status=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": str(math.ceil(rate_limit.retry_after))},
+        )
+
+
+async def get_submission_fork(
+    fork_service: Annotated[ForkService, Depends(get_fork_service)],
+    task_service: Annotated[TaskService, Depends(get_task_service)],
+    student_service: Annotated[StudentService, Depends(get_student_service)],
+    github: Annotated[GitHubClient, Depends(get_github_client)],
+    github_owner: str = Header(default="", alias="X-GitHub-Owner"),
+    github_repository: str = Header(default="", alias="X-GitHub-Repository"),
+) -> ForkDTO:
+    """Resolve task and student of the submitted fork, GitHub is asked only for unknown forks."""
+    github_full_name = f"{github_owner}/{github_repository}"
+    try:
+        return await fork_service.get_fork(github_full_name)
+    except NotFoundError:
+        pass
+
+    try:
+        repository = await github.get_repository(github_owner, github_repository)
+    except GitHubError as ex:
+        raise APIError(
+            message=f"Репозиторий не существует или не доступен ({ex.message})",
+            status=status.HTTP_400_BAD_REQUEST,
+        ) from ex
+    if repository.parent_svn_url is None:
+        raise APIError(message="Репозиторий не является форком", status=status.HTTP_400_BAD_REQUEST)
+    try:
+        task = await task_service.get_task_by_github_repository_url(repository.parent_svn_url)
+    except NotFoundError as ex:
+        raise APIError(
+            message="Репозиторий не является форком репозитория какого-либо задания",
+            status=status.HTTP_404_NOT_FOUND,
+        ) from ex
+    try:
+        student = await student_service.get_by_github_username(github_owner)
+    except NotFoundError as ex:
+        raise APIError(
+            message=f"Студент с профилем {github_owner} на GitHub не зарегистрирован",
+            status=status.HTTP_404_NOT_FOUND,
+        ) from ex
+    return await fork_service.register_fork(github_full_name, repository.svn_url, task.task_id, student.student_id)
+
+
+def get_submission_cursor(cursor: str | None = Query(default=None)) -> SubmissionCursorDTO | None:
+    if not cursor:
+        return None
+    values = decode_cursor(cursor)
+    try:
+        return SubmissionCursorDTO(
+            created_at=datetime.fromisoformat(values["createdAt"]),
+            submission_id=str(UUID(values["submissionId"])),
+        )
+    except (KeyError, TypeError, ValueError) as ex:
+        raise APIError(message="Некорректный курсор пагинации", status=status.HTTP_400_BAD_REQUEST) from ex
+
+
+def encode_submission_cursor(cursor: SubmissionCursorDTO | None) -> str | None:
+    if cursor is None:
+        return None
+    return encode_cursor({"createdAt": cursor.created_at.isoformat(), "submissionId": cursor.submission_id})
+
+
+def get_submission_filters(
+    task_id: Annotated[UUID | None, Query(alias="taskId")] = None,
+    student_id: Annotated[UUID | None, Query(alias="studentId")] = None,
+    submission_status: Annotated[Literal["evaluated", "pending"] | None, Query(alias="status")] = None,
+    created_from: Annotated[int | None, Query(alias="createdFrom", description="Unix timestamp, inclusive")] = None,
+    created_to: Annotated[int | None, Query(alias="createdTo", description="Unix timestamp, exclusive")] = None,
+) -> SubmissionFiltersDTO:
+    try:
+        return SubmissionFiltersDTO(
+            task_id=str(task_id) if task_id else None,
+            student_id=str(student_id) if student_id else None,
+            is_evaluated=None if submission_status is None else submission_status == "evaluated",
+            created_from=from_timestamp(created_from),
+            created_to=from_timestamp(created_to),
+        )
+    except (OverflowError, OSError, ValueError) as ex:
+        raise APIError(message="Некорректный интервал времени", status=status.HTTP_400_BAD_REQUEST) from ex
@@ -1,48 +1,183 @@
-import io
 import json
-import uuid
-import zipfile
+from datetime import datetime, timedelta
 from typing import Annotated
+from uuid import UUID
 
 import aiohttp
-from fastapi import APIRouter, File, UploadFile, Depends, status, Header, Body, Path
-from faststream.kafka import KafkaBroker
-from starlette.responses import JSONResponse
+from fastapi import APIRouter, File, UploadFile, Depends, status, Header, Body, Path, Query, Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
 from miniopy_async import Minio
 
 from src.api.auth.dependencies import get_user
-from src.api.students.dependencies import get_student_service
-from src.api.submissions.dependencies import get_submission_service
-from src.api.submissions.events import SUBMISSION_TOPIC, SubmissionEventSchema, CreateCommentRequest, NEW_COMMENT_TOPIC
-from src.api.submissions.schemas import SubmissionResponse, EvaluationSubmissionRequest
-from src.api.tasks.dependencies import get_task_service
-from src.api.utils import jsonify
+from src.api.exceptions import APIError
+from src.api.outbox.dependencies import get_outbox_service
+from src.api.submissions.dependencies import (
+    check_submission_admission,
+    check_submission_backpressure,
+    encode_submission_cursor,
+    get_read_submission_service,
+    get_submission_cursor,
+    get_submission_filters,
+    get_submission_fork,
+    get_submission_service,
+)
+from src.api.submissions.events import (
+    NEW_COMMENT_TOPIC,
+    SUBMISSION_STATUS_TOPIC,
+    SUBMISSION_TOPIC,
+    CreateCommentRequest,
+    SubmissionEventSchema,
+    SubmissionStatusEventSchema,
+)
+from src.api.submissions.schemas import (
+    BulkEvaluationSubmissionRequest,
+    EvaluationStatusResponse,
+    EvaluationSubmissionRequest,
+    InitUploadResponse,
+    SubmissionPageResponse,
+    SubmissionResponse,
+    UploadFormResponse,
+    UploadFormsResponse,
+    submission_serializer,
+)
+from src.api.submissions.streaming import iter_exported_submissions, stream_submission_status
+from src.api.utils import jsonify, jsonify_dumped, stream_json_array
+from src.infrastructure.fastapi.compression import skip_response_encoding
+from src.infrastructure.metrics.instances import minio_put_duration, minio_put_size
 from src.api.general_schemas import SuccessResponse
-from src.infrastructure.faststream.dependencies import get_broker
-from src.infrastructure.minio.client import get_s3_client
+from src.infrastructure.minio.client import (
+    get_object_size,
+    get_presigned_upload_form,
+    get_s3_client,
+    get_upload_object_name,
+    is_object_exist,
+    remove_objects_quietly,
+)
+from src.infrastructure.minio.streaming import ArchiveMember, StoredObjectFile, ZipArchiveStream, hash_upload_files
 from src.services.auth import UserDTO
 from src.services.exceptions import NotFoundError
-from src.services.stundents import StudentService
-from src.services.submissions import SubmissionService
-from src.services.tasks import TaskService
+from src.services.forks import ForkDTO
+from src.services.outbox import OutboxService
+from src.services.submissions import (
+    GZIP_ENCODING,
+    SubmissionCursorDTO,
+    SubmissionDTO,
+    SubmissionFiltersDTO,
+    SubmissionService,
+    iter_report_chunks,
+)
 from src.settings import app_settings
 
 router = APIRouter(prefix="/submissions", tags=["submissions"])
 
+# In the order of files of a multipart submission, so both are archived and hashed alike
+UPLOAD_ARTIFACTS = ("autotests_log", "linters_log", "code")
+
 
 @router.get(
     "",
-    response_model=SuccessResponse,
+    response_model=SubmissionPageResponse,
     status_code=status.HTTP_200_OK,
-    description="Get all submissions",
+    description="Get submissions page, newest first. Pass nextCursor of the previous page to get the next one",
     summary="Get submissions",
 )
 async def get_submissions(
     _: Annotated[UserDTO, Depends(get_user)],
-    submission_service: Annotated[SubmissionService, Depends(get_submission_service)],
+    submission_service: Annotated[SubmissionService, Depends(get_read_submission_service)],
+    filters: Annotated[SubmissionFiltersDTO, Depends(get_submission_filters)],
+    cursor: Annotated[SubmissionCursorDTO | None, Depends(get_submission_cursor)],
+    limit: int = Query(default=100, ge=1, le=500),
 ) -> JSONResponse:
-    submissions = await submission_service.get_all_submissions()
-    return jsonify([SubmissionResponse.from_dto(submission) for submission in submissions])
+    page = await submission_service.get_all_submissions(filters, limit, cursor)
+    return jsonify_dumped(
+        {
+            "items": submission_serializer.dump_many(page.items),
+            "nextCursor": encode_submission_cursor(page.next_cursor),
+        }
+    )
+
+
+@router.get(
+    "/export",
+    response_model=list[SubmissionResponse],
+    status_code=status.HTTP_200_OK,
+    description="Get all submissions matching the filters at once, newest first. The array is streamed as it is read",
+    summary="Export submissions",
+)
+async def export_submissions(
+    _: Annotated[UserDTO, Depends(get_user)],
+    filters: Annotated[SubmissionFiltersDTO, Depends(get_submission_filters)],
+) -> StreamingResponse:
+    return stream_json_array(iter_exported_submissions(filters))
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    description="Server-Sent Events with statuses of all submissions, events are named created and evaluated",
+    summary="Stream submission statuses",
+    responses={status.HTTP_200_OK: {"content": {"text/event-stream": {}}}},
+)
+@skip_response_encoding
+async def stream_submissions(_: Annotated[UserDTO, Depends(get_user)], request: Request) -> StreamingResponse:
+    return stream_submission_status(request, "submissions")
+
+
+@router.get(
+    "/students/{student_id}/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    description="Server-Sent Events with statuses of submissions of the student",
+    summary="Stream student submission statuses",
+    responses={status.HTTP_200_OK: {"content": {"text/event-stream": {}}}},
+)
+@skip_response_encoding
+async def stream_student_submissions(
+    _: Annotated[UserDTO, Depends(get_user)], request: Request, student_id: Annotated[UUID, Path()]
+) -> StreamingResponse:
+    return stream_submission_status(request, f"students/{student_id}")
+
+
+@router.get(
+    "/{submission_id}/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    description="Server-Sent Events with statuses of the submission",
+    summary="Stream submission status",
+    responses={status.HTTP_200_OK: {"content": {"text/event-stream": {}}}},
+)
+@skip_response_encoding
+async def stream_submission(
+    _: Annotated[UserDTO, Depends(get_user)], request: Request, submission_id: Annotated[UUID, Path()]
+) -> StreamingResponse:
+    return stream_submission_status(request, f"submissions/{submission_id}")
+
+
+@router.get(
+    "/{submission_id}/report",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    description="Get LLM report of the submission as JSON, gzip encoded if the client accepts it",
+    summary="Get submission report",
+    responses={status.HTTP_200_OK: {"content": {"application/json": {}}}},
+)
+@skip_response_encoding
+async def get_submission_report(
+    _: Annotated[UserDTO, Depends(get_user)],
+    submission_service: Annotated[SubmissionService, Depends(get_submission_service)],
+    submission_id: Annotated[UUID, Path()],
+    accept_encoding: str = Header(default="", alias="Accept-Encoding"),
+) -> Response:
+    report = await submission_service.get_submission_report(str(submission_id))
+    headers = {"Vary": "Accept-Encoding"}
+    if report.content_encoding == GZIP_ENCODING and "gzip" in accept_encoding.lower():
+        # Stored gzip is sent as is, the client decompresses it
+        headers["Content-Encoding"] = GZIP_ENCODING
+        return Response(content=report.content, media_type="application/json", headers=headers)
+    return StreamingResponse(
+        iter_report_chunks(report, app_settings.REPORT_CHUNK_SIZE), media_type="application/json", headers=headers
+    )
 
 
 @router.put(
@@ -53,25 +188,134 @@ async def get_submissions(
     summary="Update submission",
 )
 async def evaluate_submission(
-    broker: Annotated[KafkaBroker, Depends(get_broker)],
+    outbox_service: Annotated[OutboxService, Depends(get_outbox_service)],
     submission_service: Annotated[SubmissionService, Depends(get_submission_service)],
     submission_id: str = Path(),
     data: EvaluationSubmissionRequest = Body(),
 ) -> JSONResponse:
-    submission_dto = await submission_service.evaluate_submission(submission_id, data.llm_grade, data.llm_feedback, json.dumps(data.llm_report))
-    parts = submission_dto.gh_repo_url.split('/')
-    gh_username, gh_repo_name =  parts[3], parts[4]
-    await broker.publish(
-        CreateCommentRequest(
-            username=gh_username,
-            repo_name=gh_repo_name,
-            pull_request_number=submission_dto.gh_pull_request_number,
-            comment=submission_dto.llm_feedback
-        ), topic=NEW_COMMENT_TOPIC
+    submission_dto = await submission_service.evaluate_submission(
+        submission_id, data.llm_grade, data.llm_feedback, json.dumps(data.llm_report), commit=False
+    )
+    await outbox_service.add_event(
+        NEW_COMMENT_TOPIC, CreateCommentRequest.from_dto(submission_dto).model_dump(mode="json")
+    )
+    await outbox_service.add_event(
+        SUBMISSION_STATUS_TOPIC, SubmissionStatusEventSchema.from_dto(submission_dto).model_dump(mode="json")
     )
+    await outbox_service.commit()
     return jsonify(SuccessResponse(message="Вердикт успешно сохранен"))
 
 
+@router.post(
+    "/evaluations",
+    response_model=list[EvaluationStatusResponse],
+    status_code=status.HTTP_200_OK,
+    description="Update many submissions with feedback in one request, status is reported per item",
+    summary="Update submissions",
+)
+async def evaluate_submissions(
+    outbox_service: Annotated[OutboxService, Depends(get_outbox_service)],
+    submission_service: Annotated[SubmissionService, Depends(get_submission_service)],
+    data: Annotated[list[BulkEvaluationSubmissionRequest], Body(min_length=1, max_length=1000)],
+) -> JSONResponse:
+    submissions = await submission_service.evaluate_submissions(
+        [item.to_dto() for item in data], commit=False
+    )
+    for submission in submissions:
+        await outbox_service.add_event(
+            NEW_COMMENT_TOPIC, CreateCommentRequest.from_dto(submission).model_dump(mode="json")
+        )
+        await outbox_service.add_event(
+            SUBMISSION_STATUS_TOPIC, SubmissionStatusEventSchema.from_dto(submission).model_dump(mode="json")
+        )
+    await outbox_service.commit()
+    evaluated_ids = {submission.submission_id for submission in submissions}
+    return jsonify(
+        [
+            EvaluationStatusResponse(
+                submission_id=str(item.submission_id),
+                status="evaluated" if str(item.submission_id) in evaluated_ids else "not_found",
+            )
+            for item in data
+        ]
+    )
+
+
+async def save_submission(
+    outbox_service: OutboxService,
+    submission_service: SubmissionService,
+    client: Minio,
+    fork: ForkDTO,
+    github_pull_request_number: int,
+    files: list[ArchiveMember],
+) -> SubmissionDTO:
+    """Archive the files under their content hash and create the submission, a graded duplicate reuses its verdict."""
+    content_hash = await hash_upload_files(files, app_settings.UPLOAD_CHUNK_SIZE)
+    code_filename = f"{content_hash}.zip"
+    try:
+        duplicate = await submission_service.get_evaluated_submission_by_content_hash(
+            fork.task_id, fork.student_id, content_hash
+        )
+    except NotFoundError:
+        duplicate = None
+    if duplicate is None and not await is_object_exist(client, code_filename):
+        archive = ZipArchiveStream(files, app_settings.UPLOAD_CHUNK_SIZE)
+        with minio_put_duration.time():
+            await client.put_object(
+                app_settings.MINIO_BUCKET,
+                code_filename,
+                archive,
+                length=-1,
+                part_size=app_settings.MINIO_PART_SIZE,
+                num_parallel_uploads=app_settings.MINIO_PARALLEL_UPLOADS,
+            )
+        minio_put_size.observe(archive.size)
+
+    submission = await submission_service.create_submission(
+        fork.task_id,
+        fork.student_id,
+        fork.github_repo_url,
+        github_pull_request_number,
+        code_filename,
+        content_hash,
+        commit=False,
+    )
+    if duplicate:
+        # Identical code was already graded, the verdict is reused instead of a new LLM evaluation
+        submission = await submission_service.copy_evaluation(
+            submission.submission_id, duplicate.submission_id, commit=False
+        )
+        await outbox_service.add_event(
+            NEW_COMMENT_TOPIC, CreateCommentRequest.from_dto(submission).model_dump(mode="json")
+        )
+    else:
+        await outbox_service.add_event(
+            SUBMISSION_TOPIC,
+            SubmissionEventSchema(
+                submission_id=submission.submission_id,
+                task_id=fork.task_id,
+                code_filename=code_filename,
+            ).model_dump(mode="json"),
+        )
+    await outbox_service.add_event(
+        SUBMISSION_STATUS_TOPIC, SubmissionStatusEventSchema.from_dto(submission).model_dump(mode="json")
+    )
+    await outbox_service.commit()
+    return submission
+
+
+def jsonify_created_submission(submission: SubmissionDTO) -> JSONResponse:
+    return jsonify(
+        SuccessResponse(
+            message=(
+                f"Заявка на проверку создана, ее номер: {submission.submission_id}, "
+                "пожалуйста ожидайте обратной связи"
+            )
+        ),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
 @router.post(
     "",
     response_model=SuccessResponse,
@@ -80,70 +324,105 @@ async def evaluate_submission(
     summary="Create submissions",
 )
 async def create_submission(
-    broker: Annotated[KafkaBroker, Depends(get_broker)],
-    task_service: Annotated[TaskService, Depends(get_task_service)],
-    student_service: Annotated[StudentService, Depends(get_student_service)],
+    _: Annotated[None, Depends(check_submission_admission)],
+    outbox_service: Annotated[OutboxService, Depends(get_outbox_service)],
     submission_service: Annotated[SubmissionService, Depends(get_submission_service)],
     client: Annotated[Minio, Depends(get_s3_client)],
+    fork: Annotated[ForkDTO, Depends(get_submission_fork)],
     autotests_log: UploadFile = File(...),
     linters_log: UploadFile = File(...),
     code: UploadFile = File(...),
-    github_owner: str = Header(default="", alias="X-GitHub-Owner"),
-    github_repository: str = Header(default="", alias="X-GitHub-Repository"),
     github_pull_request_number: int = Header(default="", alias="X-GitHub-Pull-Request-Number"),
 ) -> JSONResponse:
-    github_repo_api_url = f"https://api.github.com/repos/{github_owner}/{github_repository}"
-    async with aiohttp.ClientSession() as session:
-        res = await session.get(github_repo_api_url)
-        data: dict = await res.json(encoding="utf-8")
-
-    if "status" in data.keys() and data["status"] != 200:
-        error_message = data["message"]
-        return jsonify(SuccessResponse(message=f"Репозиторий не существует или не доступен ({error_message})"), status_code=status.HTTP_400_BAD_REQUEST)
-    elif "parent" not in data.keys():
-        return jsonify(SuccessResponse(message="Репозиторий не является форком"), status_code=status.HTTP_400_BAD_REQUEST)
-    current_repository_url = data["svn_url"]
-    parent_repository_url = data["parent"]["svn_url"]
-    try:
-        task = await task_service.get_task_by_github_repository_url(parent_repository_url)
-    except NotFoundError:
-        return jsonify(SuccessResponse(message="Репозиторий не является форком репозитория какого-либо задания"), status_code=status.HTTP_404_NOT_FOUND)
-    try:
-        student = await student_service.get_by_github_username(github_owner)
-    except NotFoundError:
-        return jsonify(SuccessResponse(message=f"Студент с профилем {github_owner} на GitHub не зарегистрирован"), status_code=status.HTTP_404_NOT_FOUND)
-
-    code_filename = f"{str(uuid.uuid4())}.zip"
-    code_zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(code_zip_buffer, 'w') as zip_file:
-        for file in [autotests_log, linters_log, code]:
-            zip_file.writestr(file.filename, await file.read())
-    code_zip_buffer.seek(0)
-    await client.put_object(
-        app_settings.MINIO_BUCKET,
-        code_filename,
-        code_zip_buffer,
-        code_zip_buffer.getbuffer().nbytes
+    submission = await save_submission(
+        outbox_service,
+        submission_service,
+        client,
+        fork,
+        github_pull_request_number,
+        [autotests_log, linters_log, code],
     )
+    return jsonify_created_submission(submission)
 
-    submission = await submission_service.create_submission(
-        task.task_id, student.student_id, current_repository_url, github_pull_request_number, code_filename
-    )
 
-    await broker.publish(
-        SubmissionEventSchema(
-            submission_id=submission.submission_id,
-            task_id=task.task_id,
-            code_filename=code_filename,
-        ), topic=SUBMISSION_TOPIC
+@router.post(
+    "/uploads",
+    response_model=InitUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+    description=(
+        "Validate fork and get presigned forms to POST artifacts directly into the storage, "
+        "each form accepts at most maxSize bytes"
+    ),
+    summary="Init direct upload",
+)
+async def init_submission_upload(
+    _: Annotated[None, Depends(check_submission_admission)],
+    submission_service: Annotated[SubmissionService, Depends(get_submission_service)],
+    client: Annotated[Minio, Depends(get_s3_client)],
+    fork: Annotated[ForkDTO, Depends(get_submission_fork)],
+) -> JSONResponse:
+    expires = timedelta(seconds=app_settings.MINIO_PRESIGNED_EXPIRES)
+    expires_at = datetime.now() + expires
+    upload_id = await submission_service.create_upload(fork.task_id, fork.student_id, expires_at)
+    forms = {}
+    for artifact in UPLOAD_ARTIFACTS:
+        url, fields = await get_presigned_upload_form(
+            client, get_upload_object_name(upload_id, artifact), expires, app_settings.SUBMISSION_UPLOAD_MAX_SIZE
+        )
+        forms[artifact] = UploadFormResponse(url=url, fields=fields)
+    return jsonify(
+        InitUploadResponse(
+            upload_id=upload_id,
+            forms=UploadFormsResponse(**forms),
+            expires_at=int(expires_at.timestamp()),
+            max_size=app_settings.SUBMISSION_UPLOAD_MAX_SIZE,
+        ),
+        status_code=status.HTTP_201_CREATED,
     )
 
-    return jsonify(SuccessResponse(message=f"Заявка на проверку создана, ее номер: {submission.submission_id}, пожалуйста ожидайте обратной связи"), status_code=status.HTTP_201_CREATED)
 
+@router.post(
+    "/uploads/{upload_id}",
+    response_model=SuccessResponse,
+    status_code=status.HTTP_201_CREATED,
+    description="Create submission from artifacts uploaded by presigned forms, an upload is finalized only once",
+    summary="Finalize direct upload",
+)
+async def finalize_submission_upload(
+    # Rate limit token was taken by init, the upload is single use
+    _: Annotated[None, Depends(check_submission_backpressure)],
+    outbox_service: Annotated[OutboxService, Depends(get_outbox_service)],
+    submission_service: Annotated[SubmissionService, Depends(get_submission_service)],
+    client: Annotated[Minio, Depends(get_s3_client)],
+    fork: Annotated[ForkDTO, Depends(get_submission_fork)],
+    upload_id: Annotated[UUID, Path()],
+    github_pull_request_number: int = Header(default="", alias="X-GitHub-Pull-Request-Number"),
+) -> JSONResponse:
+    # Not committed until the submission is, a failed finalization can be retried
+    await submission_service.consume_upload(str(upload_id), fork.task_id, fork.student_id, commit=False)
+    object_names = {artifact: get_upload_object_name(str(upload_id), artifact) for artifact in UPLOAD_ARTIFACTS}
+    for artifact, object_name in object_names.items():
+        size = await get_object_size(client, object_name)
+        if size is None:
+            raise APIError(message=f"Артефакт {artifact} не загружен", status=status.HTTP_400_BAD_REQUEST)
+        if size > app_settings.SUBMISSION_UPLOAD_MAX_SIZE:
+            raise APIError(
+                message=f"Артефакт {artifact} больше {app_settings.SUBMISSION_UPLOAD_MAX_SIZE} байт",
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
 
- # async with aiohttp.ClientSession() as session:
- #        response = await client.get_object(app_settings.MINIO_BUCKET, zip_filename, session)
- #        print(response.status)
- #        with open("data.zip", "wb") as f:
- #            content = await response.read()
- #            f.write(content)
\ No newline at end of file
+    async with aiohttp.ClientSession() as session:
+        files = [
+            StoredObjectFile(client, session, app_settings.MINIO_BUCKET, object_name, artifact)
+            for artifact, object_name in object_names.items()
+        ]
+        try:
+            submission = await save_submission(
+                outbox_service, submission_service, client, fork, github_pull_request_number, files
+            )
+        finally:
+            for file in files:
+                file.close()
+    # Artifacts are archived under the content hash now
+    await remove_objects_quietly(client, list(object_names.values()))
+    return jsonify_created_submission(submission)
@@ -1,7 +1,10 @@
+from typing import Literal
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from src.services.submissions import SubmissionDTO
+
 SUBMISSION_TOPIC = "new_submission"
 
 
@@ -18,3 +21,61 @@ class CreateCommentRequest(BaseModel):
     repo_name: str = Field(examples=["task-1"])
     pull_request_number: int = Field(examples=[1])
     comment: str = Field(examples=["Хорошая работа"])
+
+    @staticmethod
+    def from_dto(submission: SubmissionDTO) -> "CreateCommentRequest":
+        parts = submission.gh_repo_url.split("/")
+        return CreateCommentRequest(
+            username=parts[3],
+            repo_name=parts[4],
+            pull_request_number=submission.gh_pull_request_number,
+            comment=submission.llm_feedback,
+        )
+
+
+EVALUATION_RESULT_TOPIC = "evaluation_result"
+
+
+class EvaluationResultEventSchema(BaseModel):
+    submission_id: str = Field(examples=[str(uuid4())])
+    llm_grade: str = Field(examples=["5"])
+    llm_feedback: str = Field(examples=["Хорошая работа"])
+    llm_report: dict = Field(examples=[{}])
+
+
+EVALUATION_RESULT_DEAD_LETTER_TOPIC = "evaluation_result_dead_letter"
+
+
+class DeadLetterEventSchema(BaseModel):
+    topic: str = Field(examples=[EVALUATION_RESULT_TOPIC])
+    payload: str = Field(examples=['{"submission_id": null}'])  # message as it was received
+    error: str = Field(examples=["submission_id: Input should be a valid string"])
+
+
+SUBMISSION_STATUS_TOPIC = "submission_status"
+
+
+class SubmissionStatusEventSchema(BaseModel):
+    submission_id: str = Field(examples=[str(uuid4())])
+    task_id: str = Field(examples=[str(uuid4())])
+    student_id: str = Field(examples=[str(uuid4())])
+    status: Literal["created", "evaluated"]
+    llm_grade: str = Field(examples=["5"])
+    created_at: int = Field(examples=[1742159850])
+    evaluated_at: int | None = Field(examples=[None])
+
+    @staticmethod
+    def from_dto(submission: SubmissionDTO) -> "SubmissionStatusEventSchema":
+        return SubmissionStatusEventSchema(
+            submission_id=submission.submission_id,
+            task_id=submission.task_id,
+            student_id=submission.student_id,
+            status="evaluated" if submission.evaluated_at else "created",
+            llm_grade=submission.llm_grade,
+            created_at=int(submission.created_at.timestamp()),
+            evaluated_at=int(submission.evaluated_at.timestamp()) if submission.evaluated_at else None,
+        )
+
+    def channels(self) -> list[str]:
+        """Names of event hub channels the event is delivered to."""
+        return ["submissions", f"students/{self.student_id}", f"submissions/{self.submission_id}"]
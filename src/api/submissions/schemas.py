@@ -1,9 +1,12 @@
-from uuid import uuid4
+import json
+from typing import Literal
+from uuid import UUID, uuid4
 
 from pydantic import Field
 
 from src.api.base_schema import BaseSchema
-from src.services.submissions import SubmissionDTO
+from src.api.serialization import DTOSerializer, to_timestamp
+from src.services.submissions import EvaluationDTO, SubmissionDTO
 
 
 class SubmissionResponse(BaseSchema):
@@ -16,7 +19,6 @@ class SubmissionResponse(BaseSchema):
 
     llm_grade: str
     llm_feedback: str
-    llm_report: str
     created_at: int
     evaluated_at: int | None
 
@@ -31,13 +33,55 @@ class SubmissionResponse(BaseSchema):
             code_file_name=submission.code_file_name,
             llm_grade=submission.llm_grade,
             llm_feedback=submission.llm_feedback,
-            llm_report=submission.llm_report,
             created_at=int(submission.created_at.timestamp()),
             evaluated_at=int(submission.evaluated_at.timestamp()) if submission.evaluated_at else None,
         )
 
 
+submission_serializer = DTOSerializer(SubmissionResponse, {"created_at": to_timestamp, "evaluated_at": to_timestamp})
+
+
+class SubmissionPageResponse(BaseSchema):
+    items: list[SubmissionResponse]
+    next_cursor: str | None = Field(examples=[None])
+
+
 class EvaluationSubmissionRequest(BaseSchema):
     llm_grade: str
     llm_feedback: str
     llm_report: dict
+
+
+class BulkEvaluationSubmissionRequest(EvaluationSubmissionRequest):
+    submission_id: UUID = Field(examples=[str(uuid4())])
+
+    def to_dto(self) -> EvaluationDTO:
+        return EvaluationDTO(
+            submission_id=str(self.submission_id),
+            llm_grade=self.llm_grade,
+            llm_feedback=self.llm_feedback,
+            llm_report=json.dumps(self.llm_report),
+        )
+
+
+class EvaluationStatusResponse(BaseSchema):
+    submission_id: str = Field(examples=[str(uuid4())])
+    status: Literal["evaluated", "not_found"]
+
+
+class UploadFormResponse(BaseSchema):
+    url: str = Field(examples=["http://localhost:9000/submissions"])
+    fields: dict[str, str] = Field(description="Form fields to POST along with the file in the field named file")
+
+
+class UploadFormsResponse(BaseSchema):
+    code: UploadFormResponse
+    linters_log: UploadFormResponse
+    autotests_log: UploadFormResponse
+
+
+class InitUploadResponse(BaseSchema):
+    upload_id: str = Field(examples=[str(uuid4())])
+    forms: UploadFormsResponse
+    expires_at: int = Field(examples=[1742159850])
+    max_size: int = Field(examples=[52428800], description="Maximum size of each artifact in bytes")
@@ -0,0 +1,51 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+
+from src.api.submissions.schemas import submission_serializer
+from src.infrastructure.events.instances import submission_status_hub
+from src.infrastructure.sqlalchemy.engine import get_read_session_factory
+from src.infrastructure.sqlalchemy.services import SqlAlchemySubmissionService
+from src.services.submissions import SubmissionFiltersDTO
+from src.settings import app_settings
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def stream_submission_status(request: Request, channel: str) -> StreamingResponse:
+    """Subscribe to the channel of the submission status hub and send its events as Server-Sent Events."""
+
+    async def events() -> AsyncIterator[str]:
+        subscription = submission_status_hub.subscribe(channel)
+        try:
+            # Headers are flushed right away, so that the client knows the stream is open
+            yield ": connected\n\n"
+            while not subscription.closed:
+                try:
+                    async with asyncio.timeout(app_settings.SSE_PING_INTERVAL):
+                        event = await subscription.get()
+                except TimeoutError:
+                    event = None
+                if event is not None:
+                    yield f"event: {event['status']}\ndata: {json.dumps(event)}\n\n"
+                elif await request.is_disconnected():
+                    break
+                elif not subscription.closed:
+                    # Comment line keeps idle connection open through proxies
+                    yield ": ping\n\n"
+        finally:
+            submission_status_hub.unsubscribe(subscription)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+async def iter_exported_submissions(filters: SubmissionFiltersDTO) -> AsyncIterator[dict[str, Any]]:
+    # Yield dependencies are closed before a streaming response is sent, so the stream opens its own session
+    async with get_read_session_factory()() as session:
+        submissions = SqlAlchemySubmissionService(session).iter_submissions(filters, app_settings.EXPORT_BATCH_SIZE)
+        async for submission in submissions:
+            yield submission_serializer.dump(submission)
@@ -0,0 +1,103 @@
+import json
+import logging
+from typing import Annotated, Any
+from uuid import UUID
+
+from fastapi import Depends
+
+from src.api.outbox.dependencies import get_outbox_service
+from src.api.submissions.dependencies import get_submission_service
+from src.api.submissions.events import (
+    EVALUATION_RESULT_DEAD_LETTER_TOPIC,
+    EVALUATION_RESULT_TOPIC,
+    NEW_COMMENT_TOPIC,
+    SUBMISSION_STATUS_TOPIC,
+    CreateCommentRequest,
+    DeadLetterEventSchema,
+    EvaluationResultEventSchema,
+    SubmissionStatusEventSchema,
+)
+from src.infrastructure.events.instances import submission_status_hub
+from src.infrastructure.faststream.kafka_router import kafka_router
+from src.services.outbox import OutboxService
+from src.services.submissions import EvaluationDTO, SubmissionService
+from src.settings import app_settings
+
+logger = logging.getLogger(__name__)
+
+
+@kafka_router.subscriber(
+    EVALUATION_RESULT_TOPIC,
+    group_id=app_settings.KAFKA_GROUP_ID,
+    batch=True,
+    max_records=app_settings.EVALUATION_RESULT_BATCH_SIZE,
+    auto_commit=False,
+    description="Verdicts of LLM graders, alternative to PUT /api/submissions/{submission_id}",
+)
+async def consume_evaluation_results(
+    # Messages are validated one by one, so that a malformed one does not fail the whole batch forever
+    messages: list[Any],
+    submission_service: Annotated[SubmissionService, Depends(get_submission_service)],
+    outbox_service: Annotated[OutboxService, Depends(get_outbox_service)],
+) -> None:
+    evaluations = []
+    for message in messages:
+        try:
+            event = parse_evaluation_result(message)
+        except ValueError as ex:
+            logger.warning("Malformed evaluation result is sent to %s: %s", EVALUATION_RESULT_DEAD_LETTER_TOPIC, ex)
+            dead_letter = DeadLetterEventSchema(
+                topic=EVALUATION_RESULT_TOPIC, payload=dump_raw_message(message), error=str(ex)
+            )
+            await outbox_service.add_event(EVALUATION_RESULT_DEAD_LETTER_TOPIC, dead_letter.model_dump(mode="json"))
+            continue
+        evaluations.append(
+            EvaluationDTO(
+                submission_id=event.submission_id,
+                llm_grade=event.llm_grade,
+                llm_feedback=event.llm_feedback,
+                llm_report=json.dumps(event.llm_report),
+            )
+        )
+    # Offsets are committed after processing, so a batch may be redelivered: already evaluated
+    # submissions are skipped and no duplicate comments are sent
+    submissions = await submission_service.evaluate_submissions(evaluations, commit=False, only_pending=True)
+    for submission in submissions:
+        await outbox_service.add_event(
+            NEW_COMMENT_TOPIC, CreateCommentRequest.from_dto(submission).model_dump(mode="json")
+        )
+        await outbox_service.add_event(
+            SUBMISSION_STATUS_TOPIC, SubmissionStatusEventSchema.from_dto(submission).model_dump(mode="json")
+        )
+    await outbox_service.commit()
+
+
+def parse_evaluation_result(message: object) -> EvaluationResultEventSchema:
+    """Validate a message decoded by FastStream: JSON ones come as dicts, others as bytes."""
+    if isinstance(message, str | bytes):
+        event = EvaluationResultEventSchema.model_validate_json(message)
+    else:
+        event = EvaluationResultEventSchema.model_validate(message)
+    try:
+        UUID(event.submission_id)
+    except ValueError as ex:
+        error_message = f"Invalid submission ID {event.submission_id}"
+        raise ValueError(error_message) from ex
+    return event
+
+
+def dump_raw_message(message: object) -> str:
+    if isinstance(message, bytes):
+        return message.decode("UTF-8", errors="replace")
+    if isinstance(message, str):
+        return message
+    return json.dumps(message, ensure_ascii=False, default=str)
+
+
+# No consumer group, so that every API worker receives all events and fans them out to its own SSE clients
+@kafka_router.subscriber(
+    SUBMISSION_STATUS_TOPIC,
+    description="Submission status changes, delivered to SSE streams of /api/submissions",
+)
+async def relay_submission_status(event: SubmissionStatusEventSchema) -> None:
+    submission_status_hub.publish(event.channels(), event.model_dump(mode="json"))
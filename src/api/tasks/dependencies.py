@@ -5,7 +5,9 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.sqlalchemy.engine import get_async_session
+from src.infrastructure.cache import CachedTaskService
+from src.infrastructure.cache.instances import task_cache
+from src.infrastructure.sqlalchemy.engine import get_async_session, get_read_async_session
 from src.infrastructure.sqlalchemy.services import SqlAlchemyTaskService
 from src.services.tasks import TaskService
 
@@ -13,4 +15,11 @@ from src.services.tasks import TaskService
 def get_task_service(
     db_session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> TaskService:
+    return CachedTaskService(SqlAlchemyTaskService(db_session), task_cache)
+
+
+def get_read_task_service(
+    db_session: Annotated[AsyncSession, Depends(get_read_async_session)],
+) -> TaskService:
+    # Not cached, replica could put tasks from before the latest edit back into the shared cache
     return SqlAlchemyTaskService(db_session)
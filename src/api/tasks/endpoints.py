@@ -1,17 +1,19 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, status, Path
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query, Request, status, Path
+from fastapi.responses import JSONResponse, Response
 
 from src.api.auth.dependencies import get_user
+from src.api.etag import etag_response, render_response
 from src.api.general_schemas import SuccessResponse
-from src.api.tasks.dependencies import get_task_service
+from src.api.tasks.dependencies import get_read_task_service, get_task_service
 from src.api.tasks.schemas import (
     CreateTaskRequest,
     EditTaskRequest,
-    TaskResponse, TaskPromptResponse, ShortTaskResponse,
+    TaskResponse, TaskPromptResponse, ShortTaskResponse, task_serializer,
 )
-from src.api.utils import jsonify
+from src.api.utils import jsonify, jsonify_dumped
+from src.infrastructure.cache.instances import task_cache
 from src.services.auth import UserDTO
 from src.services.tasks import TaskService
 
@@ -50,10 +52,15 @@ async def create_task(
     summary="Get All Tasks",
 )
 async def get_all_tasks(
+    request: Request,
     task_service: Annotated[TaskService, Depends(get_task_service)],
-) -> JSONResponse:
-    tasks = await task_service.get_all_tasks(public_only=True)
-    return jsonify([ShortTaskResponse.from_dto(task) for task in tasks])
+) -> Response:
+    rendered = task_cache.get("response:public")
+    if rendered is None:
+        tasks = await task_service.get_all_tasks(public_only=True)
+        rendered = render_response([ShortTaskResponse.from_dto(task) for task in tasks])
+        task_cache.set("response:public", rendered)
+    return etag_response(request, rendered)
 
 
 @router.get(
@@ -80,11 +87,17 @@ async def get_task(
     summary="Get Task Prompt",
 )
 async def get_task_prompt(
+    request: Request,
     task_id: str,
     task_service: Annotated[TaskService, Depends(get_task_service)],
-) -> JSONResponse:
-    task = await task_service.get_task_by_task_id(task_id)
-    return jsonify(TaskPromptResponse.from_dto(task))
+) -> Response:
+    key = f"response:prompt:{task_id}"
+    rendered = task_cache.get(key)
+    if rendered is None:
+        task = await task_service.get_task_by_task_id(task_id)
+        rendered = render_response(TaskPromptResponse.from_dto(task))
+        task_cache.set(key, rendered)
+    return etag_response(request, rendered)
 
 
 
@@ -97,10 +110,10 @@ async def get_task_prompt(
 )
 async def get_all_tasks(
     _: Annotated[UserDTO, Depends(get_user)],
-    task_service: Annotated[TaskService, Depends(get_task_service)],
+    task_service: Annotated[TaskService, Depends(get_read_task_service)],
 ) -> JSONResponse:
     tasks = await task_service.get_all_tasks()
-    return jsonify([TaskResponse.from_dto(task) for task in tasks])
+    return jsonify_dumped(task_serializer.dump_many(tasks))
 
 
 @router.put(
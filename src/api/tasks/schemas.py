@@ -3,6 +3,7 @@ from uuid import uuid4
 from pydantic import Field
 
 from src.api.base_schema import BaseSchema
+from src.api.serialization import DTOSerializer
 from src.services.tasks import TaskDTO
 
 
@@ -30,6 +31,9 @@ class TaskResponse(BaseSchema):
         )
 
 
+task_serializer = DTOSerializer(TaskResponse)
+
+
 class ShortTaskResponse(BaseSchema):
     task_id: str = Field(examples=[str(uuid4())])
     name: str
@@ -1,10 +1,19 @@
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+import orjson
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 
 from src.api.base_schema import BaseSchema
+from src.settings import app_settings
 
 
-def jsonify(response: BaseSchema | list[BaseSchema], status_code: int = status.HTTP_200_OK) -> JSONResponse:
+def jsonify(
+    response: BaseSchema | list[BaseSchema],
+    status_code: int = status.HTTP_200_OK,
+    headers: dict[str, str] | None = None,
+) -> JSONResponse:
     if isinstance(response, BaseSchema):
         data = response.model_dump(by_alias=True)
     elif isinstance(response, list):
@@ -12,7 +21,50 @@ def jsonify(response: BaseSchema | list[BaseSchema], status_code: int = status.H
     else:
         error_message = f"Тип {type(response)} не обрабатывается jsonify"
         raise TypeError(error_message)
-    return JSONResponse(
+    return ORJSONResponse(
+        content=data,
+        status_code=status_code,
+        headers=headers,
+    )
+
+
+def jsonify_dumped(
+    data: dict[str, Any] | list[dict[str, Any]],
+    status_code: int = status.HTTP_200_OK,
+    headers: dict[str, str] | None = None,
+) -> JSONResponse:
+    """Respond with data already dumped by aliases of a schema, see DTOSerializer."""
+    return ORJSONResponse(
         content=data,
         status_code=status_code,
+        headers=headers,
+    )
+
+
+async def encode_json_array(items: AsyncIterable[dict[str, Any]], chunk_size: int) -> AsyncIterator[bytes]:
+    """Encode items as a JSON array piece by piece, sending them in chunks of about chunk_size bytes."""
+    chunk = bytearray(b"[")
+    separator = b""
+    async for item in items:
+        chunk += separator
+        chunk += orjson.dumps(item)
+        separator = b","
+        if len(chunk) >= chunk_size:
+            yield bytes(chunk)
+            chunk.clear()
+    chunk += b"]"
+    yield bytes(chunk)
+
+
+def stream_json_array(
+    items: AsyncIterable[dict[str, Any]],
+    status_code: int = status.HTTP_200_OK,
+    headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    """Respond with a JSON array of items dumped by aliases of a schema without holding all of them in memory."""
+    return StreamingResponse(
+        encode_json_array(items, app_settings.JSON_STREAM_CHUNK_SIZE),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
     )
@@ -1,18 +1,30 @@
 import logging
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from src.infrastructure.fastapi import add_custom_docs_endpoints, add_exception_handler, add_routers, lifespan
+from src.infrastructure.fastapi.compression import add_compression
 from src.infrastructure.fastapi.cors import add_cors
+from src.infrastructure.fastapi.metrics import add_metrics
 
 logging.basicConfig(level=logging.INFO)
 
 
 def create_application() -> FastAPI:
-    application = FastAPI(title="LLM Grading System", version="0.0.2", docs_url=None, redoc_url=None, lifespan=lifespan)
+    application = FastAPI(
+        title="LLM Grading System",
+        version="0.0.2",
+        docs_url=None,
+        redoc_url=None,
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
     add_routers(application)
     add_custom_docs_endpoints(application)
     add_exception_handler(application)
+    add_compression(application)
+    add_metrics(application)
     add_cors(application)
     return application
 
@@ -0,0 +1,4 @@
+from src.infrastructure.cache.tasks import CachedTaskService
+from src.infrastructure.cache.ttl_cache import CacheStats, TTLCache
+
+__all__ = ["CacheStats", "CachedTaskService", "TTLCache"]
@@ -0,0 +1,22 @@
+from typing import Any
+
+from src.infrastructure.cache.ttl_cache import TTLCache
+from src.services.auth import SessionDTO
+from src.settings import app_settings
+
+session_cache: TTLCache[str, SessionDTO] = TTLCache(
+    maxsize=app_settings.SESSION_CACHE_SIZE,
+    ttl=app_settings.SESSION_CACHE_TTL,
+)
+
+# Single entry with the number of unevaluated submissions, so that admission does not count them per request
+pending_submissions_cache: TTLCache[str, int] = TTLCache(
+    maxsize=1,
+    ttl=app_settings.SUBMISSION_BACKPRESSURE_CACHE_TTL,
+)
+
+# Task DTOs and API responses rendered from them, see CachedTaskService
+task_cache: TTLCache[str, Any] = TTLCache(
+    maxsize=app_settings.TASK_CACHE_SIZE,
+    ttl=app_settings.TASK_CACHE_TTL,
+)
@@ -0,0 +1,75 @@
+from typing import Any
+
+from src.infrastructure.cache.ttl_cache import TTLCache
+from src.services.tasks import TaskDTO, TaskService
+
+
+class CachedTaskService(TaskService):
+    """Read-through cache in front of another task service.
+
+    Tasks change rarely, so any write clears the whole cache, including responses rendered from tasks
+    by the API. Other workers see the change after the cache TTL.
+    """
+
+    def __init__(self, service: TaskService, cache: TTLCache[str, Any]) -> None:
+        self.service = service
+        self.cache = cache
+
+    async def create_task(
+        self,
+        name: str,
+        system_instructions: str,
+        ideas: str,
+        github_repo_url: str,
+        level: str,
+        tags: list[str],
+        is_draft: bool,
+    ) -> TaskDTO:
+        task = await self.service.create_task(name, system_instructions, ideas, github_repo_url, level, tags, is_draft)
+        self.cache.clear()
+        return task
+
+    async def get_task_by_github_repository_url(self, github_repo_url: str) -> TaskDTO:
+        key = f"task_by_url:{github_repo_url}"
+        task = self.cache.get(key)
+        if task is None:
+            task = await self.service.get_task_by_github_repository_url(github_repo_url)
+            self.cache.set(key, task)
+        return task
+
+    async def get_task_by_task_id(self, task_id: str) -> TaskDTO:
+        key = f"task:{task_id}"
+        task = self.cache.get(key)
+        if task is None:
+            task = await self.service.get_task_by_task_id(task_id)
+            self.cache.set(key, task)
+        return task
+
+    async def get_all_tasks(self, *, public_only: bool = False) -> list[TaskDTO]:
+        key = "tasks:public" if public_only else "tasks:all"
+        tasks = self.cache.get(key)
+        if tasks is None:
+            tasks = await self.service.get_all_tasks(public_only=public_only)
+            self.cache.set(key, tasks)
+        return tasks
+
+    async def edit_task_by_task_id(
+        self,
+        task_id: str,
+        name: str,
+        system_instructions: str,
+        ideas: str,
+        github_repo_url: str,
+        level: str,
+        tags: list[str],
+        is_draft: bool,
+    ) -> TaskDTO:
+        task = await self.service.edit_task_by_task_id(
+            task_id, name, system_instructions, ideas, github_repo_url, level, tags, is_draft
+        )
+        self.cache.clear()
+        return task
+
+    async def remove_task_by_task_id(self, task_id: str) -> None:
+        await self.service.remove_task_by_task_id(task_id)
+        self.cache.clear()
@@ -0,0 +1,3 @@
+from src.infrastructure.events.hub import EventHub, EventHubStats, Subscription
+
+__all__ = ["EventHub", "EventHubStats", "Subscription"]
@@ -0,0 +1,105 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+E = TypeVar("E")
+
+
+@dataclass
+class EventHubStats:
+    channels: int
+    subscribers: int
+    published: int
+    delivered: int
+    dropped_subscribers: int
+
+
+class Subscription(Generic[E]):
+    """Bounded queue of events of one channel for a single client."""
+
+    def __init__(self, channel: str, maxsize: int) -> None:
+        self.channel = channel
+        self.queue: asyncio.Queue[E] = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+        self._closed = False
+        self._changed = asyncio.Event()
+
+    def put_nowait(self, event: E) -> None:
+        self.queue.put_nowait(event)
+        self._changed.set()
+
+    async def get(self) -> E | None:
+        """Wait for the next event, None is returned when the subscription is closed.
+
+        Cancelling the wait, e.g. by asyncio.timeout(), loses no events.
+        """
+        while self.queue.empty():
+            if self._closed:
+                return None
+            self._changed.clear()
+            await self._changed.wait()
+        return self.queue.get_nowait()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        self._closed = True
+        self._changed.set()
+
+
+class EventHub(Generic[E]):
+    """In-process fan-out of events to subscribers of named channels.
+
+    A subscriber that does not keep up is closed instead of blocking the publisher or losing events silently,
+    so that the client reconnects. Intended for a single event loop, so no locking is done.
+    """
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue_size = queue_size
+        self._channels: dict[str, set[Subscription[E]]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.dropped_subscribers = 0
+
+    def subscribe(self, channel: str) -> Subscription[E]:
+        subscription: Subscription[E] = Subscription(channel, self.queue_size)
+        self._channels.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription[E]) -> None:
+        subscription.close()
+        subscribers = self._channels.get(subscription.channel)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._channels[subscription.channel]
+
+    def publish(self, channels: list[str], event: E) -> None:
+        self.published += 1
+        for channel in channels:
+            for subscription in list(self._channels.get(channel, ())):
+                try:
+                    subscription.put_nowait(event)
+                except asyncio.QueueFull:
+                    subscription.overflowed = True
+                    self.dropped_subscribers += 1
+                    self.unsubscribe(subscription)
+                else:
+                    self.delivered += 1
+
+    def close(self) -> None:
+        for subscribers in list(self._channels.values()):
+            for subscription in list(subscribers):
+                self.unsubscribe(subscription)
+
+    def stats(self) -> EventHubStats:
+        return EventHubStats(
+            channels=len(self._channels),
+            subscribers=sum(len(subscribers) for subscribers in self._channels.values()),
+            published=self.published,
+            delivered=self.delivered,
+            dropped_subscribers=self.dropped_subscribers,
+        )
@@ -0,0 +1,6 @@
+from typing import Any
+
+from src.infrastructure.events.hub import EventHub
+from src.settings import app_settings
+
+submission_status_hub: EventHub[dict[str, Any]] = EventHub(queue_size=app_settings.SSE_QUEUE_SIZE)
@@ -0,0 +1,163 @@
+import gzip
+import hashlib
+import zlib
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from fastapi import FastAPI, status
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.etag import is_not_modified
+from src.settings import app_settings
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is used without it
+    brotli = None
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+COMPRESSIBLE_MEDIA_TYPES = ("application/json", "text/")
+SKIP_ATTRIBUTE = "skip_response_encoding"
+
+
+def skip_response_encoding(endpoint: F) -> F:
+    """Send responses of the endpoint as is, without ETag and compression.
+
+    For endpoints which stream events or encode their body themselves.
+    """
+    setattr(endpoint, SKIP_ATTRIBUTE, True)
+    return endpoint
+
+
+class ResponseEncodingMiddleware:
+    """Compresses responses and answers conditional GET requests with 304 Not Modified.
+
+    Whole bodies of successful GET responses get a weak ETag, weak because the same ETag is shared
+    by all encodings of the body. Streamed bodies are compressed with gzip chunk by chunk.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int, gzip_level: int, brotli_quality: int) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accepted_encodings = parse_accept_encoding(Headers(scope=scope).get("Accept-Encoding", ""))
+        start_message: Message | None = None
+        passthrough = False
+        compressor: Any = None
+
+        async def send_encoded(message: Message) -> None:
+            nonlocal start_message, passthrough, compressor
+            if passthrough or message["type"] not in {"http.response.start", "http.response.body"}:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                # Headers are sent together with the first part of the body, when its size is known
+                start_message = message
+                return
+
+            if start_message is not None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                # Router fills the endpoint into the same scope before the response is started
+                if getattr(scope.get("endpoint"), SKIP_ATTRIBUTE, False) or "content-encoding" in headers:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                if not message.get("more_body", False):
+                    await self.send_whole_body(scope, start_message, message["body"], accepted_encodings, send)
+                    return
+                if self.is_compressible(headers) and "gzip" in accepted_encodings:
+                    compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+                    headers["Content-Encoding"] = "gzip"
+                    headers.add_vary_header("Accept-Encoding")
+                    del headers["Content-Length"]
+                await send(start_message)
+                start_message = None
+
+            if compressor is None:
+                await send(message)
+                return
+            more_body = message.get("more_body", False)
+            # Sync flush sends every chunk to the client right away instead of waiting for the compressor window
+            flush_mode = zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH
+            body = compressor.compress(message["body"]) + compressor.flush(flush_mode)
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_encoded)
+
+    async def send_whole_body(
+        self, scope: Scope, start_message: Message, body: bytes, accepted_encodings: set[str], send: Send
+    ) -> None:
+        headers = MutableHeaders(raw=start_message["headers"])
+        compressible = self.is_compressible(headers) and len(body) >= self.minimum_size
+        if compressible:
+            # Also sent with 304, so that caches revalidate every encoding of the body separately
+            headers.add_vary_header("Accept-Encoding")
+        if scope["method"] in {"GET", "HEAD"} and start_message["status"] == status.HTTP_200_OK:
+            if "etag" not in headers:
+                headers["ETag"] = f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+            if is_not_modified(Request(scope), headers["ETag"]):
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": status.HTTP_304_NOT_MODIFIED,
+                        "headers": [
+                            (name, value)
+                            for name, value in start_message["headers"]
+                            if name not in {b"content-length", b"content-type"}
+                        ],
+                    }
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        if compressible:
+            encoding = self.choose_encoding(accepted_encodings)
+            if encoding == "br":
+                body = brotli.compress(body, quality=self.brotli_quality)
+            elif encoding == "gzip":
+                body = gzip.compress(body, compresslevel=self.gzip_level)
+            if encoding:
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+        await send(start_message)
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    def is_compressible(headers: MutableHeaders) -> bool:
+        return headers.get("Content-Type", "").startswith(COMPRESSIBLE_MEDIA_TYPES)
+
+    @staticmethod
+    def choose_encoding(accepted_encodings: set[str]) -> str | None:
+        if brotli is not None and "br" in accepted_encodings:
+            return "br"
+        if "gzip" in accepted_encodings:
+            return "gzip"
+        return None
+
+
+def parse_accept_encoding(accept_encoding: str) -> set[str]:
+    accepted = set()
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        if params.replace(" ", "") not in {"q=0", "q=0.0"}:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def add_compression(application: FastAPI) -> None:
+    application.add_middleware(
+        ResponseEncodingMiddleware,
+        minimum_size=app_settings.RESPONSE_COMPRESSION_MIN_SIZE,
+        gzip_level=app_settings.RESPONSE_GZIP_LEVEL,
+        brotli_quality=app_settings.RESPONSE_BROTLI_QUALITY,
+    )
@@ -9,7 +9,7 @@ from src.services.exceptions import ServiceError, NotFoundError, AlreadyExistErr
 def add_exception_handler(application: FastAPI) -> None:
     @application.exception_handler(APIError)
     async def handle_application_error(_: Request, exc: APIError) -> JSONResponse:
-        return jsonify(ErrorResponse(message=exc.message), status_code=exc.status)
+        return jsonify(ErrorResponse(message=exc.message), status_code=exc.status, headers=exc.headers)
 
     @application.exception_handler(ServiceError)
     async def handle_application_error(_: Request, exc: ServiceError) -> JSONResponse:
@@ -1,15 +1,54 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI
 
+from src.infrastructure.events.instances import submission_status_hub
+from src.infrastructure.github import github_client
+from src.infrastructure.jobs import (
+    check_replica,
+    relay_outbox,
+    revalidate_forks,
+    revalidate_sessions,
+    run_periodically,
+)
+from src.infrastructure.metrics import mark_worker_dead
 from src.infrastructure.minio.scripts import create_bucket_if_not_exist
+from src.infrastructure.sqlalchemy.engine import async_engine, replica_engine
 from src.infrastructure.sqlalchemy.scripts import init_database
+from src.services.password import HashingExecutor, PasswordService
+from src.settings import app_settings
 
 
 @asynccontextmanager
 async def lifespan(application: FastAPI) -> AsyncGenerator[dict[Any, Any], Any]:  # noqa: ARG001
+    PasswordService.configure(
+        HashingExecutor(
+            max_workers=app_settings.PASSWORD_HASHING_WORKERS,
+            max_concurrency=app_settings.PASSWORD_HASHING_MAX_CONCURRENCY,
+            use_processes=app_settings.PASSWORD_HASHING_USE_PROCESSES,
+        )
+    )
     await init_database()
     await create_bucket_if_not_exist()
+    await github_client.start()
+    jobs = [
+        asyncio.create_task(run_periodically(app_settings.FORK_REVALIDATION_INTERVAL, revalidate_forks)),
+        asyncio.create_task(run_periodically(app_settings.OUTBOX_RELAY_INTERVAL, relay_outbox)),
+        asyncio.create_task(run_periodically(app_settings.SESSION_REVALIDATION_INTERVAL, revalidate_sessions)),
+    ]
+    if replica_engine is not None:
+        jobs.append(asyncio.create_task(run_periodically(app_settings.DB_REPLICA_LAG_CHECK_INTERVAL, check_replica)))
     yield {}
+    submission_status_hub.close()
+    for job in jobs:
+        job.cancel()
+    await asyncio.gather(*jobs, return_exceptions=True)
+    await github_client.close()
+    await async_engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
+    PasswordService.executor.shutdown()
+    mark_worker_dead()
@@ -0,0 +1,75 @@
+import time
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.metrics import QueryStats, request_query_stats
+from src.infrastructure.metrics.instances import (
+    http_request_db_duration,
+    http_request_db_queries,
+    http_request_duration,
+    http_request_size,
+    http_requests_in_progress,
+    http_response_size,
+)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """Measures latency, sizes and database usage of requests per route template.
+
+    Labels use the template, e.g. /api/submissions/{submission_id}/report, so that the number
+    of time series does not grow with identifiers in paths.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        started_at = time.perf_counter()
+        request_size = 0
+        response_size = 0
+        status_code = 500
+        query_stats = QueryStats()
+        token = request_query_stats.set(query_stats)
+
+        async def receive_counted() -> Message:
+            nonlocal request_size
+            message = await receive()
+            if message["type"] == "http.request":
+                request_size += len(message.get("body", b""))
+            return message
+
+        async def send_counted(message: Message) -> None:
+            nonlocal response_size, status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = http_requests_in_progress.labels(method=method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive_counted, send_counted)
+        finally:
+            in_progress.dec()
+            request_query_stats.reset(token)
+            # Router fills the matched route into the same scope
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            http_request_duration.labels(method=method, route=route, status=str(status_code)).observe(
+                time.perf_counter() - started_at
+            )
+            http_request_size.labels(method=method, route=route).observe(request_size)
+            http_response_size.labels(method=method, route=route).observe(response_size)
+            http_request_db_queries.labels(route=route).observe(query_stats.count)
+            http_request_db_duration.labels(route=route).observe(query_stats.duration)
+
+
+def add_metrics(application: FastAPI) -> None:
+    application.add_middleware(MetricsMiddleware)
@@ -1,10 +1,13 @@
 from fastapi import FastAPI
 from src.api.auth.endpoints import router as auth_router
 from src.api.health.endpoints import router as health_router
+from src.api.metrics.endpoints import router as metrics_router
 from src.api.tasks.endpoints import router as tasks_router
 from src.api.submissions.endpoints import router as submissions_router
+from src.api.submissions.subscribers import consume_evaluation_results  # noqa: F401 registers Kafka subscriber
 from src.api.students.endpoints import router as students_router
 from src.api.complaints.endpoints import router as complaints_router
+from src.api.forks.endpoints import router as forks_router
 from src.infrastructure.faststream.kafka_router import kafka_router
 
 
@@ -16,4 +19,6 @@ def add_routers(application: FastAPI) -> None:
     application.include_router(submissions_router, prefix=prefix)
     application.include_router(students_router, prefix=prefix)
     application.include_router(complaints_router, prefix=prefix)
+    application.include_router(forks_router, prefix=prefix)
     application.include_router(kafka_router)
+    application.include_router(metrics_router)
@@ -0,0 +1,9 @@
+from src.infrastructure.github.client import (
+    GitHubClient,
+    GitHubError,
+    GitHubRepository,
+    get_github_client,
+    github_client,
+)
+
+__all__ = ["GitHubClient", "GitHubError", "GitHubRepository", "get_github_client", "github_client"]
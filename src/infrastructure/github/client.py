@@ -0,0 +1,120 @@
+import time
+from dataclasses import dataclass
+
+import aiohttp
+from fastapi import status
+
+from src.infrastructure.cache import TTLCache
+from src.settings import app_settings
+
+
+@dataclass
+class GitHubRepository:
+    svn_url: str
+    parent_svn_url: str | None
+
+
+@dataclass
+class GitHubError(Exception):
+    message: str
+    status: int
+
+
+@dataclass
+class _CachedRepository:
+    repository: GitHubRepository
+    etag: str | None
+    fetched_at: float
+
+
+class GitHubClient:
+    """Shared GitHub REST client.
+
+    Repository metadata is cached in process: fresh entries are returned without a request,
+    stale ones are revalidated with If-None-Match (304 answers do not count against the rate limit).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        timeout: float,
+        pool_size: int,
+        cache_size: int,
+        cache_ttl: float,
+        cache_max_age: float,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.cache_ttl = cache_ttl
+        self.cache: TTLCache[str, _CachedRepository] = TTLCache(maxsize=cache_size, ttl=cache_max_age)
+        self._session: aiohttp.ClientSession | None = None
+
+    async def start(self) -> None:
+        if self._session is not None:
+            return
+        headers = {"Accept": "application/vnd.github+json", "X-GitHub-Api-Version": "2022-11-28"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        self._session = aiohttp.ClientSession(
+            headers=headers,
+            connector=aiohttp.TCPConnector(limit=self.pool_size, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_repository(self, owner: str, repository: str) -> GitHubRepository:
+        key = f"{owner}/{repository}".lower()
+        cached = self.cache.get(key)
+        if cached and time.monotonic() - cached.fetched_at < self.cache_ttl:
+            return cached.repository
+
+        await self.start()
+        headers = {"If-None-Match": cached.etag} if cached and cached.etag else {}
+        try:
+            async with self._session.get(f"{self.base_url}/repos/{owner}/{repository}", headers=headers) as response:
+                if response.status == status.HTTP_304_NOT_MODIFIED and cached:
+                    cached.fetched_at = time.monotonic()
+                    self.cache.set(key, cached)
+                    return cached.repository
+                try:
+                    data = await response.json(encoding="utf-8", content_type=None)
+                except ValueError:
+                    # HTML error pages of GitHub or of a proxy in front of it
+                    data = None
+                if response.status != status.HTTP_200_OK:
+                    message = data.get("message") if isinstance(data, dict) else None
+                    raise GitHubError(message=message or response.reason or "", status=response.status)
+                if not isinstance(data, dict):
+                    raise GitHubError(message="GitHub API вернул не JSON", status=status.HTTP_502_BAD_GATEWAY)
+                etag = response.headers.get("ETag")
+        except (aiohttp.ClientError, TimeoutError) as ex:
+            raise GitHubError(message="GitHub API недоступен", status=status.HTTP_503_SERVICE_UNAVAILABLE) from ex
+
+        repository_data = GitHubRepository(
+            svn_url=data["svn_url"],
+            parent_svn_url=data["parent"]["svn_url"] if "parent" in data else None,
+        )
+        self.cache.set(key, _CachedRepository(repository=repository_data, etag=etag, fetched_at=time.monotonic()))
+        return repository_data
+
+
+github_client = GitHubClient(
+    base_url=app_settings.GITHUB_API_URL,
+    token=app_settings.GITHUB_TOKEN,
+    timeout=app_settings.GITHUB_TIMEOUT,
+    pool_size=app_settings.GITHUB_POOL_SIZE,
+    cache_size=app_settings.GITHUB_CACHE_SIZE,
+    cache_ttl=app_settings.GITHUB_CACHE_TTL,
+    cache_max_age=app_settings.GITHUB_CACHE_MAX_AGE,
+)
+
+
+def get_github_client() -> GitHubClient:
+    return github_client
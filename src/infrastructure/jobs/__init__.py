@@ -0,0 +1,14 @@
+from src.infrastructure.jobs.forks import revalidate_forks
+from src.infrastructure.jobs.outbox import outbox_relay_stats, relay_outbox
+from src.infrastructure.jobs.periodic import run_periodically
+from src.infrastructure.jobs.replica import check_replica
+from src.infrastructure.jobs.sessions import revalidate_sessions
+
+__all__ = [
+    "check_replica",
+    "outbox_relay_stats",
+    "relay_outbox",
+    "revalidate_forks",
+    "revalidate_sessions",
+    "run_periodically",
+]
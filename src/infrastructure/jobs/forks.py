@@ -0,0 +1,71 @@
+import logging
+from contextlib import suppress
+from datetime import datetime, timedelta
+
+from fastapi import status
+
+from src.infrastructure.github import GitHubError, github_client
+from src.infrastructure.sqlalchemy.engine import async_engine, async_session_factory
+from src.infrastructure.sqlalchemy.locks import FORK_REVALIDATION_LOCK, try_advisory_lock
+from src.infrastructure.sqlalchemy.services import SqlAlchemyForkService, SqlAlchemyTaskService
+from src.services.exceptions import NotFoundError
+from src.services.forks import ForkDTO, ForkService
+from src.services.tasks import TaskService
+from src.settings import app_settings
+
+logger = logging.getLogger(__name__)
+
+
+async def revalidate_forks() -> None:
+    """Re-check stale fork registrations against GitHub and drop the ones that no longer match a task or a student.
+
+    Runs in one worker at a time, the others skip it while the lock is held.
+    """
+    async with try_advisory_lock(async_engine, FORK_REVALIDATION_LOCK) as is_locked:
+        if is_locked:
+            await _revalidate_stale_forks()
+
+
+async def _revalidate_stale_forks() -> None:
+    validated_before = datetime.now() - timedelta(seconds=app_settings.FORK_REVALIDATION_MAX_AGE)
+    async with async_session_factory() as session:
+        fork_service = SqlAlchemyForkService(session)
+        task_service = SqlAlchemyTaskService(session)
+        forks = await fork_service.get_stale_forks(validated_before, app_settings.FORK_REVALIDATION_BATCH_SIZE)
+        for fork in forks:
+            try:
+                await _revalidate_fork(fork, fork_service, task_service)
+            except Exception:
+                # One broken row must not stop revalidation of the rest of the batch
+                await session.rollback()
+                logger.exception("Fork %s was not revalidated", fork.github_full_name)
+
+
+async def _revalidate_fork(fork: ForkDTO, fork_service: ForkService, task_service: TaskService) -> None:
+    owner, repository = fork.github_full_name.split("/", 1)
+    try:
+        github_repository = await github_client.get_repository(owner, repository)
+    except GitHubError as ex:
+        if ex.status != status.HTTP_404_NOT_FOUND:
+            logger.warning("Fork %s was not revalidated: %s", fork.github_full_name, ex.message)
+            return
+        github_repository = None
+
+    is_valid = False
+    if github_repository and github_repository.parent_svn_url:
+        try:
+            task = await task_service.get_task_by_github_repository_url(github_repository.parent_svn_url)
+            # Not found when the owner was relinked to another student or unlinked, or the fork is already removed
+            await fork_service.get_fork(fork.github_full_name)
+        except NotFoundError:
+            pass
+        else:
+            is_valid = task.task_id == fork.task_id
+
+    if is_valid:
+        await fork_service.mark_validated(fork.github_full_name)
+        return
+    logger.info("Fork %s is removed from registry", fork.github_full_name)
+    # Not found when removed since the stale forks were selected, e.g. by an admin
+    with suppress(NotFoundError):
+        await fork_service.remove_fork(fork.github_full_name)
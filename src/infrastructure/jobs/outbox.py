@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from src.infrastructure.faststream.kafka_router import kafka_router
+from src.infrastructure.metrics.instances import kafka_publish_duration, kafka_published_messages
+from src.infrastructure.sqlalchemy.engine import async_session_factory
+from src.infrastructure.sqlalchemy.services import SqlAlchemyOutboxService
+from src.settings import app_settings
+
+
+@dataclass
+class OutboxRelayStats:
+    batches: int = 0
+    published: int = 0
+    failures: int = 0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    last_lag: float = 0  # seconds between staging of the oldest event in a batch and its publication
+    max_lag: float = 0
+    last_run_at: datetime | None = None
+
+
+outbox_relay_stats = OutboxRelayStats()
+
+
+async def publish_to_kafka(topic: str, payloads: list[dict[str, Any]]) -> None:
+    with kafka_publish_duration.labels(topic=topic).time():
+        await kafka_router.broker.publish_batch(*payloads, topic=topic)
+    kafka_published_messages.labels(topic=topic).inc(len(payloads))
+
+
+async def relay_outbox() -> None:
+    """Drain outbox to Kafka batch by batch until a partial batch is met."""
+    while True:
+        async with async_session_factory() as session:
+            try:
+                batch = await SqlAlchemyOutboxService(session).publish_pending(
+                    publish_to_kafka, app_settings.OUTBOX_BATCH_SIZE
+                )
+            except Exception:
+                outbox_relay_stats.failures += 1
+                raise
+        now = datetime.now()
+        outbox_relay_stats.last_run_at = now
+        if batch.size:
+            lag = (now - batch.oldest_created_at).total_seconds()
+            outbox_relay_stats.batches += 1
+            outbox_relay_stats.published += batch.size
+            outbox_relay_stats.last_batch_size = batch.size
+            outbox_relay_stats.max_batch_size = max(outbox_relay_stats.max_batch_size, batch.size)
+            outbox_relay_stats.last_lag = lag
+            outbox_relay_stats.max_lag = max(outbox_relay_stats.max_lag, lag)
+        if batch.size < app_settings.OUTBOX_BATCH_SIZE:
+            return
@@ -0,0 +1,8 @@
+from src.infrastructure.sqlalchemy.engine import replica_engine
+from src.infrastructure.sqlalchemy.replica import check_replica_lag
+
+
+async def check_replica() -> None:
+    """Refresh replication lag, reads fall back to primary while it is unknown or too big."""
+    if replica_engine is not None:
+        await check_replica_lag(replica_engine)
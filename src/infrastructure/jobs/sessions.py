@@ -0,0 +1,15 @@
+from src.infrastructure.cache.instances import session_cache
+from src.infrastructure.sqlalchemy.engine import async_session_factory
+from src.infrastructure.sqlalchemy.services import SqlAlchemyAuthService
+
+
+async def revalidate_sessions() -> None:
+    """Evict cached sessions which were deleted by logout in another worker."""
+    session_ids = session_cache.keys()
+    if not session_ids:
+        return
+    async with async_session_factory() as session:
+        existing_ids = await SqlAlchemyAuthService(session).get_existing_session_ids(session_ids)
+    for session_id in session_ids:
+        if session_id not in existing_ids:
+            session_cache.pop(session_id)
@@ -0,0 +1,4 @@
+from src.infrastructure.metrics.exposition import mark_worker_dead, render_metrics
+from src.infrastructure.metrics.sqlalchemy import QueryStats, instrument_engine, request_query_stats
+
+__all__ = ["QueryStats", "instrument_engine", "mark_worker_dead", "render_metrics", "request_query_stats"]
@@ -0,0 +1,23 @@
+import os
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
+
+
+def is_multiprocess() -> bool:
+    # prometheus_client reads the variable itself, each worker then writes its samples to files in the directory
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Render metrics of all workers in Prometheus text format, returns the body and its content type."""
+    if not is_multiprocess():
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead() -> None:
+    """Drop live gauges of the stopped worker, so that they are not summed with the running ones."""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(os.getpid())
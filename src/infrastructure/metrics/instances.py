@@ -0,0 +1,50 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# Buckets in seconds, from a cached response to a large upload
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+# Buckets in bytes, from an empty body to a 64 MiB archive
+SIZE_BUCKETS = tuple(4**power for power in range(3, 14))
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+http_requests_in_progress = Gauge(
+    "http_requests_in_progress",
+    "Requests being handled by the worker",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to sending the last byte of its response",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+http_request_size = Histogram(
+    "http_request_size_bytes", "Size of request bodies", ["method", "route"], buckets=SIZE_BUCKETS
+)
+http_response_size = Histogram(
+    "http_response_size_bytes", "Size of response bodies as sent", ["method", "route"], buckets=SIZE_BUCKETS
+)
+http_request_db_queries = Histogram(
+    "http_request_db_queries", "Database queries made by a request", ["route"], buckets=QUERY_COUNT_BUCKETS
+)
+http_request_db_duration = Histogram(
+    "http_request_db_duration_seconds",
+    "Time a request spent in database queries",
+    ["route"],
+    buckets=LATENCY_BUCKETS,
+)
+
+db_query_duration = Histogram(
+    "db_query_duration_seconds", "Duration of database queries", ["operation"], buckets=LATENCY_BUCKETS
+)
+db_query_errors = Counter("db_query_errors", "Database queries which raised an error", ["operation"])
+
+minio_put_duration = Histogram(
+    "minio_put_object_duration_seconds", "Duration of object uploads to MinIO", buckets=LATENCY_BUCKETS
+)
+minio_put_size = Histogram("minio_put_object_size_bytes", "Size of objects uploaded to MinIO", buckets=SIZE_BUCKETS)
+
+kafka_publish_duration = Histogram(
+    "kafka_publish_duration_seconds", "Duration of publishing a batch to Kafka", ["topic"], buckets=LATENCY_BUCKETS
+)
+kafka_published_messages = Counter("kafka_published_messages", "Messages published to Kafka", ["topic"])
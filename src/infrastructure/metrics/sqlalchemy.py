@@ -0,0 +1,50 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.engine.interfaces import DBAPICursor
+
+from src.infrastructure.metrics.instances import db_query_duration, db_query_errors
+
+OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0
+
+
+# Set by the metrics middleware for every request, queries of background jobs are not attributed to requests
+request_query_stats: ContextVar[QueryStats | None] = ContextVar("request_query_stats", default=None)
+
+
+def get_operation(statement: str) -> str:
+    operation = statement.lstrip().split(" ", 1)[0].upper()
+    return operation if operation in OPERATIONS else "OTHER"
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Measure every query of the engine, the async engine is instrumented through its sync_engine."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_query(conn: Connection, *args: object) -> None:  # noqa: ARG001
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def finish_query(conn: Connection, cursor: DBAPICursor, statement: str, *args: object) -> None:  # noqa: ARG001
+        duration = time.perf_counter() - conn.info["query_started_at"].pop()
+        db_query_duration.labels(operation=get_operation(statement)).observe(duration)
+        stats = request_query_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.duration += duration
+
+    @event.listens_for(engine, "handle_error")
+    def fail_query(context: ExceptionContext) -> None:
+        started_at = context.connection.info.get("query_started_at") if context.connection else None
+        if started_at:
+            started_at.pop()
+        db_query_errors.labels(operation=get_operation(context.statement or "")).inc()
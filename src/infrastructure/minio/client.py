@@ -1,7 +1,14 @@
+import logging
+from datetime import UTC, datetime, timedelta
+
 from miniopy_async import Minio
+from miniopy_async.datatypes import PostPolicy
+from miniopy_async.deleteobjects import DeleteObject
+from miniopy_async.error import S3Error
 
 from src.settings import app_settings
 
+logger = logging.getLogger(__name__)
 
 minio_client = Minio(
     app_settings.s3_endpoint,
@@ -13,3 +20,45 @@ minio_client = Minio(
 def get_s3_client() -> Minio:
     return minio_client
 
+
+async def is_object_exist(client: Minio, object_name: str) -> bool:
+    return await get_object_size(client, object_name) is not None
+
+
+async def get_object_size(client: Minio, object_name: str) -> int | None:
+    """Size of the object in bytes, None if it does not exist."""
+    try:
+        stat = await client.stat_object(app_settings.MINIO_BUCKET, object_name)
+    except S3Error as ex:
+        if ex.code in ("NoSuchKey", "NoSuchObject"):
+            return None
+        raise
+    return stat.size
+
+
+def get_upload_object_name(upload_id: str, artifact: str) -> str:
+    return f"uploads/{upload_id}/{artifact}"
+
+
+async def get_presigned_upload_form(
+    client: Minio, object_name: str, expires: timedelta, max_size: int
+) -> tuple[str, dict[str, str]]:
+    """URL and form fields to POST the object directly into the bucket, the storage rejects bigger files itself."""
+    policy = PostPolicy(app_settings.MINIO_BUCKET, datetime.now(UTC) + expires)
+    policy.add_equals_condition("key", object_name)
+    policy.add_content_length_range_condition(0, max_size)
+    form_data = await client.presigned_post_policy(policy)
+    fields = {name: value.decode() if isinstance(value, bytes) else value for name, value in form_data.items()}
+    fields["key"] = object_name
+    base_url = app_settings.MINIO_PUBLIC_URL or f"http://{app_settings.s3_endpoint}"
+    return f"{base_url.rstrip('/')}/{app_settings.MINIO_BUCKET}", fields
+
+
+async def remove_objects_quietly(client: Minio, object_names: list[str]) -> None:
+    """Remove objects that are no longer needed, failures are only logged."""
+    try:
+        errors = await client.remove_objects(app_settings.MINIO_BUCKET, [DeleteObject(name) for name in object_names])
+        for error in errors:
+            logger.warning("Object %s was not removed: %s", error.name, error.message)
+    except Exception:
+        logger.exception("Objects %s were not removed", object_names)
@@ -0,0 +1,118 @@
+import hashlib
+import zipfile
+from collections.abc import Sequence
+from typing import Protocol
+
+import aiohttp
+from miniopy_async import Minio
+
+
+class ArchiveMember(Protocol):
+    """File read into an archive, UploadFile or StoredObjectFile."""
+
+    filename: str | None
+
+    async def read(self, size: int = -1) -> bytes: ...
+
+    async def seek(self, offset: int) -> None: ...
+
+
+class _ChunkSink:
+    """Write-only file object collecting the bytes produced by ZipFile."""
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self.buffer += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+class ZipArchiveStream:
+    """Async readable stream of a zip archive built on the fly from uploaded files.
+
+    Each member is copied in `chunk_size` pieces, so only the bytes that were
+    requested by the reader (plus one chunk) are kept in memory.
+    """
+
+    def __init__(self, files: Sequence[ArchiveMember], chunk_size: int) -> None:
+        self._files = list(files)
+        self._chunk_size = chunk_size
+        self._sink = _ChunkSink()
+        self._zip_file = zipfile.ZipFile(self._sink, "w")
+        self._current_file: ArchiveMember | None = None
+        self._member = None
+        self._finished = False
+        self.size = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        while not self._finished and (size < 0 or len(self._sink.buffer) < size):
+            await self._produce()
+        if size < 0:
+            size = len(self._sink.buffer)
+        # Copy through a view, slicing bytearray would make one more copy of the part
+        with memoryview(self._sink.buffer) as buffer:
+            data = bytes(buffer[:size])
+        del self._sink.buffer[:size]
+        self.size += len(data)
+        return data
+
+    async def _produce(self) -> None:
+        if self._member is None:
+            if not self._files:
+                self._zip_file.close()
+                self._finished = True
+                return
+            self._current_file = self._files.pop(0)
+            self._member = self._zip_file.open(self._current_file.filename, "w")
+        chunk = await self._current_file.read(self._chunk_size)
+        if chunk:
+            self._member.write(chunk)
+        else:
+            self._member.close()
+            self._member = None
+
+
+async def hash_upload_files(files: Sequence[ArchiveMember], chunk_size: int) -> str:
+    """Get SHA-256 content address of the uploaded files, names included, and rewind them."""
+    digest = hashlib.sha256()
+    for file in files:
+        file_digest = hashlib.sha256()
+        while chunk := await file.read(chunk_size):
+            file_digest.update(chunk)
+        await file.seek(0)
+        digest.update(f"{file.filename}:{file_digest.hexdigest()}\n".encode())
+    return digest.hexdigest()
+
+
+class StoredObjectFile:
+    """Object of the storage read as an uploaded file, so that it can be hashed and archived like one."""
+
+    def __init__(
+        self, client: Minio, session: aiohttp.ClientSession, bucket_name: str, object_name: str, filename: str
+    ) -> None:
+        self.filename = filename
+        self._client = client
+        self._session = session
+        self._bucket_name = bucket_name
+        self._object_name = object_name
+        self._response: aiohttp.ClientResponse | None = None
+
+    async def read(self, size: int = -1) -> bytes:
+        if self._response is None:
+            self._response = await self._client.get_object(self._bucket_name, self._object_name, self._session)
+        return await self._response.content.read(size)
+
+    async def seek(self, offset: int) -> None:
+        """Only rewinding is supported, the object is requested again on the next read."""
+        if offset:
+            raise ValueError("StoredObjectFile can only be rewound")
+        self.close()
+
+    def close(self) -> None:
+        if self._response is not None:
+            self._response.release()
+            self._response = None
@@ -0,0 +1,3 @@
+from src.infrastructure.rate_limit.token_bucket import TokenBucketRateLimitService
+
+__all__ = ["TokenBucketRateLimitService"]
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from src.infrastructure.rate_limit.token_bucket import TokenBucketRateLimitService
+from src.services.rate_limit import RateLimitService
+from src.settings import app_settings
+
+submission_rate_limiter = TokenBucketRateLimitService(
+    capacity=app_settings.SUBMISSION_RATE_LIMIT_CAPACITY,
+    period=app_settings.SUBMISSION_RATE_LIMIT_PERIOD,
+    maxsize=app_settings.SUBMISSION_RATE_LIMIT_MAX_KEYS,
+)
+
+
+def get_submission_rate_limiter() -> RateLimitService:
+    return submission_rate_limiter
+
+
+@dataclass
+class BackpressureStats:
+    pending: int = 0  # last known number of unevaluated submissions
+    rejected: int = 0
+
+
+submission_backpressure_stats = BackpressureStats()
@@ -0,0 +1,40 @@
+import time
+from collections import OrderedDict
+
+from src.services.rate_limit import RateLimitDTO, RateLimitService, RateLimitStatsDTO
+
+
+class TokenBucketRateLimitService(RateLimitService):
+    """In-process token buckets, each key may burst up to capacity requests and then gets one per period.
+
+    At most maxsize least recently used buckets are kept, an evicted key starts again with a full bucket.
+    Intended for a single event loop, so no locking is done.
+    """
+
+    def __init__(self, capacity: int, period: float, maxsize: int) -> None:
+        self.capacity = capacity
+        self.period = period
+        self.maxsize = maxsize
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()  # key -> (tokens, updated_at)
+        self.allowed = 0
+        self.rejected = 0
+
+    async def acquire(self, key: str) -> RateLimitDTO:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - updated_at) / self.period)
+        if tokens >= 1:
+            tokens -= 1
+            self.allowed += 1
+            result = RateLimitDTO(allowed=True, retry_after=0)
+        else:
+            self.rejected += 1
+            result = RateLimitDTO(allowed=False, retry_after=(1 - tokens) * self.period)
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.maxsize:
+            self._buckets.popitem(last=False)
+        return result
+
+    def stats(self) -> RateLimitStatsDTO:
+        return RateLimitStatsDTO(keys=len(self._buckets), allowed=self.allowed, rejected=self.rejected)
@@ -1,17 +1,79 @@
 from collections.abc import AsyncGenerator
 from typing import Any
+from uuid import uuid4
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from src.infrastructure.metrics import instrument_engine
+from src.infrastructure.sqlalchemy.pool import InstrumentedAsyncQueuePool, PoolStats
+from src.infrastructure.sqlalchemy.replica import replica_status
 from src.settings import app_settings
 
-async_engine = create_async_engine(url=app_settings.db_url, echo=app_settings.is_dev)
+
+def get_connect_args() -> dict[str, Any]:
+    connect_args: dict[str, Any] = {
+        "statement_cache_size": app_settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": app_settings.DB_STATEMENT_CACHE_SIZE,
+    }
+    if not app_settings.DB_STATEMENT_CACHE_SIZE:
+        # Server connections are shared between clients, so names of prepared statements must not collide.
+        # PgBouncer rejects statement_timeout as a startup parameter and a SET would leak to other clients,
+        # so the timeout is left to the database role
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+    elif app_settings.DB_STATEMENT_TIMEOUT:
+        connect_args["server_settings"] = {"statement_timeout": str(app_settings.DB_STATEMENT_TIMEOUT)}
+    return connect_args
+
+
+def create_engine(url: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url=url,
+        echo=app_settings.is_dev,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=app_settings.DB_POOL_SIZE,
+        max_overflow=app_settings.DB_MAX_OVERFLOW,
+        pool_timeout=app_settings.DB_POOL_TIMEOUT,
+        pool_recycle=app_settings.DB_POOL_RECYCLE,
+        pool_pre_ping=app_settings.DB_POOL_PRE_PING,
+        connect_args=get_connect_args(),
+    )
+    instrument_engine(engine.sync_engine)
+    return engine
+
+
+def get_pool_stats(engine: AsyncEngine) -> PoolStats:
+    return engine.sync_engine.pool.stats()
+
+
+async_engine = create_engine(app_settings.db_url)
 async_session_factory = async_sessionmaker(
     bind=async_engine,
     autocommit=False,
     autoflush=False,
 )
 
+replica_engine = create_engine(app_settings.replica_db_url) if app_settings.replica_db_url else None
+replica_session_factory = (
+    async_sessionmaker(bind=replica_engine, autocommit=False, autoflush=False) if replica_engine else None
+)
+
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, Any]:
     async with async_session_factory() as session:
         yield session
+
+
+def get_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Replica sessions while recently checked replication lag is within DB_REPLICA_MAX_LAG, primary ones otherwise.
+
+    Requests which write or read their own writes must use primary sessions.
+    """
+    if replica_session_factory is not None and replica_status.is_fresh(
+        app_settings.DB_REPLICA_MAX_LAG, app_settings.replica_status_max_age
+    ):
+        return replica_session_factory
+    return async_session_factory
+
+
+async def get_read_async_session() -> AsyncGenerator[AsyncSession, Any]:
+    async with get_read_session_factory()() as session:
+        yield session
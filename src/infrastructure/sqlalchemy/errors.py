@@ -0,0 +1,21 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.services.exceptions import AlreadyExistError
+
+UNIQUE_VIOLATION = "23505"
+
+
+@asynccontextmanager
+async def unique_violation_as_already_exist(session: AsyncSession, message: str) -> AsyncIterator[None]:
+    """Rely on unique constraints instead of checking for duplicates before writing."""
+    try:
+        yield
+    except IntegrityError as ex:
+        await session.rollback()
+        if getattr(ex.orig, "pgcode", None) == UNIQUE_VIOLATION:
+            raise AlreadyExistError(message=message) from ex
+        raise
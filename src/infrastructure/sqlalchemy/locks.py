@@ -0,0 +1,30 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Keys of session-level advisory locks, unique within the database
+FORK_REVALIDATION_LOCK = 1
+
+
+@asynccontextmanager
+async def try_advisory_lock(engine: AsyncEngine, key: int) -> AsyncIterator[bool]:
+    """Take the advisory lock without waiting, yields whether it was taken.
+
+    Lets one worker of all Granian processes run a periodic job while the others skip it.
+    """
+    async with engine.connect() as conn:
+        is_locked = (await conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": key})).scalar_one()
+        await conn.commit()
+        try:
+            yield is_locked
+        finally:
+            if is_locked:
+                try:
+                    await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                    await conn.commit()
+                except Exception:
+                    # Pooled connection must not keep holding the lock, closing it releases the lock
+                    await conn.invalidate()
+                    raise
@@ -0,0 +1,43 @@
+"""One-off move of LLM reports stored inline in submissions to submission_reports.
+
+Run once after the version with submission_reports is deployed, it is safe to run again:
+
+    python -m src.infrastructure.sqlalchemy.migrate_reports
+"""
+
+import asyncio
+
+from sqlalchemy import text
+
+from src.infrastructure.sqlalchemy.engine import async_engine
+from src.infrastructure.sqlalchemy.scripts import create_tables, disable_statement_timeout
+
+# Reports are moved uncompressed, the column is dropped in the same transaction
+MOVE_REPORTS = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'submissions' AND column_name = 'llm_report'
+    ) THEN
+        INSERT INTO submission_reports (submission_id, content, content_encoding, size)
+        SELECT submission_id, convert_to(llm_report, 'UTF8'), 'identity', octet_length(llm_report)
+        FROM submissions
+        WHERE llm_report <> ''
+        ON CONFLICT (submission_id) DO NOTHING;
+        ALTER TABLE submissions DROP COLUMN llm_report;
+    END IF;
+END $$
+"""
+
+
+async def migrate_reports() -> None:
+    await create_tables(async_engine)
+    async with async_engine.begin() as conn:
+        await disable_statement_timeout(conn)
+        await conn.execute(text(MOVE_REPORTS))
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate_reports())
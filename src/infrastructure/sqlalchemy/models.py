@@ -1,7 +1,8 @@
 from datetime import datetime
+from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import func
+from sqlalchemy import JSON, Index, LargeBinary, func, text
 from sqlalchemy.orm import relationship
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -32,6 +33,23 @@ class Session(SQLModel, table=True):
 
 class Student(SQLModel, table=True):
     __tablename__ = "students"
+    __table_args__ = (
+        # Keyset pagination of the newest first page
+        Index("ix_students_registered_at_student_id", "registered_at", "student_id"),
+        # Substring and similarity search, requires pg_trgm
+        Index(
+            "ix_students_gh_username_trgm",
+            "gh_username",
+            postgresql_using="gin",
+            postgresql_ops={"gh_username": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_students_tg_username_trgm",
+            "tg_username",
+            postgresql_using="gin",
+            postgresql_ops={"tg_username": "gin_trgm_ops"},
+        ),
+    )
 
     student_id: UUID = Field(default_factory=uuid4, primary_key=True)
     tg_user_id: int = Field(nullable=False, unique=True)
@@ -40,6 +58,19 @@ class Student(SQLModel, table=True):
     registered_at: datetime = Field(default_factory=datetime.now)
 
 
+# Case-insensitive prefix search for autocomplete, expressions can only be indexed after the columns are defined
+Index(
+    "ix_students_gh_username_prefix",
+    func.lower(Student.gh_username).label("gh_username_lower"),
+    postgresql_ops={"gh_username_lower": "text_pattern_ops"},
+)
+Index(
+    "ix_students_tg_username_prefix",
+    func.lower(Student.tg_username).label("tg_username_lower"),
+    postgresql_ops={"tg_username_lower": "text_pattern_ops"},
+)
+
+
 class Task(SQLModel, table=True):
     __tablename__ = "tasks"
 
@@ -55,6 +86,18 @@ class Task(SQLModel, table=True):
 
 class Submission(SQLModel, table=True):
     __tablename__ = "submissions"
+    __table_args__ = (
+        Index("ix_submissions_created_at_submission_id", "created_at", "submission_id"),
+        Index("ix_submissions_task_id_created_at", "task_id", "created_at", "submission_id"),
+        Index("ix_submissions_student_id_created_at", "student_id", "created_at", "submission_id"),
+        Index("ix_submissions_content_hash", "task_id", "student_id", "content_hash"),
+        Index(
+            "ix_submissions_pending_created_at",
+            "created_at",
+            "submission_id",
+            postgresql_where=text("evaluated_at IS NULL"),
+        ),
+    )
 
     submission_id: UUID = Field(default_factory=uuid4, primary_key=True)
     task_id: UUID = Field(foreign_key="tasks.task_id")
@@ -62,14 +105,45 @@ class Submission(SQLModel, table=True):
     gh_repo_url: str = Field(nullable=False)
     gh_pull_request_number: int = Field(nullable=False)
     code_file_name: str = Field(nullable=False)
+    content_hash: str | None = Field(default=None, nullable=True)
 
     llm_grade: str = Field(default="")
     llm_feedback: str = Field(default="")
-    llm_report: str = Field(default="")
     evaluated_at: datetime | None = Field(default=None)
     created_at: datetime = Field(default_factory=datetime.now)
 
 
+class SubmissionUpload(SQLModel, table=True):
+    """Direct upload started by POST /api/submissions/uploads, deleted when the submission is created from it."""
+
+    __tablename__ = "submission_uploads"
+
+    upload_id: UUID = Field(default_factory=uuid4, primary_key=True)
+    task_id: UUID = Field(foreign_key="tasks.task_id", ondelete="CASCADE")
+    student_id: UUID = Field(foreign_key="students.student_id", ondelete="CASCADE")
+    expires_at: datetime = Field(nullable=False, index=True)
+
+
+class SubmissionReport(SQLModel, table=True):
+    __tablename__ = "submission_reports"
+
+    submission_id: UUID = Field(foreign_key="submissions.submission_id", primary_key=True, ondelete="CASCADE")
+    content: bytes = Field(sa_type=LargeBinary, nullable=False)
+    content_encoding: str = Field(nullable=False)  # "gzip" or "identity"
+    size: int = Field(nullable=False)  # bytes before compression
+
+
+class Fork(SQLModel, table=True):
+    __tablename__ = "forks"
+
+    gh_full_name: str = Field(primary_key=True)  # "owner/repository" in lower case
+    gh_repo_url: str = Field(nullable=False)
+    task_id: UUID = Field(foreign_key="tasks.task_id", ondelete="CASCADE")
+    student_id: UUID = Field(foreign_key="students.student_id", ondelete="CASCADE")
+    created_at: datetime = Field(default_factory=datetime.now)
+    validated_at: datetime = Field(default_factory=datetime.now, index=True)
+
+
 class Complaint(SQLModel, table=True):
     __tablename__ = "complaints"
 
@@ -79,3 +153,12 @@ class Complaint(SQLModel, table=True):
     student_request: str = Field(nullable=False)
     teacher_response: str = Field(nullable=False, default="")
     created_at: datetime = Field(default_factory=datetime.now)
+
+
+class OutboxMessage(SQLModel, table=True):
+    __tablename__ = "outbox"
+
+    message_id: UUID = Field(default_factory=uuid4, primary_key=True)
+    topic: str = Field(nullable=False)
+    payload: dict[str, Any] = Field(sa_type=JSON, nullable=False)
+    created_at: datetime = Field(default_factory=datetime.now, index=True)
@@ -0,0 +1,74 @@
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+
+@dataclass
+class PoolStats:
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    overflow_connections: int
+    timeouts: int
+    total_wait: float
+    max_wait: float
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool which counts how long requests wait for a connection.
+
+    Pool starvation shows up as growing wait time and timeouts, while overflow connections mean
+    that pool size is too small for the usual load.
+    """
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.overflow_connections = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        overflow = self._overflow
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            wait = time.perf_counter() - started_at
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+        self.checkouts += 1
+        if self._overflow > max(overflow, 0):
+            self.overflow_connections += 1
+        return connection
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        # engine.dispose() replaces the pool, counters survive it
+        pool = super().recreate()
+        pool.checkouts = self.checkouts
+        pool.overflow_connections = self.overflow_connections
+        pool.timeouts = self.timeouts
+        pool.total_wait = self.total_wait
+        pool.max_wait = self.max_wait
+        return pool
+
+    def stats(self) -> PoolStats:
+        return PoolStats(
+            size=self.size(),
+            checked_out=self.checkedout(),
+            idle=self.checkedin(),
+            overflow=max(self.overflow(), 0),
+            checkouts=self.checkouts,
+            overflow_connections=self.overflow_connections,
+            timeouts=self.timeouts,
+            total_wait=self.total_wait,
+            max_wait=self.max_wait,
+        )
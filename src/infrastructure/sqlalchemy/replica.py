@@ -0,0 +1,52 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.settings import app_settings
+
+# Replay timestamp stops moving while primary is idle, so a replica that replayed all received WAL has no lag.
+# That holds only while WAL is streamed, a replica cut off from primary has replayed all it got too, so its
+# lag is unknown (NULL). Status is visible to pg_read_all_stats only, other roles see the receiver process alone
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT EXISTS (
+            SELECT 1 FROM pg_stat_wal_receiver WHERE COALESCE(status, 'streaming') = 'streaming'
+        ) THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+@dataclass
+class ReplicaStatus:
+    lag: float | None = None  # seconds, None until the replica is checked or when the check failed
+    checked_at: datetime | None = None
+    failures: int = 0
+
+    def is_fresh(self, max_lag: float, max_age: float) -> bool:
+        """Whether the replica lags at most max_lag by a check made at most max_age seconds ago."""
+        if self.lag is None or self.checked_at is None:
+            return False
+        return self.lag <= max_lag and (datetime.now() - self.checked_at).total_seconds() <= max_age
+
+
+replica_status = ReplicaStatus()
+
+
+async def check_replica_lag(engine: AsyncEngine) -> None:
+    try:
+        async with asyncio.timeout(app_settings.DB_REPLICA_LAG_CHECK_TIMEOUT), engine.connect() as conn:
+            lag = (await conn.execute(REPLICA_LAG_QUERY)).scalar_one()
+    except Exception:
+        replica_status.lag = None
+        replica_status.failures += 1
+        raise
+    finally:
+        replica_status.checked_at = datetime.now()
+    replica_status.lag = float(lag) if lag is not None else None
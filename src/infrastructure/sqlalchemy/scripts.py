@@ -1,31 +1,86 @@
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import select
 
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from src.infrastructure.sqlalchemy.engine import async_engine
 from src.infrastructure.sqlalchemy.models import SQLModel, User
 from src.services.auth import Role
 from src.services.password import PasswordService
 from src.settings import app_settings
 
 
+# Extensions used by indexes, created before tables
+DATABASE_EXTENSIONS = ["pg_trgm"]
+
+# Columns added to already existing tables, create_all() does not alter them
+SCHEMA_UPGRADES = [
+    "ALTER TABLE submissions ADD COLUMN IF NOT EXISTS content_hash VARCHAR",
+    # Reports were stored inline in submissions, new submissions do not set the column until
+    # python -m src.infrastructure.sqlalchemy.migrate_reports moves them out and drops it
+    """
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'submissions' AND column_name = 'llm_report' AND is_nullable = 'NO'
+        ) THEN
+            ALTER TABLE submissions ALTER COLUMN llm_report DROP NOT NULL;
+        END IF;
+    END $$
+    """,
+]
+
+
+async def disable_statement_timeout(conn: AsyncConnection) -> None:
+    # Migrations of big tables and index builds may take longer than DB_STATEMENT_TIMEOUT of regular queries
+    await conn.execute(text("SET LOCAL statement_timeout = 0"))
+
+
+async def create_extensions(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        for extension in DATABASE_EXTENSIONS:
+            await conn.execute(text(f"CREATE EXTENSION IF NOT EXISTS {extension}"))
+
+
 async def create_tables(engine: AsyncEngine) -> None:
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
+async def upgrade_tables(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await disable_statement_timeout(conn)
+        for statement in SCHEMA_UPGRADES:
+            await conn.execute(text(statement))
+
+
+async def create_indexes(engine: AsyncEngine) -> None:
+    # create_all() skips indexes of already existing tables
+    async with engine.begin() as conn:
+        await disable_statement_timeout(conn)
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                await conn.run_sync(index.create, checkfirst=True)
+
+
 async def create_admin_user(engine: AsyncEngine, login: str, password: str) -> None:
     async with AsyncSession(engine) as session:
-        query = select(User).where(User.login == login)
-        result = await session.execute(query)
-        user = result.scalar_one_or_none()
-        if not user:
-            hashed_password, salt = PasswordService.create_hashed_password_and_salt(password)
-            user = User(login=login, salt=salt, hashed_password=hashed_password, role=Role.ADMIN.value)
-            session.add(user)
-            await session.commit()
+        # Every worker runs it on startup, the password is hashed only while there is no admin yet
+        if (await session.execute(select(User.user_id).where(User.login == login))).first() is not None:
+            return
+        hashed_password, salt = await PasswordService.async_create_hashed_password_and_salt(password)
+        user = User(login=login, salt=salt, hashed_password=hashed_password, role=Role.ADMIN.value)
+        # Workers starting at once may all get here, the first one creates the admin
+        query = insert(User).values(user.model_dump()).on_conflict_do_nothing(index_elements=[User.login])
+        await session.execute(query)
+        await session.commit()
 
 
 async def init_database() -> None:
-    engine = create_async_engine(url=app_settings.db_url, echo=app_settings.is_dev)
-    await create_tables(engine)
+    await create_extensions(async_engine)
+    await create_tables(async_engine)
+    await upgrade_tables(async_engine)
+    await create_indexes(async_engine)
 
-    await create_admin_user(engine, app_settings.ADMIN_USER, app_settings.ADMIN_PASSWORD)
+    await create_admin_user(async_engine, app_settings.ADMIN_USER, app_settings.ADMIN_PASSWORD)
@@ -3,5 +3,15 @@ from src.infrastructure.sqlalchemy.services.students import SqlAlchemyStudentSer
 from src.infrastructure.sqlalchemy.services.tasks import SqlAlchemyTaskService
 from src.infrastructure.sqlalchemy.services.submissions import SqlAlchemySubmissionService
 from src.infrastructure.sqlalchemy.services.complaints import SqlAlchemyComplaintService
+from src.infrastructure.sqlalchemy.services.forks import SqlAlchemyForkService
+from src.infrastructure.sqlalchemy.services.outbox import SqlAlchemyOutboxService
 
-__all__ = ["SqlAlchemyAuthService", "SqlAlchemyStudentService", "SqlAlchemyTaskService", "SqlAlchemySubmissionService", "SqlAlchemyComplaintService"]
+__all__ = [
+    "SqlAlchemyAuthService",
+    "SqlAlchemyComplaintService",
+    "SqlAlchemyForkService",
+    "SqlAlchemyOutboxService",
+    "SqlAlchemyStudentService",
+    "SqlAlchemySubmissionService",
+    "SqlAlchemyTaskService",
+]
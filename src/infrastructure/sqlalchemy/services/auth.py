@@ -1,14 +1,17 @@
 from datetime import datetime, timedelta
 from uuid import UUID
 
-from sqlmodel import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import col, delete, select
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
+from src.infrastructure.cache.instances import session_cache
 from src.infrastructure.sqlalchemy.models import Session, User
 from src.services.auth import (
     SESSION_TTL,
     AuthService,
+    SessionDTO,
     TokenDTO,
     UserDTO,
 )
@@ -24,7 +27,7 @@ class SqlAlchemyAuthService(AuthService):
         user = await self._get_user_by_login(login)
         if not user:
             raise NotFoundError(message="Пользователь с таким именем не существует")
-        is_verified = PasswordService.verify_password(password, user.hashed_password, user.salt)
+        is_verified = await PasswordService.async_verify_password(password, user.hashed_password, user.salt)
         if not is_verified:
             raise InvalidPropertyError(message="Пароль неправильный")
         expired_datetime = datetime.now() + timedelta(days=SESSION_TTL)
@@ -35,32 +38,57 @@ class SqlAlchemyAuthService(AuthService):
         return TokenDTO(token=str(session.session_id))
 
     async def register(self, login: str, password: str, role: str) -> None:
-        existing_user = await self._get_user_by_login(login)
-        if existing_user:
-            raise AlreadyExistError(message="Пользователь с таким именем уже существует")
-        hashed_password, salt = PasswordService.create_hashed_password_and_salt(password)
+        hashed_password, salt = await PasswordService.async_create_hashed_password_and_salt(password)
         user = User(login=login, salt=salt, hashed_password=hashed_password, role=role)
-        self.session.add(user)
+        query = (
+            insert(User)
+            .values(user.model_dump())
+            .on_conflict_do_nothing(index_elements=[User.login])
+            .returning(User.user_id)
+        )
+        result = await self.session.execute(query)
+        if result.scalar_one_or_none() is None:
+            await self.session.rollback()
+            raise AlreadyExistError(message="Пользователь с таким именем уже существует")
         await self.session.commit()
 
     async def get_user(self, session_id: str) -> UserDTO:
-        # Check user
-        query = select(User).join(Session).where(Session.session_id == UUID(session_id))
+        cached_session = session_cache.get(session_id)
+        if cached_session is None:
+            cached_session = await self._get_session(session_id)
+            ttl = (cached_session.expired_at - datetime.now()).total_seconds()
+            session_cache.set(session_id, cached_session, ttl=ttl)
+        if cached_session.expired_at < datetime.now():
+            session_cache.pop(session_id)
+            raise NotFoundError(message="Срок действия сессии истек, требуется перезайти в аккаунт")
+        return cached_session.user
+
+    async def logout(self, session_id: str) -> None:
+        session_cache.pop(session_id)
+        query = delete(Session).where(Session.session_id == UUID(session_id))
+        await self.session.execute(query)
+        await self.session.commit()
+
+    async def get_existing_session_ids(self, session_ids: list[str]) -> set[str]:
+        query = select(Session.session_id).where(col(Session.session_id).in_([UUID(sid) for sid in session_ids]))
         result = await self.session.execute(query)
-        user = result.scalar_one_or_none()
-        if not user:
-            raise NotFoundError(message="Пользователь не найден")
-        # Check session
-        query = select(Session).where(Session.session_id == UUID(session_id))
+        return {str(session_id) for session_id in result.scalars()}
+
+    async def _get_session(self, session_id: str) -> SessionDTO:
+        query = select(User, Session.expired_at).join(Session).where(Session.session_id == UUID(session_id))
         result = await self.session.execute(query)
-        session = result.scalar_one_or_none()
-        if session.expired_at < datetime.now():
-            raise NotFoundError(message="Срок действия сессии истек, требуется перезайти в аккаунт")
-        return UserDTO(
-            user_id=str(user.user_id),
-            login=user.login,
-            role=user.role,
-            created_at=user.created_at,
+        row = result.one_or_none()
+        if not row:
+            raise NotFoundError(message="Пользователь не найден")
+        user, expired_at = row
+        return SessionDTO(
+            user=UserDTO(
+                user_id=str(user.user_id),
+                login=user.login,
+                role=user.role,
+                created_at=user.created_at,
+            ),
+            expired_at=expired_at,
         )
 
     async def _get_user_by_login(self, login: str) -> User | None:
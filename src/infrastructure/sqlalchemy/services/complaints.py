@@ -1,10 +1,10 @@
 from uuid import UUID
 
-from sqlmodel import select, desc
+from sqlmodel import select, desc, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.infrastructure.sqlalchemy.models import Complaint
+from src.infrastructure.sqlalchemy.models import Complaint, Student
 from src.services.exceptions import NotFoundError
-from src.services.complaints import ComplaintDTO, ComplaintService
+from src.services.complaints import ComplaintAnswerDTO, ComplaintDTO, ComplaintService
 
 
 class SqlAlchemyComplaintService(ComplaintService):
@@ -16,16 +16,40 @@ class SqlAlchemyComplaintService(ComplaintService):
         self.session.add(complaint)
         await self.session.commit()
 
-    async def answer_complaint(self, complaint_id: str, teacher_text: str) -> None:
-        complaint = await self._get_complaint_by_id(complaint_id)
-        complaint.teacher_response = teacher_text
-        self.session.add(complaint)
-        await self.session.commit()
+    async def answer_complaint(
+        self, complaint_id: str, teacher_text: str, *, commit: bool = True
+    ) -> ComplaintAnswerDTO:
+        # Correlated lookup by primary key, so the bot notification needs no extra round-trip
+        student_telegram_user_id = (
+            select(Student.tg_user_id).where(Student.student_id == Complaint.student_id).scalar_subquery()
+        )
+        query = (
+            update(Complaint)
+            .where(Complaint.complaint_id == UUID(complaint_id))
+            .values(teacher_response=teacher_text)
+            .returning(Complaint, student_telegram_user_id)
+        )
+        result = await self.session.execute(
+            query, execution_options={"synchronize_session": False, "populate_existing": True}
+        )
+        row = result.one_or_none()
+        if not row:
+            error_message = f"Жалоба с ID {complaint_id} не найдена"
+            raise NotFoundError(error_message)
+        complaint, student_telegram_user_id = row
+        answer = ComplaintAnswerDTO(
+            complaint=self.from_model_to_dto(complaint),
+            student_telegram_user_id=student_telegram_user_id,
+        )
+        if commit:
+            await self.session.commit()
+        return answer
 
     async def get_complaints(self) -> list[ComplaintDTO]:
-        query = select(Complaint).order_by(desc(Complaint.created_at))
+        # Core rows instead of ORM instances, from_model_to_dto() reads them by the same attribute names
+        query = select(*Complaint.__table__.columns).order_by(desc(Complaint.created_at))
         result = await self.session.execute(query)
-        complaints = result.scalars().all()
+        complaints = result.all()
         return [self.from_model_to_dto(complaint) for complaint in complaints]
 
     async def get_complaint_by_id(self, complaint_id: str) -> ComplaintDTO:
@@ -0,0 +1,91 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import delete, func, select, update
+
+from src.infrastructure.sqlalchemy.models import Fork, Student
+from src.services.exceptions import NotFoundError
+from src.services.forks import ForkDTO, ForkService
+
+
+class SqlAlchemyForkService(ForkService):
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_fork(self, github_full_name: str) -> ForkDTO:
+        # Fork is not found once its owner is no longer the GitHub username of the student, e.g. after relinking
+        github_owner = github_full_name.split("/", 1)[0]
+        query = (
+            select(Fork)
+            .join(Student, Student.student_id == Fork.student_id)
+            .where(
+                Fork.gh_full_name == github_full_name.lower(),
+                func.lower(Student.gh_username) == github_owner.lower(),
+            )
+        )
+        result = await self.session.execute(query)
+        fork = result.scalar_one_or_none()
+        if not fork:
+            raise NotFoundError(message=f"Форк {github_full_name} не зарегистрирован")
+        return self.from_model_to_dto(fork)
+
+    async def get_forks(self) -> list[ForkDTO]:
+        query = select(Fork).order_by(Fork.created_at)
+        result = await self.session.execute(query)
+        return [self.from_model_to_dto(fork) for fork in result.scalars().all()]
+
+    async def register_fork(
+        self, github_full_name: str, github_repo_url: str, task_id: str, student_id: str
+    ) -> ForkDTO:
+        now = datetime.now()
+        query = insert(Fork).values(
+            gh_full_name=github_full_name.lower(),
+            gh_repo_url=github_repo_url,
+            task_id=UUID(task_id),
+            student_id=UUID(student_id),
+            created_at=now,
+            validated_at=now,
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[Fork.gh_full_name],
+            set_={
+                "gh_repo_url": query.excluded.gh_repo_url,
+                "task_id": query.excluded.task_id,
+                "student_id": query.excluded.student_id,
+                "validated_at": query.excluded.validated_at,
+            },
+        ).returning(Fork)
+        result = await self.session.execute(query, execution_options={"populate_existing": True})
+        fork = result.scalar_one()
+        await self.session.commit()
+        return self.from_model_to_dto(fork)
+
+    async def get_stale_forks(self, validated_before: datetime, limit: int) -> list[ForkDTO]:
+        query = select(Fork).where(Fork.validated_at < validated_before).order_by(Fork.validated_at).limit(limit)
+        result = await self.session.execute(query)
+        return [self.from_model_to_dto(fork) for fork in result.scalars().all()]
+
+    async def mark_validated(self, github_full_name: str) -> None:
+        query = update(Fork).where(Fork.gh_full_name == github_full_name.lower()).values(validated_at=datetime.now())
+        await self.session.execute(query)
+        await self.session.commit()
+
+    async def remove_fork(self, github_full_name: str) -> None:
+        query = delete(Fork).where(Fork.gh_full_name == github_full_name.lower()).returning(Fork.gh_full_name)
+        result = await self.session.execute(query)
+        if result.scalar_one_or_none() is None:
+            raise NotFoundError(message=f"Форк {github_full_name} не зарегистрирован")
+        await self.session.commit()
+
+    @staticmethod
+    def from_model_to_dto(model: Fork) -> ForkDTO:
+        return ForkDTO(
+            github_full_name=model.gh_full_name,
+            github_repo_url=model.gh_repo_url,
+            task_id=str(model.task_id),
+            student_id=str(model.student_id),
+            created_at=model.created_at,
+            validated_at=model.validated_at,
+        )
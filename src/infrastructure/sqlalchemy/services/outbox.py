@@ -0,0 +1,43 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col, delete, select
+
+from src.infrastructure.sqlalchemy.models import OutboxMessage
+from src.services.outbox import OutboxBatchDTO, OutboxPublisher, OutboxService
+
+
+class SqlAlchemyOutboxService(OutboxService):
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def add_event(self, topic: str, payload: dict[str, Any]) -> None:
+        self.session.add(OutboxMessage(topic=topic, payload=payload))
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def publish_pending(self, publish: OutboxPublisher, batch_size: int) -> OutboxBatchDTO:
+        query = (
+            select(OutboxMessage).order_by(OutboxMessage.created_at).limit(batch_size).with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(query)
+        messages = result.scalars().all()
+        if not messages:
+            await self.session.rollback()
+            return OutboxBatchDTO(size=0, oldest_created_at=None)
+
+        payloads_by_topic: dict[str, list[dict[str, Any]]] = {}
+        for message in messages:
+            payloads_by_topic.setdefault(message.topic, []).append(message.payload)
+        try:
+            for topic, payloads in payloads_by_topic.items():
+                await publish(topic, payloads)
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        query = delete(OutboxMessage).where(col(OutboxMessage.message_id).in_([m.message_id for m in messages]))
+        await self.session.execute(query)
+        await self.session.commit()
+        return OutboxBatchDTO(size=len(messages), oldest_created_at=messages[0].created_at)
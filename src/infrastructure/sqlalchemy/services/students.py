@@ -1,44 +1,140 @@
-from sqlmodel import col, or_, select
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import Float, any_, bindparam, cast, literal, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlmodel import col, desc, func, or_, select, update
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.sqlalchemy.errors import unique_violation_as_already_exist
 from src.infrastructure.sqlalchemy.models import Student
 from src.services.exceptions import NotFoundError, AlreadyExistError
-from src.services.stundents import StudentDTO, StudentService
+from src.services.stundents import NewStudentDTO, StudentCursorDTO, StudentDTO, StudentPageDTO, StudentService
 
 
 class SqlAlchemyStudentService(StudentService):
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def get_all(self, username: str = "") -> list[StudentDTO]:
-        query = select(Student)
-        if username:
+    async def get_all(
+        self, username: str = "", limit: int = 100, cursor: StudentCursorDTO | None = None, *, prefix: bool = False
+    ) -> StudentPageDTO:
+        if not username:
+            return await self._get_newest(limit, cursor)
+
+        gh_username, tg_username = col(Student.gh_username), col(Student.tg_username)
+        if prefix:
+            # Served by the lower(...) text_pattern_ops indexes
+            condition = or_(
+                func.lower(gh_username).startswith(username.lower(), autoescape=True),
+                func.lower(tg_username).startswith(username.lower(), autoescape=True),
+            )
+        else:
+            # Served by the trigram indexes, % also finds usernames with typos
+            condition = or_(
+                gh_username.icontains(username, autoescape=True),
+                tg_username.icontains(username, autoescape=True),
+                gh_username.op("%")(username),
+                tg_username.op("%")(username),
+            )
+        # greatest() skips NULL, so students without GitHub profile are ranked by Telegram username
+        score = cast(
+            func.greatest(func.similarity(gh_username, username), func.similarity(tg_username, username)), Float
+        )
+        # Core rows instead of ORM instances, from_model_to_dto() reads them by the same attribute names
+        query = select(*Student.__table__.columns, score.label("score")).where(condition)
+        if cursor and cursor.score is not None:
+            query = query.where(
+                tuple_(score, Student.student_id)
+                < tuple_(literal(cursor.score, Float), literal(UUID(cursor.student_id)))
+            )
+        query = query.order_by(desc(score), desc(Student.student_id)).limit(limit + 1)
+        result = await self.session.execute(query)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = StudentCursorDTO(student_id=str(last.student_id), score=last.score)
+        return StudentPageDTO(
+            items=[self.from_model_to_dto(row) for row in rows],
+            next_cursor=next_cursor,
+        )
+
+    async def _get_newest(self, limit: int, cursor: StudentCursorDTO | None) -> StudentPageDTO:
+        query = select(*Student.__table__.columns)
+        if cursor and cursor.registered_at is not None:
             query = query.where(
-                or_(
-                    col(Student.gh_username).ilike(f"%{username}%"),
-                    col(Student.tg_username).ilike(f"%{username}%"),
-                )
+                tuple_(Student.registered_at, Student.student_id)
+                < tuple_(literal(cursor.registered_at), literal(UUID(cursor.student_id)))
             )
+        query = query.order_by(desc(Student.registered_at), desc(Student.student_id)).limit(limit + 1)
         result = await self.session.execute(query)
-        students = result.scalars().all()
-        return [self.from_model_to_dto(student) for student in students]
+        students = result.all()
+
+        next_cursor = None
+        if len(students) > limit:
+            students = students[:limit]
+            last = students[-1]
+            next_cursor = StudentCursorDTO(student_id=str(last.student_id), registered_at=last.registered_at)
+        return StudentPageDTO(
+            items=[self.from_model_to_dto(student) for student in students],
+            next_cursor=next_cursor,
+        )
 
     async def create(self, telegram_user_id: int, telegram_username: str) -> None:
-        existing_student = await self._get_student_by_telegram_user_id(telegram_user_id)
-        if existing_student:
-            raise AlreadyExistError("Студент с таким профилем в телеграмме уже зарегистрирован")
         student = Student(tg_user_id=telegram_user_id, tg_username=telegram_username)
-        self.session.add(student)
+        query = (
+            insert(Student)
+            .values(student.model_dump())
+            .on_conflict_do_nothing(index_elements=[Student.tg_user_id])
+            .returning(Student.student_id)
+        )
+        result = await self.session.execute(query)
+        if result.scalar_one_or_none() is None:
+            await self.session.rollback()
+            raise AlreadyExistError("Студент с таким профилем в телеграмме уже зарегистрирован")
+        await self.session.commit()
+
+    async def create_many(self, students: list[NewStudentDTO]) -> set[int]:
+        if not students:
+            return set()
+        query = (
+            insert(Student)
+            .values(
+                [
+                    {
+                        "student_id": uuid4(),
+                        "tg_user_id": student.telegram_user_id,
+                        "tg_username": student.telegram_username,
+                        "gh_username": student.github_username,
+                        "registered_at": datetime.now(),
+                    }
+                    for student in students
+                ]
+            )
+            .on_conflict_do_nothing()
+            .returning(Student.tg_user_id)
+        )
+        result = await self.session.execute(query)
+        created = set(result.scalars().all())
         await self.session.commit()
+        return created
 
     async def set_github_username(self, telegram_user_id: int, github_username: str) -> None:
-        student = await self._get_student_by_telegram_user_id(telegram_user_id)
-        if not student:
+        query = (
+            update(Student)
+            .where(Student.tg_user_id == telegram_user_id)
+            .values(gh_username=github_username)
+            .returning(Student.student_id)
+        )
+        async with unique_violation_as_already_exist(
+            self.session, "Студент с таким GitHub профилем уже зарегистрирован"
+        ):
+            result = await self.session.execute(query, execution_options={"synchronize_session": False})
+        if result.scalar_one_or_none() is None:
             raise NotFoundError(f"Студента с привязанным Telegram профилем не существует")
-        existing_student = await self._get_student_by_github_username(github_username)
-        if existing_student:
-            raise AlreadyExistError("Студент с таким GitHub профилем уже зарегистрирован")
-        student.gh_username = github_username
         await self.session.commit()
 
     async def get_by_github_username(self, github_username: str) -> StudentDTO:
@@ -61,6 +157,26 @@ class SqlAlchemyStudentService(StudentService):
             raise NotFoundError(f"Студента с таким идентификатором не существует")
         return self.from_model_to_dto(student)
 
+    async def get_many(
+        self, telegram_user_ids: list[int] | None = None, github_usernames: list[str] | None = None
+    ) -> list[StudentDTO]:
+        conditions = []
+        # Arrays keep one prepared statement for any number of values, unlike expanding IN
+        if telegram_user_ids:
+            tg_user_id = col(Student.tg_user_id)
+            conditions.append(
+                tg_user_id == any_(bindparam("tg_user_ids", telegram_user_ids, type_=ARRAY(tg_user_id.type)))
+            )
+        if github_usernames:
+            gh_username = col(Student.gh_username)
+            conditions.append(
+                gh_username == any_(bindparam("gh_usernames", github_usernames, type_=ARRAY(gh_username.type)))
+            )
+        if not conditions:
+            return []
+        result = await self.session.execute(select(*Student.__table__.columns).where(or_(*conditions)))
+        return [self.from_model_to_dto(student) for student in result.all()]
+
     @staticmethod
     def from_model_to_dto(model: Student) -> StudentDTO:
         return StudentDTO(
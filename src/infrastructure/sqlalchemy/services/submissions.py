@@ -1,45 +1,288 @@
+from collections.abc import AsyncIterator
 from uuid import UUID
 from datetime import datetime
 
-from sqlmodel import select
+from sqlalchemy import String, Uuid, column, literal, tuple_, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import col, delete, desc, func, select, update
+from sqlmodel.sql.expression import Select
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.infrastructure.sqlalchemy.models import Submission
+from src.infrastructure.sqlalchemy.models import Submission, SubmissionReport, SubmissionUpload
 from src.services.exceptions import NotFoundError
-from src.services.submissions import SubmissionService, SubmissionDTO
+from src.services.submissions import (
+    EvaluationDTO,
+    SubmissionCursorDTO,
+    SubmissionDTO,
+    SubmissionFiltersDTO,
+    SubmissionPageDTO,
+    SubmissionReportDTO,
+    SubmissionService,
+    compress_report,
+)
+from src.settings import app_settings
 
 
 class SqlAlchemySubmissionService(SubmissionService):
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def get_all_submissions(self) -> list[SubmissionDTO]:
-        query = select(Submission)
+    async def get_all_submissions(
+        self, filters: SubmissionFiltersDTO, limit: int, cursor: SubmissionCursorDTO | None = None
+    ) -> SubmissionPageDTO:
+        # Core rows instead of ORM instances, from_model_to_dto() reads them by the same attribute names
+        query = self._filter_submissions(select(*Submission.__table__.columns), filters)
+        if cursor:
+            query = query.where(
+                tuple_(Submission.created_at, Submission.submission_id)
+                < tuple_(literal(cursor.created_at), literal(UUID(cursor.submission_id)))
+            )
+        query = query.order_by(desc(Submission.created_at), desc(Submission.submission_id)).limit(limit + 1)
         result = await self.session.execute(query)
-        submissions = result.scalars().all()
-        return [self.from_model_to_dto(submission) for submission in submissions]
+        submissions = result.all()
 
-    async def create_submission(self, task_id: str, student_id: str, github_repo_url: str, github_pull_request_number: int, code_file_name: str) -> SubmissionDTO:
+        next_cursor = None
+        if len(submissions) > limit:
+            submissions = submissions[:limit]
+            last = submissions[-1]
+            next_cursor = SubmissionCursorDTO(created_at=last.created_at, submission_id=str(last.submission_id))
+        return SubmissionPageDTO(
+            items=[self.from_model_to_dto(submission) for submission in submissions],
+            next_cursor=next_cursor,
+        )
+
+    async def iter_submissions(self, filters: SubmissionFiltersDTO, batch_size: int) -> AsyncIterator[SubmissionDTO]:
+        query = self._filter_submissions(select(*Submission.__table__.columns), filters)
+        query = query.order_by(desc(Submission.created_at), desc(Submission.submission_id))
+        # Server-side cursor, only one batch of rows is held in memory
+        result = await self.session.stream(query.execution_options(yield_per=batch_size))
+        async for row in result:
+            yield self.from_model_to_dto(row)
+
+    @staticmethod
+    def _filter_submissions(query: Select, filters: SubmissionFiltersDTO) -> Select:
+        if filters.task_id:
+            query = query.where(Submission.task_id == UUID(filters.task_id))
+        if filters.student_id:
+            query = query.where(Submission.student_id == UUID(filters.student_id))
+        if filters.is_evaluated is not None:
+            evaluated_at = col(Submission.evaluated_at)
+            query = query.where(evaluated_at.is_not(None) if filters.is_evaluated else evaluated_at.is_(None))
+        if filters.created_from:
+            query = query.where(Submission.created_at >= filters.created_from)
+        if filters.created_to:
+            query = query.where(Submission.created_at < filters.created_to)
+        return query
+
+    async def count_pending_submissions(self, created_from: datetime) -> int:
+        query = (
+            select(func.count())
+            .select_from(Submission)
+            .where(col(Submission.evaluated_at).is_(None), Submission.created_at >= created_from)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one()
+
+    async def create_upload(self, task_id: str, student_id: str, expires_at: datetime) -> str:
+        await self.session.execute(delete(SubmissionUpload).where(SubmissionUpload.expires_at < datetime.now()))
+        upload = SubmissionUpload(task_id=UUID(task_id), student_id=UUID(student_id), expires_at=expires_at)
+        self.session.add(upload)
+        upload_id = str(upload.upload_id)
+        await self.session.commit()
+        return upload_id
+
+    async def consume_upload(self, upload_id: str, task_id: str, student_id: str, *, commit: bool = True) -> None:
+        # The deleted row stays locked until commit, a concurrent finalization of the same upload finds nothing
+        query = (
+            delete(SubmissionUpload)
+            .where(
+                SubmissionUpload.upload_id == UUID(upload_id),
+                SubmissionUpload.task_id == UUID(task_id),
+                SubmissionUpload.student_id == UUID(student_id),
+                SubmissionUpload.expires_at >= datetime.now(),
+            )
+            .returning(SubmissionUpload.upload_id)
+        )
+        result = await self.session.execute(query)
+        if result.scalar_one_or_none() is None:
+            raise NotFoundError(message="Загрузка не найдена, истекла или уже использована")
+        if commit:
+            await self.session.commit()
+
+    async def create_submission(
+        self,
+        task_id: str,
+        student_id: str,
+        github_repo_url: str,
+        github_pull_request_number: int,
+        code_file_name: str,
+        content_hash: str | None = None,
+        *,
+        commit: bool = True,
+    ) -> SubmissionDTO:
         submission = Submission(
             task_id=UUID(task_id),
             student_id=UUID(student_id),
             gh_repo_url=github_repo_url,
             gh_pull_request_number=github_pull_request_number,
             code_file_name=code_file_name,
+            content_hash=content_hash,
         )
         self.session.add(submission)
-        await self.session.commit()
-        await self.session.refresh(submission)
+        await self._save(submission, commit)
         return self.from_model_to_dto(submission)
 
-    async def evaluate_submission(self, submission_id: str, llm_grade: str, llm_feedback: str, llm_report: str) -> SubmissionDTO:
+    async def evaluate_submission(
+        self, submission_id: str, llm_grade: str, llm_feedback: str, llm_report: str, *, commit: bool = True
+    ) -> SubmissionDTO:
+        query = (
+            update(Submission)
+            .where(Submission.submission_id == UUID(submission_id))
+            .values(llm_grade=llm_grade, llm_feedback=llm_feedback, evaluated_at=datetime.now())
+            .returning(Submission)
+        )
+        result = await self.session.execute(
+            query, execution_options={"synchronize_session": False, "populate_existing": True}
+        )
+        submission = result.scalar_one_or_none()
+        if not submission:
+            raise NotFoundError(message="Сабмита с таким идентификатором не существует")
+        submission_dto = self.from_model_to_dto(submission)
+        await self._save_reports({submission_dto.submission_id: llm_report})
+        if commit:
+            await self.session.commit()
+        return submission_dto
+
+    async def copy_evaluation(
+        self, submission_id: str, source_submission_id: str, *, commit: bool = True
+    ) -> SubmissionDTO:
         submission = await self._get_submission_by_submission_id(submission_id)
-        submission.llm_grade = llm_grade
-        submission.llm_feedback = llm_feedback
-        submission.llm_report = llm_report
+        source = await self._get_submission_by_submission_id(source_submission_id)
+        submission.llm_grade = source.llm_grade
+        submission.llm_feedback = source.llm_feedback
         submission.evaluated_at = datetime.now()
-        await self.session.commit()
-        await self.session.refresh(submission)
+        source_report = select(
+            literal(submission.submission_id),
+            SubmissionReport.content,
+            SubmissionReport.content_encoding,
+            SubmissionReport.size,
+        ).where(SubmissionReport.submission_id == source.submission_id)
+        query = insert(SubmissionReport).from_select(
+            ["submission_id", "content", "content_encoding", "size"], source_report
+        )
+        await self.session.execute(query.on_conflict_do_nothing(index_elements=["submission_id"]))
+        await self._save(submission, commit)
+        return self.from_model_to_dto(submission)
+
+    async def evaluate_submissions(
+        self, evaluations: list[EvaluationDTO], *, commit: bool = True, only_pending: bool = False
+    ) -> list[SubmissionDTO]:
+        if not evaluations:
+            return []
+        # Postgres applies only one of duplicated join rows, so the last evaluation of a submission wins explicitly
+        unique_evaluations = {str(UUID(evaluation.submission_id)): evaluation for evaluation in evaluations}
+        evaluation_values = values(
+            column("submission_id", Uuid),
+            column("llm_grade", String),
+            column("llm_feedback", String),
+            name="evaluations",
+        ).data(
+            [
+                (UUID(evaluation.submission_id), evaluation.llm_grade, evaluation.llm_feedback)
+                for evaluation in unique_evaluations.values()
+            ]
+        )
+        query = (
+            update(Submission)
+            .where(Submission.submission_id == evaluation_values.c.submission_id)
+            .values(
+                llm_grade=evaluation_values.c.llm_grade,
+                llm_feedback=evaluation_values.c.llm_feedback,
+                evaluated_at=datetime.now(),
+            )
+            .returning(Submission)
+        )
+        if only_pending:
+            query = query.where(col(Submission.evaluated_at).is_(None))
+        result = await self.session.execute(
+            query, execution_options={"synchronize_session": False, "populate_existing": True}
+        )
+        submissions = [self.from_model_to_dto(submission) for submission in result.scalars().all()]
+        # Reports are saved only for updated submissions, unknown IDs would violate the foreign key
+        await self._save_reports(
+            {
+                submission.submission_id: unique_evaluations[submission.submission_id].llm_report
+                for submission in submissions
+            }
+        )
+        if commit:
+            await self.session.commit()
+        return submissions
+
+    async def get_submission_report(self, submission_id: str) -> SubmissionReportDTO:
+        query = select(SubmissionReport).where(SubmissionReport.submission_id == UUID(submission_id))
+        result = await self.session.execute(query)
+        report = result.scalar_one_or_none()
+        if not report:
+            raise NotFoundError(message="Отчета для сабмита с таким идентификатором не существует")
+        return SubmissionReportDTO(
+            submission_id=str(report.submission_id),
+            content=report.content,
+            content_encoding=report.content_encoding,
+            size=report.size,
+        )
+
+    async def _save_reports(self, reports: dict[str, str]) -> None:
+        if not reports:
+            return
+        rows = []
+        for submission_id, report in reports.items():
+            raw_content = report.encode()
+            content, content_encoding = compress_report(raw_content, app_settings.REPORT_COMPRESSION_MIN_SIZE)
+            rows.append(
+                {
+                    "submission_id": UUID(submission_id),
+                    "content": content,
+                    "content_encoding": content_encoding,
+                    "size": len(raw_content),
+                }
+            )
+        query = insert(SubmissionReport).values(rows)
+        query = query.on_conflict_do_update(
+            index_elements=["submission_id"],
+            set_={
+                "content": query.excluded.content,
+                "content_encoding": query.excluded.content_encoding,
+                "size": query.excluded.size,
+            },
+        )
+        await self.session.execute(query)
+
+    async def _save(self, submission: Submission, commit: bool) -> None:
+        if commit:
+            await self.session.commit()
+            await self.session.refresh(submission)
+        else:
+            await self.session.flush()
+
+    async def get_evaluated_submission_by_content_hash(
+        self, task_id: str, student_id: str, content_hash: str
+    ) -> SubmissionDTO:
+        query = (
+            select(Submission)
+            .where(
+                Submission.task_id == UUID(task_id),
+                Submission.student_id == UUID(student_id),
+                Submission.content_hash == content_hash,
+                col(Submission.evaluated_at).is_not(None),
+            )
+            .order_by(desc(Submission.evaluated_at))
+            .limit(1)
+        )
+        result = await self.session.execute(query)
+        submission = result.scalar_one_or_none()
+        if not submission:
+            raise NotFoundError(message="Проверенного сабмита с таким содержимым не существует")
         return self.from_model_to_dto(submission)
 
     async def _get_submission_by_submission_id(self, submission_id: str) -> Submission:
@@ -59,9 +302,9 @@ class SqlAlchemySubmissionService(SubmissionService):
             gh_repo_url=model.gh_repo_url,
             gh_pull_request_number=model.gh_pull_request_number,
             code_file_name=model.code_file_name,
+            content_hash=model.content_hash,
             llm_grade=model.llm_grade,
             llm_feedback=model.llm_feedback,
-            llm_report=model.llm_report,
             created_at=model.created_at,
             evaluated_at=model.evaluated_at,
         )
@@ -1,8 +1,10 @@
 from uuid import UUID
 
-from sqlmodel import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select, update
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.sqlalchemy.errors import unique_violation_as_already_exist
 from src.infrastructure.sqlalchemy.models import Task
 from src.services.exceptions import NotFoundError, AlreadyExistError
 from src.services.tasks import TaskDTO, TaskService
@@ -15,11 +17,6 @@ class SqlAlchemyTaskService(TaskService):
     async def create_task(
         self, name: str, system_instructions: str, ideas: str, github_repo_url: str, level: str, tags: list[str], is_draft: bool
     ) -> TaskDTO:
-        query = select(Task).where(Task.gh_repo_url == github_repo_url)
-        result = await self.session.execute(query)
-        task = result.scalars().first()
-        if task:
-            raise AlreadyExistError(message="Задача с таким github url уже существует")
         task = Task(
             name=name,
             system_instructions=system_instructions,
@@ -29,10 +26,20 @@ class SqlAlchemyTaskService(TaskService):
             tags=",".join(tags),
             is_draft=is_draft,
         )
-        self.session.add(task)
+        query = (
+            insert(Task)
+            .values(task.model_dump())
+            .on_conflict_do_nothing(index_elements=[Task.gh_repo_url])
+            .returning(Task)
+        )
+        result = await self.session.execute(query)
+        task = result.scalar_one_or_none()
+        if task is None:
+            await self.session.rollback()
+            raise AlreadyExistError(message="Задача с таким github url уже существует")
+        task_dto = self.from_model_to_dto(task)
         await self.session.commit()
-        await self.session.refresh(task)
-        return self.from_model_to_dto(task)
+        return task_dto
 
     async def get_task_by_github_repository_url(self, github_repo_url: str) -> TaskDTO:
         query = select(Task).where(Task.gh_repo_url == github_repo_url)
@@ -46,12 +53,13 @@ class SqlAlchemyTaskService(TaskService):
         task = await self._get_task_by_task_id(task_id)
         return self.from_model_to_dto(task)
 
-    async def get_all_tasks(self, public_only: bool = False) -> list[TaskDTO]:
-        query = select(Task)
+    async def get_all_tasks(self, *, public_only: bool = False) -> list[TaskDTO]:
+        # Core rows instead of ORM instances, from_model_to_dto() reads them by the same attribute names
+        query = select(*Task.__table__.columns)
         if public_only:
             query = query.where(Task.is_draft == False)
         result = await self.session.execute(query)
-        tasks = result.scalars().all()
+        tasks = result.all()
         return [self.from_model_to_dto(task) for task in tasks]
 
     async def edit_task_by_task_id(
@@ -65,22 +73,30 @@ class SqlAlchemyTaskService(TaskService):
         tags: list[str],
         is_draft: bool,
     ) -> TaskDTO:
-        query = select(Task).where(Task.gh_repo_url == github_repo_url, Task.task_id != UUID(task_id))
-        result = await self.session.execute(query)
-        task = result.scalars().first()
-        if task:
-            raise AlreadyExistError(message="Задача с таким github url уже существует")
-        task = await self._get_task_by_task_id(task_id)
-        task.name = name
-        task.system_instructions = system_instructions
-        task.ideas = ideas
-        task.gh_repo_url = github_repo_url
-        task.level = level
-        task.tags = ",".join(tags)
-        task.is_draft = is_draft
+        query = (
+            update(Task)
+            .where(Task.task_id == UUID(task_id))
+            .values(
+                name=name,
+                system_instructions=system_instructions,
+                ideas=ideas,
+                gh_repo_url=github_repo_url,
+                level=level,
+                tags=",".join(tags),
+                is_draft=is_draft,
+            )
+            .returning(Task)
+        )
+        async with unique_violation_as_already_exist(self.session, "Задача с таким github url уже существует"):
+            result = await self.session.execute(
+                query, execution_options={"synchronize_session": False, "populate_existing": True}
+            )
+        task = result.scalar_one_or_none()
+        if task is None:
+            raise NotFoundError(message="Задачи с таким идентификатором не существует")
+        task_dto = self.from_model_to_dto(task)
         await self.session.commit()
-        await self.session.refresh(task)
-        return self.from_model_to_dto(task)
+        return task_dto
 
     async def remove_task_by_task_id(self, task_id: str) -> None:
         task = await self._get_task_by_task_id(task_id)
@@ -1,11 +1,12 @@
 from src.services.auth.constants import SESSION_TTL, Role
-from src.services.auth.dto import TokenDTO, UserDTO
+from src.services.auth.dto import SessionDTO, TokenDTO, UserDTO
 from src.services.auth.interface import AuthService
 
 __all__ = [
     "SESSION_TTL",
     "AuthService",
     "Role",
+    "SessionDTO",
     "TokenDTO",
     "UserDTO",
 ]
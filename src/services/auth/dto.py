@@ -13,3 +13,9 @@ class UserDTO:
     login: str
     role: str
     created_at: datetime
+
+
+@dataclass
+class SessionDTO:
+    user: UserDTO
+    expired_at: datetime
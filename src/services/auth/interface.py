@@ -15,3 +15,11 @@ class AuthService(ABC):
     @abstractmethod
     async def get_user(self, session_id: str) -> UserDTO:
         raise NotImplementedError
+
+    @abstractmethod
+    async def logout(self, session_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_existing_session_ids(self, session_ids: list[str]) -> set[str]:
+        raise NotImplementedError
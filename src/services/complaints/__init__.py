@@ -1,4 +1,4 @@
-from src.services.complaints.dto import ComplaintDTO
+from src.services.complaints.dto import ComplaintAnswerDTO, ComplaintDTO
 from src.services.complaints.interface import ComplaintService
 
-__all__ = ["ComplaintDTO", "ComplaintService"]
+__all__ = ["ComplaintAnswerDTO", "ComplaintDTO", "ComplaintService"]
@@ -10,3 +10,9 @@ class ComplaintDTO:
     student_request: str
     teacher_response: str
     created_at: datetime
+
+
+@dataclass
+class ComplaintAnswerDTO:
+    complaint: ComplaintDTO
+    student_telegram_user_id: int
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 
-from src.services.complaints.dto import ComplaintDTO
+from src.services.complaints.dto import ComplaintAnswerDTO, ComplaintDTO
 
 
 class ComplaintService(ABC):
@@ -9,7 +9,10 @@ class ComplaintService(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def answer_complaint(self, complaint_id: str, teacher_text: str) -> None:
+    async def answer_complaint(
+        self, complaint_id: str, teacher_text: str, *, commit: bool = True
+    ) -> ComplaintAnswerDTO:
+        """Result carries Telegram user ID of the student, so that the answer can be sent without extra queries."""
         raise NotImplementedError
 
     @abstractmethod
@@ -0,0 +1,4 @@
+from src.services.forks.dto import ForkDTO
+from src.services.forks.interface import ForkService
+
+__all__ = ["ForkDTO", "ForkService"]
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class ForkDTO:
+    github_full_name: str
+    github_repo_url: str
+    task_id: str
+    student_id: str
+    created_at: datetime
+    validated_at: datetime
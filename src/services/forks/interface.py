@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.services.forks.dto import ForkDTO
+
+
+class ForkService(ABC):
+    @abstractmethod
+    async def get_fork(self, github_full_name: str) -> ForkDTO:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_forks(self) -> list[ForkDTO]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def register_fork(
+        self, github_full_name: str, github_repo_url: str, task_id: str, student_id: str
+    ) -> ForkDTO:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_stale_forks(self, validated_before: datetime, limit: int) -> list[ForkDTO]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mark_validated(self, github_full_name: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_fork(self, github_full_name: str) -> None:
+        raise NotImplementedError
@@ -0,0 +1,4 @@
+from src.services.outbox.dto import OutboxBatchDTO
+from src.services.outbox.interface import OutboxPublisher, OutboxService
+
+__all__ = ["OutboxBatchDTO", "OutboxPublisher", "OutboxService"]
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class OutboxBatchDTO:
+    size: int
+    oldest_created_at: datetime | None
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.services.outbox.dto import OutboxBatchDTO
+
+OutboxPublisher = Callable[[str, list[dict[str, Any]]], Awaitable[None]]
+
+
+class OutboxService(ABC):
+    @abstractmethod
+    async def add_event(self, topic: str, payload: dict[str, Any]) -> None:
+        """Stage event in the current transaction, it is stored on commit()."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def commit(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def publish_pending(self, publish: OutboxPublisher, batch_size: int) -> OutboxBatchDTO:
+        """Publish and remove up to batch_size oldest events not locked by another relay."""
+        raise NotImplementedError
@@ -1,3 +1,4 @@
+from src.services.password.executor import HashingExecutor, HashingExecutorStats
 from src.services.password.implementation import PasswordService
 
-__all__ = ["PasswordService"]
+__all__ = ["HashingExecutor", "HashingExecutorStats", "PasswordService"]
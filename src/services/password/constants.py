@@ -1,2 +1,5 @@
 ITERATIONS = 100000
 HASH_NAME = "sha256"
+
+HASHING_MAX_WORKERS = 4
+HASHING_MAX_CONCURRENCY = 8
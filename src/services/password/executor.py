@@ -0,0 +1,72 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar, TypeVarTuple
+
+T = TypeVar("T")
+Ts = TypeVarTuple("Ts")
+
+
+@dataclass
+class HashingExecutorStats:
+    max_workers: int
+    max_concurrency: int
+    in_flight: int
+    queued: int
+    completed: int
+
+
+class HashingExecutor:
+    """Runs CPU-bound hashing outside the event loop.
+
+    At most `max_concurrency` jobs are handed to the pool at once, the rest wait
+    on a semaphore so that the pool queue itself stays short.
+    """
+
+    def __init__(self, max_workers: int, max_concurrency: int, *, use_processes: bool = False) -> None:
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self.use_processes = use_processes
+        self._executor: Executor | None = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._in_flight = 0
+        self._queued = 0
+        self._completed = 0
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+        if self.use_processes:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hashing")
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def run(self, func: Callable[[*Ts], T], *args: *Ts) -> T:
+        self.start()
+        self._queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+        self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+            self._semaphore.release()
+
+    def stats(self) -> HashingExecutorStats:
+        return HashingExecutorStats(
+            max_workers=self.max_workers,
+            max_concurrency=self.max_concurrency,
+            in_flight=self._in_flight,
+            queued=self._queued,
+            completed=self._completed,
+        )
@@ -1,10 +1,19 @@
 import hashlib
 import os
+from typing import ClassVar
 
-from src.services.password.constants import HASH_NAME, ITERATIONS
+from src.services.password.constants import HASH_NAME, HASHING_MAX_CONCURRENCY, HASHING_MAX_WORKERS, ITERATIONS
+from src.services.password.executor import HashingExecutor
 
 
 class PasswordService:
+    executor: ClassVar[HashingExecutor] = HashingExecutor(HASHING_MAX_WORKERS, HASHING_MAX_CONCURRENCY)
+
+    @classmethod
+    def configure(cls, executor: HashingExecutor) -> None:
+        cls.executor.shutdown()
+        cls.executor = executor
+
     @staticmethod
     def create_hashed_password_and_salt(password: str) -> tuple[str, str]:
         salt = os.urandom(32)
@@ -19,3 +28,11 @@ class PasswordService:
         try_key = hashlib.pbkdf2_hmac(HASH_NAME, try_password_bytes, salt_bytes, ITERATIONS)
         real_key = bytes.fromhex(hashed_password)
         return try_key == real_key
+
+    @classmethod
+    async def async_create_hashed_password_and_salt(cls, password: str) -> tuple[str, str]:
+        return await cls.executor.run(cls.create_hashed_password_and_salt, password)
+
+    @classmethod
+    async def async_verify_password(cls, try_password: str, hashed_password: str, salt: str) -> bool:
+        return await cls.executor.run(cls.verify_password, try_password, hashed_password, salt)
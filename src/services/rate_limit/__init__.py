@@ -0,0 +1,4 @@
+from src.services.rate_limit.dto import RateLimitDTO, RateLimitStatsDTO
+from src.services.rate_limit.interface import RateLimitService
+
+__all__ = ["RateLimitDTO", "RateLimitService", "RateLimitStatsDTO"]
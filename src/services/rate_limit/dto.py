@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class RateLimitDTO:
+    allowed: bool
+    retry_after: float  # seconds until the request would be allowed, 0 when allowed
+
+
+@dataclass
+class RateLimitStatsDTO:
+    keys: int
+    allowed: int
+    rejected: int
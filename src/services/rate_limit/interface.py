@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+from src.services.rate_limit.dto import RateLimitDTO, RateLimitStatsDTO
+
+
+class RateLimitService(ABC):
+    @abstractmethod
+    async def acquire(self, key: str) -> RateLimitDTO:
+        """Take one request from the limit of the key, a rejected request takes nothing."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> RateLimitStatsDTO:
+        raise NotImplementedError
@@ -1,4 +1,4 @@
-from src.services.stundents.dto import StudentDTO
+from src.services.stundents.dto import NewStudentDTO, StudentCursorDTO, StudentDTO, StudentPageDTO
 from src.services.stundents.interface import StudentService
 
-__all__ = ["StudentDTO", "StudentService"]
+__all__ = ["NewStudentDTO", "StudentCursorDTO", "StudentDTO", "StudentPageDTO", "StudentService"]
@@ -9,3 +9,23 @@ class StudentDTO:
     telegram_username: str
     github_username: str | None
     registered_at: datetime
+
+
+@dataclass
+class NewStudentDTO:
+    telegram_user_id: int
+    telegram_username: str
+    github_username: str | None = None
+
+
+@dataclass
+class StudentCursorDTO:
+    student_id: str
+    registered_at: datetime | None = None  # set when students are listed without search
+    score: float | None = None  # set when students are ranked by similarity to the search query
+
+
+@dataclass
+class StudentPageDTO:
+    items: list[StudentDTO]
+    next_cursor: StudentCursorDTO | None
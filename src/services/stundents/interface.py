@@ -1,17 +1,32 @@
 from abc import ABC, abstractmethod
 
-from src.services.stundents.dto import StudentDTO
+from src.services.stundents.dto import NewStudentDTO, StudentCursorDTO, StudentDTO, StudentPageDTO
 
 
 class StudentService(ABC):
     @abstractmethod
-    async def get_all(self, username: str = "") -> list[StudentDTO]:
+    async def get_all(
+        self, username: str = "", limit: int = 100, cursor: StudentCursorDTO | None = None, *, prefix: bool = False
+    ) -> StudentPageDTO:
+        """Without username students are listed newest first, otherwise they are ranked by similarity to it.
+
+        By default Telegram and GitHub usernames containing username are found, with prefix=True only those
+        starting with it, which is faster for autocomplete.
+        """
         raise NotImplementedError
 
     @abstractmethod
     async def create(self, telegram_user_id: int, telegram_username: str) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_many(self, students: list[NewStudentDTO]) -> set[int]:
+        """Register students in one statement, returns Telegram user IDs of created ones.
+
+        Students conflicting with registered ones or with each other by Telegram or GitHub profile are skipped.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def set_github_username(self, telegram_user_id: int,github_username: str) -> None:
         raise NotImplementedError
@@ -26,4 +41,11 @@ class StudentService(ABC):
 
     @abstractmethod
     async def get_by_id(self, student_id: str) -> StudentDTO:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_many(
+        self, telegram_user_ids: list[int] | None = None, github_usernames: list[str] | None = None
+    ) -> list[StudentDTO]:
+        """Get students with any of the Telegram user IDs or GitHub usernames, unknown ones are skipped."""
+        raise NotImplementedError
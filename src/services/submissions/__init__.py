@@ -1,4 +1,23 @@
-from src.services.submissions.dto import SubmissionDTO
+from src.services.submissions.dto import (
+    EvaluationDTO,
+    SubmissionCursorDTO,
+    SubmissionDTO,
+    SubmissionFiltersDTO,
+    SubmissionPageDTO,
+    SubmissionReportDTO,
+)
 from src.services.submissions.interface import SubmissionService
+from src.services.submissions.report import GZIP_ENCODING, compress_report, iter_report_chunks
 
-__all__ = ["SubmissionDTO", "SubmissionService"]
+__all__ = [
+    "GZIP_ENCODING",
+    "EvaluationDTO",
+    "SubmissionCursorDTO",
+    "SubmissionDTO",
+    "SubmissionFiltersDTO",
+    "SubmissionPageDTO",
+    "SubmissionReportDTO",
+    "SubmissionService",
+    "compress_report",
+    "iter_report_chunks",
+]
@@ -10,9 +10,46 @@ class SubmissionDTO:
     gh_repo_url: str
     gh_pull_request_number: int
     code_file_name: str
+    content_hash: str | None
 
     llm_grade: str
     llm_feedback: str
-    llm_report: str
     created_at: datetime
     evaluated_at: datetime
+
+
+@dataclass
+class SubmissionReportDTO:
+    submission_id: str
+    content: bytes
+    content_encoding: str
+    size: int
+
+
+@dataclass
+class EvaluationDTO:
+    submission_id: str
+    llm_grade: str
+    llm_feedback: str
+    llm_report: str
+
+
+@dataclass
+class SubmissionCursorDTO:
+    created_at: datetime
+    submission_id: str
+
+
+@dataclass
+class SubmissionFiltersDTO:
+    task_id: str | None = None
+    student_id: str | None = None
+    is_evaluated: bool | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+
+@dataclass
+class SubmissionPageDTO:
+    items: list[SubmissionDTO]
+    next_cursor: SubmissionCursorDTO | None
@@ -1,17 +1,90 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 
-from src.services.submissions.dto import SubmissionDTO
+from src.services.submissions.dto import (
+    EvaluationDTO,
+    SubmissionCursorDTO,
+    SubmissionDTO,
+    SubmissionFiltersDTO,
+    SubmissionPageDTO,
+    SubmissionReportDTO,
+)
 
 
 class SubmissionService(ABC):
     @abstractmethod
-    async def create_submission(self, task_id: str, student_id: str, github_repo_url: str, github_pull_request_number: int, code_file_name: str) -> SubmissionDTO:
+    async def create_submission(
+        self,
+        task_id: str,
+        student_id: str,
+        github_repo_url: str,
+        github_pull_request_number: int,
+        code_file_name: str,
+        content_hash: str | None = None,
+        *,
+        commit: bool = True,
+    ) -> SubmissionDTO:
+        """With commit=False the changes are only flushed, so that events can be staged in the same transaction."""
         raise NotImplementedError
 
     @abstractmethod
-    async def get_all_submissions(self) -> list[SubmissionDTO]:
+    async def get_all_submissions(
+        self, filters: SubmissionFiltersDTO, limit: int, cursor: SubmissionCursorDTO | None = None
+    ) -> SubmissionPageDTO:
         raise NotImplementedError
 
     @abstractmethod
-    async def evaluate_submission(self, submission_id: str, llm_grade: str, llm_feedback: str, llm_report: str) -> SubmissionDTO:
+    def iter_submissions(self, filters: SubmissionFiltersDTO, batch_size: int) -> AsyncIterator[SubmissionDTO]:
+        """Iterate over all matching submissions, newest first, fetching batch_size of them at once."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_pending_submissions(self, created_from: datetime) -> int:
+        """Count unevaluated submissions created since created_from, older ones are not waited for anymore."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create_upload(self, task_id: str, student_id: str, expires_at: datetime) -> str:
+        """Register a direct upload of the student for the task, expired uploads are dropped on the way."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def consume_upload(self, upload_id: str, task_id: str, student_id: str, *, commit: bool = True) -> None:
+        """Delete the upload if it is not expired and belongs to the student and the task, so it is used only once."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def evaluate_submission(
+        self, submission_id: str, llm_grade: str, llm_feedback: str, llm_report: str, *, commit: bool = True
+    ) -> SubmissionDTO:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def copy_evaluation(
+        self, submission_id: str, source_submission_id: str, *, commit: bool = True
+    ) -> SubmissionDTO:
+        """Evaluate submission with the verdict and the report of another one, the report is not decoded."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def evaluate_submissions(
+        self, evaluations: list[EvaluationDTO], *, commit: bool = True, only_pending: bool = False
+    ) -> list[SubmissionDTO]:
+        """Apply evaluations in one statement, unknown submission IDs are skipped and missing from the result.
+
+        With only_pending=True already evaluated submissions are skipped too, which makes redelivery a no-op.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_evaluated_submission_by_content_hash(
+        self, task_id: str, student_id: str, content_hash: str
+    ) -> SubmissionDTO:
+        """Get the latest evaluated submission of the student for the task with identical artifacts."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_submission_report(self, submission_id: str) -> SubmissionReportDTO:
+        """Reports are stored apart from submissions and encoded, see compress_report."""
         raise NotImplementedError
@@ -0,0 +1,49 @@
+import gzip
+import zlib
+from collections.abc import Iterator
+
+from src.services.submissions.dto import SubmissionReportDTO
+
+GZIP_ENCODING = "gzip"
+IDENTITY_ENCODING = "identity"
+
+
+def compress_report(content: bytes, min_size: int) -> tuple[bytes, str]:
+    """Encode UTF-8 report for storage, returns the stored content and its encoding."""
+    if len(content) < min_size:
+        return content, IDENTITY_ENCODING
+    return gzip.compress(content), GZIP_ENCODING
+
+
+def iter_report_chunks(report: SubmissionReportDTO, chunk_size: int) -> Iterator[bytes]:
+    """Yield the decoded report by chunks, so that the whole report is never decompressed at once.
+
+    Every chunk is at most chunk_size bytes and decoding stops with ValueError once it outgrows the stored size.
+    """
+    if report.content_encoding != GZIP_ENCODING:
+        for offset in range(0, len(report.content), chunk_size):
+            yield report.content[offset : offset + chunk_size]
+        return
+
+    decoded_size = 0
+    for chunk in _iter_gunzipped(report.content, chunk_size):
+        decoded_size += len(chunk)
+        if decoded_size > report.size:
+            error_message = f"Report {report.submission_id} decodes to more than {report.size} bytes"
+            raise ValueError(error_message)
+        yield chunk
+
+
+def _iter_gunzipped(content: bytes, chunk_size: int) -> Iterator[bytes]:
+    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    for offset in range(0, len(content), chunk_size):
+        data = content[offset : offset + chunk_size]
+        while data:
+            # Output is capped, input that is not decoded yet stays in unconsumed_tail
+            chunk = decompressor.decompress(data, chunk_size)
+            data = decompressor.unconsumed_tail
+            if chunk:
+                yield chunk
+    tail = decompressor.flush()
+    if tail:
+        yield tail
@@ -23,6 +23,8 @@ class AppSettings(BaseSettings):
     POSTGRES_PASSWORD: str = Field(default="postgres")
     POSTGRES_PORT: int = Field(default=5432)
     POSTGRES_HOST: str = Field(default="localhost")
+    POSTGRES_REPLICA_HOST: str = Field(default="")  # streaming replica for list queries, empty disables it
+    POSTGRES_REPLICA_PORT: int = Field(default=5432)
 
     @staticmethod
     def __generate_asyncpg_db_url(
@@ -45,18 +47,105 @@ class AppSettings(BaseSettings):
             self.POSTGRES_DB,
         )
 
+    @property
+    def replica_db_url(self) -> str | None:
+        """Get DSN for read replica of database, if it is configured."""
+        if not self.POSTGRES_REPLICA_HOST:
+            return None
+        return self.__generate_asyncpg_db_url(
+            self.POSTGRES_USER,
+            self.POSTGRES_PASSWORD,
+            self.POSTGRES_REPLICA_HOST,
+            self.POSTGRES_REPLICA_PORT,
+            self.POSTGRES_DB,
+        )
+
+    DB_POOL_SIZE: int = Field(default=10)  # connections kept open by each worker
+    DB_MAX_OVERFLOW: int = Field(default=10)  # extra connections opened under load and closed when returned
+    DB_POOL_TIMEOUT: float = Field(default=30)  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = Field(default=30 * 60)  # seconds, -1 keeps connections forever
+    DB_POOL_PRE_PING: bool = Field(default=True)
+    # Not applied with DB_STATEMENT_CACHE_SIZE=0, set it for the role instead:
+    # ALTER ROLE <user> SET statement_timeout = '30s'
+    DB_STATEMENT_TIMEOUT: int = Field(default=30 * 1000)  # milliseconds, 0 disables it
+    # 0 disables prepared statement caches of asyncpg, required behind PgBouncer in transaction mode
+    DB_STATEMENT_CACHE_SIZE: int = Field(default=100)
+    DB_REPLICA_MAX_LAG: float = Field(default=5)  # seconds, reads go to primary while replica lags more
+    DB_REPLICA_LAG_CHECK_INTERVAL: float = Field(default=5)  # seconds
+    DB_REPLICA_LAG_CHECK_TIMEOUT: float = Field(default=2)  # seconds, connection included
+
+    @property
+    def replica_status_max_age(self) -> float:
+        """Get age in seconds after which replication lag is unknown, e.g. when its check hangs."""
+        return 2 * self.DB_REPLICA_LAG_CHECK_INTERVAL
+
     MINIO_BUCKET: str = Field(default="submissions")
     MINIO_ACCESS_KEY: str = Field(default="access_key")
     MINIO_SECRET_KEY: str = Field(default="secret")
     MINIO_HOST: str = Field(default="localhost")
     MINIO_PORT: int = Field(default=9000)
+    # Peak memory of an upload is about MINIO_PART_SIZE * MINIO_PARALLEL_UPLOADS
+    MINIO_PART_SIZE: int = Field(default=5 * 1024 * 1024)  # bytes, S3 minimum for multipart
+    MINIO_PARALLEL_UPLOADS: int = Field(default=2)
+    UPLOAD_CHUNK_SIZE: int = Field(default=64 * 1024)  # bytes
+    MINIO_PUBLIC_URL: str = Field(default="")  # scheme://host:port reachable from CI, used in presigned URLs
+    MINIO_PRESIGNED_EXPIRES: int = Field(default=15 * 60)  # seconds
+    SUBMISSION_UPLOAD_MAX_SIZE: int = Field(default=50 * 1024 * 1024)  # bytes per artifact of a direct upload
+    REPORT_COMPRESSION_MIN_SIZE: int = Field(default=1024)  # bytes, smaller reports are stored as is
+    REPORT_CHUNK_SIZE: int = Field(default=64 * 1024)  # bytes
 
     @property
     def s3_endpoint(self) -> str:
         """Get S3 endpoint."""
         return f"{self.MINIO_HOST}:{self.MINIO_PORT}"
 
+    GITHUB_API_URL: str = Field(default="https://api.github.com")
+    GITHUB_TOKEN: str = Field(default="")
+    GITHUB_TIMEOUT: float = Field(default=10)  # seconds
+    GITHUB_POOL_SIZE: int = Field(default=20)
+    GITHUB_CACHE_SIZE: int = Field(default=4096)
+    GITHUB_CACHE_TTL: float = Field(default=300)  # seconds before revalidation with If-None-Match
+    GITHUB_CACHE_MAX_AGE: float = Field(default=24 * 60 * 60)  # seconds
+
+    FORK_REVALIDATION_INTERVAL: float = Field(default=60 * 60)  # seconds
+    FORK_REVALIDATION_MAX_AGE: float = Field(default=24 * 60 * 60)  # seconds
+    FORK_REVALIDATION_BATCH_SIZE: int = Field(default=100)
+
+    SESSION_CACHE_SIZE: int = Field(default=1024)
+    # Logout in one worker evicts the session from caches of others within SESSION_REVALIDATION_INTERVAL
+    SESSION_CACHE_TTL: float = Field(default=60)  # seconds
+    SESSION_REVALIDATION_INTERVAL: float = Field(default=2)  # seconds
+    STUDENT_IMPORT_CHUNK_SIZE: int = Field(default=1000)  # rows per INSERT, Postgres allows 32767 parameters
+    TASK_CACHE_SIZE: int = Field(default=1024)
+    TASK_CACHE_TTL: float = Field(default=30)  # seconds, other workers see task changes after it
+    EXPORT_BATCH_SIZE: int = Field(default=1000)  # rows fetched from a server-side cursor at once
+    JSON_STREAM_CHUNK_SIZE: int = Field(default=64 * 1024)  # bytes
+    RESPONSE_COMPRESSION_MIN_SIZE: int = Field(default=1024)  # bytes, smaller responses are sent as is
+    RESPONSE_GZIP_LEVEL: int = Field(default=5)
+    RESPONSE_BROTLI_QUALITY: int = Field(default=4)  # used only when the brotli package is installed
+
+    PASSWORD_HASHING_WORKERS: int = Field(default=4)
+    PASSWORD_HASHING_MAX_CONCURRENCY: int = Field(default=8)
+    PASSWORD_HASHING_USE_PROCESSES: bool = Field(default=False)
+
     KAFKA_BOOTSTRAP_SERVERS: str = Field(default="localhost:29092")
+    KAFKA_GROUP_ID: str = Field(default="grading-platform")
+    EVALUATION_RESULT_BATCH_SIZE: int = Field(default=100)
+    OUTBOX_RELAY_INTERVAL: float = Field(default=0.5)  # seconds
+    OUTBOX_BATCH_SIZE: int = Field(default=100)
+
+    # Admission of POST /api/submissions, buckets are keyed by GitHub repository of the fork
+    SUBMISSION_RATE_LIMIT_CAPACITY: int = Field(default=5)  # burst of submissions per repository
+    SUBMISSION_RATE_LIMIT_PERIOD: float = Field(default=60)  # seconds to regain one submission
+    SUBMISSION_RATE_LIMIT_MAX_KEYS: int = Field(default=10000)
+    SUBMISSION_BACKPRESSURE_THRESHOLD: int = Field(default=1000)  # unevaluated submissions, 0 disables the check
+    # Only submissions of the window are counted, older unevaluated ones are lost rather than queued
+    SUBMISSION_BACKPRESSURE_WINDOW: int = Field(default=60 * 60)  # seconds
+    SUBMISSION_BACKPRESSURE_CACHE_TTL: float = Field(default=5)  # seconds
+    SUBMISSION_BACKPRESSURE_RETRY_AFTER: int = Field(default=30)  # seconds
+
+    SSE_QUEUE_SIZE: int = Field(default=100)  # events buffered per client before it is disconnected
+    SSE_PING_INTERVAL: float = Field(default=15)  # seconds
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -0,0 +1,120 @@
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from faststream.kafka import TestKafkaBroker
+
+from src.api.outbox.dependencies import get_outbox_service
+from src.api.submissions.dependencies import get_submission_service
+from src.api.submissions.events import (
+    EVALUATION_RESULT_DEAD_LETTER_TOPIC,
+    EVALUATION_RESULT_TOPIC,
+    NEW_COMMENT_TOPIC,
+    SUBMISSION_STATUS_TOPIC,
+)
+from src.api.submissions.subscribers import consume_evaluation_results
+from src.infrastructure.faststream.kafka_router import kafka_router
+from src.services.submissions import EvaluationDTO, SubmissionDTO
+
+
+class FakeSubmissionService:
+    def __init__(self) -> None:
+        self.evaluations: list[EvaluationDTO] = []
+
+    async def evaluate_submissions(
+        self, evaluations: list[EvaluationDTO], *, commit: bool = True, only_pending: bool = False
+    ) -> list[SubmissionDTO]:
+        assert not commit
+        assert only_pending
+        self.evaluations.extend(evaluations)
+        return [
+            SubmissionDTO(
+                submission_id=evaluation.submission_id,
+                task_id=str(uuid4()),
+                student_id=str(uuid4()),
+                gh_repo_url="https://github.com/octocat/task-1",
+                gh_pull_request_number=1,
+                code_file_name="code.zip",
+                content_hash=None,
+                llm_grade=evaluation.llm_grade,
+                llm_feedback=evaluation.llm_feedback,
+                created_at=datetime.now(),
+                evaluated_at=datetime.now(),
+            )
+            for evaluation in evaluations
+        ]
+
+
+class FakeOutboxService:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict[str, Any]]] = []
+        self.commits = 0
+
+    async def add_event(self, topic: str, payload: dict[str, Any]) -> None:
+        self.events.append((topic, payload))
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+@pytest.fixture
+def dependency_overrides(monkeypatch: pytest.MonkeyPatch) -> dict[Any, Any]:
+    provider = SimpleNamespace(dependency_overrides={})
+    monkeypatch.setattr(kafka_router, "dependency_overrides_provider", provider)
+    return provider.dependency_overrides
+
+
+@pytest.fixture
+def submission_service(dependency_overrides: dict[Any, Any]) -> FakeSubmissionService:
+    service = FakeSubmissionService()
+    dependency_overrides[get_submission_service] = lambda: service
+    return service
+
+
+@pytest.fixture
+def outbox_service(dependency_overrides: dict[Any, Any]) -> FakeOutboxService:
+    service = FakeOutboxService()
+    dependency_overrides[get_outbox_service] = lambda: service
+    return service
+
+
+@pytest.mark.anyio
+async def test_malformed_results_are_dead_lettered_without_failing_batch(
+    submission_service: FakeSubmissionService, outbox_service: FakeOutboxService
+) -> None:
+    submission_id = str(uuid4())
+    valid_result = {"submission_id": submission_id, "llm_grade": "5", "llm_feedback": "Хорошо", "llm_report": {}}
+
+    async with TestKafkaBroker(kafka_router.broker) as broker:
+        await broker.publish_batch(
+            valid_result,
+            {"submission_id": submission_id},
+            {**valid_result, "submission_id": "not-a-uuid"},
+            b"<html>not json</html>",
+            topic=EVALUATION_RESULT_TOPIC,
+        )
+        consume_evaluation_results.mock.assert_called_once()
+
+    assert [evaluation.submission_id for evaluation in submission_service.evaluations] == [submission_id]
+    topics = [topic for topic, _ in outbox_service.events]
+    assert topics.count(EVALUATION_RESULT_DEAD_LETTER_TOPIC) == 3
+    assert topics.count(NEW_COMMENT_TOPIC) == 1
+    assert topics.count(SUBMISSION_STATUS_TOPIC) == 1
+    dead_letters = [payload for topic, payload in outbox_service.events if topic == EVALUATION_RESULT_DEAD_LETTER_TOPIC]
+    assert all(payload["topic"] == EVALUATION_RESULT_TOPIC for payload in dead_letters)
+    assert "<html>not json</html>" in [payload["payload"] for payload in dead_letters]
+    assert outbox_service.commits == 1
+
+
+@pytest.mark.anyio
+async def test_batch_of_only_malformed_results_is_committed(
+    submission_service: FakeSubmissionService, outbox_service: FakeOutboxService
+) -> None:
+    async with TestKafkaBroker(kafka_router.broker) as broker:
+        await broker.publish_batch(b"not json", topic=EVALUATION_RESULT_TOPIC)
+
+    assert submission_service.evaluations == []
+    assert [topic for topic, _ in outbox_service.events] == [EVALUATION_RESULT_DEAD_LETTER_TOPIC]
+    assert outbox_service.commits == 1
@@ -0,0 +1,76 @@
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import func, select
+
+from src.infrastructure.sqlalchemy.models import SQLModel, Student
+from src.infrastructure.sqlalchemy.services import SqlAlchemyStudentService
+from src.services.exceptions import AlreadyExistError
+
+# Postgres is required, unique violations and ON CONFLICT are what is tested
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = [
+    pytest.mark.anyio,
+    pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL of a Postgres database is not set"),
+]
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    # Every test gets its own schema, so that the database may be shared with other runs
+    schema = f"test_{uuid4().hex}"
+    admin_engine = create_async_engine(TEST_DATABASE_URL)
+    async with admin_engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public"))
+        await conn.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_async_engine(
+        TEST_DATABASE_URL, connect_args={"server_settings": {"search_path": f"{schema},public"}}
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+        async with admin_engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await admin_engine.dispose()
+
+
+async def run_concurrently(engine: AsyncEngine, method: str, calls: list[tuple[object, ...]]) -> list[object]:
+    """Call the method of the student service with all arguments at once, every call in its own session."""
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def call(args: tuple[object, ...]) -> object:
+        async with session_factory() as session:
+            return await getattr(SqlAlchemyStudentService(session), method)(*args)
+
+    return await asyncio.gather(*(call(args) for args in calls), return_exceptions=True)
+
+
+async def count_students(engine: AsyncEngine, *conditions: object) -> int:
+    async with async_sessionmaker(engine)() as session:
+        return (await session.execute(select(func.count()).select_from(Student).where(*conditions))).scalar_one()
+
+
+async def test_concurrent_registrations_create_one_student(engine: AsyncEngine) -> None:
+    results = await run_concurrently(engine, "create", [(1, "student"), (1, "student")])
+
+    assert sorted(type(result).__name__ for result in results) == ["AlreadyExistError", "NoneType"]
+    assert await count_students(engine, Student.tg_user_id == 1) == 1
+
+
+async def test_concurrent_github_links_link_one_student(engine: AsyncEngine) -> None:
+    await run_concurrently(engine, "create", [(1, "first"), (2, "second")])
+
+    results = await run_concurrently(engine, "set_github_username", [(1, "octocat"), (2, "octocat")])
+
+    assert sum(isinstance(result, AlreadyExistError) for result in results) == 1
+    assert results.count(None) == 1
+    assert await count_students(engine, Student.gh_username == "octocat") == 1